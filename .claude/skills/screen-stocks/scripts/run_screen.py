@@ -354,6 +354,20 @@ def run_query_mode(args):
         _run_single_region(spec, region_code, args)
 
 
+def _screen_legacy_market(client, market, args):
+    """Prefetch and screen one legacy market. Returns the result list."""
+    # Prefetch the whole universe in parallel chunks before scoring
+    symbols = market.get_default_symbols()
+    prefetched = client.batch_quote(symbols)
+
+    screener = ValueScreener(client, market)
+    results = screener.screen(
+        symbols=symbols, preset=args.preset, top_n=args.top,
+        prefetched=prefetched,
+    )
+    return results
+
+
 def run_legacy_mode(args):
     """Run screening using the original ValueScreener."""
     print(
@@ -384,12 +398,13 @@ def run_legacy_mode(args):
         markets_to_run = [(market_key, MARKETS[market_key])]
 
     client = yahoo_client
+    markets = [(name, market_cls()) for name, market_cls in markets_to_run]
 
-    for market_name, market_cls in markets_to_run:
-        market = market_cls()
-
-        screener = ValueScreener(client, market)
-        results = screener.screen(preset=args.preset, top_n=args.top)
+    # Markets run one after another: every Yahoo request already shares the
+    # process-wide 1 req/s throttle, so running them side by side would only
+    # queue on it.
+    for market_name, market in markets:
+        results = _screen_legacy_market(client, market, args)
         results, excluded = _annotate(results)
         print(f"\n## {market.name} - {args.preset} スクリーニング結果\n")
         if excluded:
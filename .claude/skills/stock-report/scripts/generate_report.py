@@ -1,36 +1,27 @@
 #!/usr/bin/env python3
 """Entry point for the stock-report skill."""
 
+import bisect
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
 
 from scripts.common import try_import, HAS_HISTORY_STORE, HAS_GRAPH_QUERY as _HAS_GQ, HAS_GRAPH_STORE as _HAS_GS, print_context, print_suggestions
-from src.data.yahoo_client import get_stock_info, get_stock_detail
-from src.core.screening.indicators import calculate_value_score
 from src.core.common import is_etf
 
-HAS_SHAREHOLDER_RETURN, _sr = try_import("src.core.screening.indicators", "calculate_shareholder_return")
-if HAS_SHAREHOLDER_RETURN: calculate_shareholder_return = _sr["calculate_shareholder_return"]
+# Value score cut points and the verdict for each band (score >= cut moves up)
+_VERDICT_THRESHOLDS = (30, 50, 70)
+_VERDICTS = ("割高傾向", "適正水準", "やや割安", "割安（買い検討）")
 
-HAS_SHAREHOLDER_HISTORY, _sh = try_import("src.core.screening.indicators", "calculate_shareholder_return_history")
-if HAS_SHAREHOLDER_HISTORY: calculate_shareholder_return_history = _sh["calculate_shareholder_return_history"]
-
-HAS_RETURN_STABILITY, _rs = try_import("src.core.screening.indicators", "assess_return_stability")
-if HAS_RETURN_STABILITY: assess_return_stability = _rs["assess_return_stability"]
+# yahoo_client / indicators / health_check / contrarian / query_builder pull in
+# yfinance and pandas (~250ms); they are imported in main() after argv checks.
 
 # Module availability from common.py (KIK-448)
 HAS_HISTORY = HAS_HISTORY_STORE
 if HAS_HISTORY:
     from src.data.history_store import save_report as history_save_report
 
-HAS_VALUE_TRAP, _vt = try_import("src.core.health_check", "_detect_value_trap")
-if HAS_VALUE_TRAP: _detect_value_trap = _vt["_detect_value_trap"]
-
-HAS_CONTRARIAN, _ct = try_import("src.core.screening.contrarian", "compute_contrarian_score")
-if HAS_CONTRARIAN: compute_contrarian_score = _ct["compute_contrarian_score"]
-
 HAS_GRAPH_QUERY = _HAS_GQ
 if HAS_GRAPH_QUERY:
     from src.data.graph_query import get_prior_report
@@ -44,13 +35,6 @@ HAS_GRAPH_STORE = _HAS_GS
 if HAS_GRAPH_STORE:
     from src.data.graph_store import tag_theme
 
-HAS_THEME_LOOKUP, _tl = try_import("src.core.screening.query_builder", "infer_themes")
-if HAS_THEME_LOOKUP:
-    _infer_themes = _tl["infer_themes"]
-else:
-    def _infer_themes(industry: str) -> list[str]:
-        return []
-
 
 def _print_etf_report(symbol: str, data: dict):
     """ETF専用レポートを出力する (KIK-469)."""
@@ -131,6 +115,28 @@ def main():
 
     symbol = sys.argv[1]
 
+    # Deferred heavy imports (see module top)
+    from src.data.yahoo_client import get_stock_info, get_stock_detail
+    from src.core.screening.indicators import calculate_value_score
+
+    HAS_SHAREHOLDER_RETURN, _sr = try_import("src.core.screening.indicators", "calculate_shareholder_return")
+    if HAS_SHAREHOLDER_RETURN: calculate_shareholder_return = _sr["calculate_shareholder_return"]
+
+    HAS_SHAREHOLDER_HISTORY, _sh = try_import("src.core.screening.indicators", "calculate_shareholder_return_history")
+    if HAS_SHAREHOLDER_HISTORY: calculate_shareholder_return_history = _sh["calculate_shareholder_return_history"]
+
+    HAS_RETURN_STABILITY, _rs = try_import("src.core.screening.indicators", "assess_return_stability")
+    if HAS_RETURN_STABILITY: assess_return_stability = _rs["assess_return_stability"]
+
+    HAS_VALUE_TRAP, _vt = try_import("src.core.health_check", "_detect_value_trap")
+    if HAS_VALUE_TRAP: _detect_value_trap = _vt["_detect_value_trap"]
+
+    HAS_CONTRARIAN, _ct = try_import("src.core.screening.contrarian", "compute_contrarian_score")
+    if HAS_CONTRARIAN: compute_contrarian_score = _ct["compute_contrarian_score"]
+
+    HAS_THEME_LOOKUP, _tl = try_import("src.core.screening.query_builder", "infer_themes")
+    _infer_themes = _tl["infer_themes"] if HAS_THEME_LOOKUP else (lambda industry: [])
+
     # Context retrieval (KIK-465)
     print_context(f"report {symbol}")
 
@@ -151,14 +157,7 @@ def main():
     thresholds = {"per_max": 15, "pbr_max": 1.0, "dividend_yield_min": 0.03, "roe_min": 0.08}
     score = calculate_value_score(data, thresholds)
 
-    if score >= 70:
-        verdict = "割安（買い検討）"
-    elif score >= 50:
-        verdict = "やや割安"
-    elif score >= 30:
-        verdict = "適正水準"
-    else:
-        verdict = "割高傾向"
+    verdict = _VERDICTS[bisect.bisect_right(_VERDICT_THRESHOLDS, score)]
 
     def fmt(val, pct=False):
         if val is None:
@@ -2,6 +2,7 @@
 
 import signal
 import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -52,6 +53,25 @@ _ERROR_MESSAGES: dict[str, dict[str, str]] = {
 }
 
 
+_CONTEXT_SLOT = "{CONTEXT}"
+
+
+def _build_error_template(msg: dict[str, str]) -> str:
+    """Join a message entry into one string with a context placeholder."""
+    lines = [f"⚠️  {msg['title']}{_CONTEXT_SLOT}"]
+    lines.append(f"    原因: {msg['cause']}")
+    lines.append(f"    対処: {msg['fix']}")
+    if msg.get("fallback"):
+        lines.append(f"    → {msg['fallback']}")
+    return "\n".join(lines)
+
+
+# Precomputed at import time; format_user_error only fills the context slot.
+_ERROR_TEMPLATES: dict[str, str] = {
+    key: _build_error_template(msg) for key, msg in _ERROR_MESSAGES.items()
+}
+
+
 def format_user_error(error_type: str, context: str = "") -> str:
     """Format a human-readable error message for the given error type.
 
@@ -64,18 +84,13 @@ def format_user_error(error_type: str, context: str = "") -> str:
     Returns:
         Formatted multi-line string suitable for printing to the user.
     """
-    msg = _ERROR_MESSAGES.get(error_type)
-    if msg is None:
+    template = _ERROR_TEMPLATES.get(error_type)
+    if template is None:
         return f"⚠️  エラーが発生しました: {error_type}" + (f" ({context})" if context else "")
 
-    lines = [f"⚠️  {msg['title']}"]
-    if context:
-        lines.append(f"    対象: {context}")
-    lines.append(f"    原因: {msg['cause']}")
-    lines.append(f"    対処: {msg['fix']}")
-    if msg.get("fallback"):
-        lines.append(f"    → {msg['fallback']}")
-    return "\n".join(lines)
+    return template.replace(
+        _CONTEXT_SLOT, f"\n    対象: {context}" if context else ""
+    )
 
 
 def setup_project_path(script_file: str, depth: int = 4) -> str:
@@ -113,14 +128,19 @@ def try_import(module_path: str, *names: str):
         if ok:
             save_screening(...)
     """
-    result = {n: None for n in names}
     try:
+        # fromlist (not importlib) so submodule names are imported too
         mod = __import__(module_path, fromlist=list(names))
-        for name in names:
-            result[name] = getattr(mod, name)
-        return True, result
-    except (ImportError, AttributeError):
-        return False, result
+    except ImportError:
+        return False, {n: None for n in names}
+    try:
+        values = attrgetter(*names)(mod) if names else ()
+    except AttributeError:
+        # Keep the names that did resolve; some callers ignore the flag
+        return False, {n: getattr(mod, n, None) for n in names}
+    if len(names) == 1:
+        values = (values,)
+    return True, dict(zip(names, values))
 
 
 # ---------------------------------------------------------------------------
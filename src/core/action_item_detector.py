@@ -126,9 +126,15 @@ def detect_action_items(
 def _extract_symbol_from_suggestion(suggestion: dict) -> str:
     """Try to extract a ticker symbol from a suggestion dict (KIK-489).
 
-    Searches command_hint, title, and reason fields using regex patterns
+    Uses the ``symbol`` field when the engine set one; otherwise searches
+    command_hint, title, and reason fields using regex patterns
     to handle Japanese text without spaces (e.g. "7203.Tの投資テーゼ").
     """
+    # 0. Explicit symbol from proactive_engine.Suggestion
+    symbol = suggestion.get("symbol")
+    if symbol:
+        return symbol
+
     # 1. Check command_hint for --symbol flag (e.g. "--symbol AAPL")
     hint = suggestion.get("command_hint", "")
     hint_parts = hint.split()
@@ -6,10 +6,13 @@ correlation, scenario_analysis, and shock_sensitivity to eliminate duplication.
 
 import math
 
+_isfinite = math.isfinite
+
 
 def is_cash(symbol: str) -> bool:
     """Check if symbol represents a cash position (e.g., JPY.CASH, USD.CASH)."""
-    return symbol.upper().endswith(".CASH")
+    # Case-insensitive; upper() only the 5-char tail, not the whole symbol
+    return symbol[-5:].upper() == ".CASH"
 
 
 def is_etf(stock_detail: dict) -> bool:
@@ -18,6 +21,10 @@ def is_etf(stock_detail: dict) -> bool:
     Detection rules (from health_check.py, broadest coverage):
       1. quoteType == "ETF"
       2. No sector AND no net_income_stmt AND no operating_cashflow AND no revenue_history
+
+    Not memoized: the dicts are shared via stock_info_cache/stock_detail_cache,
+    so stashing a verdict on them would leak to other consumers and go stale
+    when the dict is updated; the checks are a few dict lookups.
     """
     if stock_detail.get("quoteType") == "ETF":
         return True
@@ -37,7 +44,7 @@ def finite_or_none(v):
         return None
     try:
         f = float(v)
-        return None if (math.isnan(f) or math.isinf(f)) else f
+        return f if _isfinite(f) else None
     except (TypeError, ValueError):
         return None
 
@@ -51,8 +58,6 @@ def safe_float(value, default: float = 0.0) -> float:
         return default
     try:
         f = float(value)
-        if math.isnan(f) or math.isinf(f):
-            return default
-        return f
+        return f if _isfinite(f) else default
     except (TypeError, ValueError):
         return default
@@ -11,23 +11,61 @@ Trigger categories:
 
 KIK-513: ProactiveEngine accepts an optional ``graph_reader`` parameter
 (GraphReader Protocol) for dependency injection. When omitted, falls back to
-importing graph_query functions directly (backward compatible).
+the graph_query module, which satisfies the Protocol structurally.
 """
 
 from __future__ import annotations
 
+import heapq
+from dataclasses import asdict, dataclass
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     from src.core.ports.graph import GraphReader
 
+# Resolved once at import; functions are looked up on the module at call
+# time so that patches on src.data.graph_query still take effect.
+try:
+    from src.data import graph_query as _graph_query
+except Exception:
+    _graph_query = None
+
 _THESIS_REVIEW_DAYS = 90   # thesis note older than this → suggest review
 _HEALTH_STALE_DAYS  = 14   # no health check for N days → suggest check
 _HEALTH_HIGH_DAYS   = 30   # > this → urgency=high
 _EARNINGS_WARN_DAYS = 7    # upcoming earnings within N days → warn
 _RECURRING_MIN      = 3    # screened N+ times → suggest deeper report
 
+_URGENCY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# Suggestion titles (dedup key in get_suggestions); *_FMT take {symbol}/{sector}
+_TITLE_HEALTH = "ヘルスチェックの実施"
+_TITLE_THESIS_FMT = "{symbol}の投資テーゼを見直す"
+_TITLE_EARNINGS = "決算イベントが近い"
+_TITLE_PICK_FMT = "{symbol}の詳細分析"
+_TITLE_CONCERN_FMT = "{symbol}の懸念メモを再確認"
+_TITLE_SECTOR_FMT = "{sector}セクターの最新リサーチがあります"
+
+
+@dataclass(slots=True, frozen=True)
+class Suggestion:
+    """A single next-action suggestion.
+
+    Used internally by ProactiveEngine; get_suggestions() returns
+    to_dict() output so callers keep the dict interface.
+    """
+
+    emoji: str
+    title: str
+    reason: str
+    command_hint: str
+    urgency: str = "low"
+    symbol: str = ""   # ticker the suggestion is about ("" if none)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
 # ---------------------------------------------------------------------------
 # Context-based trigger patterns (KIK-465)
 # ---------------------------------------------------------------------------
@@ -78,16 +116,43 @@ _CONTEXT_PATTERNS: dict[str, dict] = {
 }
 
 
+def _fetch_snapshot(reader) -> dict | None:
+    """Return get_proactive_snapshot() from *reader*, or None to query one by one.
+
+    graph_query answers the Neo4j-backed time/state trigger queries in one
+    round trip; readers without the (optional) method, or a failed or
+    unavailable snapshot, keep the per-query path.
+    """
+    fetch = getattr(reader, "get_proactive_snapshot", None)
+    if fetch is None:
+        return None
+    try:
+        snapshot = fetch(
+            older_than_days=_THESIS_REVIEW_DAYS,
+            within_days=_EARNINGS_WARN_DAYS,
+            min_count=_RECURRING_MIN,
+        )
+    except Exception:
+        return None
+    return snapshot if isinstance(snapshot, dict) else None
+
+
 class ProactiveEngine:
     """Generate proactive next-action suggestions from the knowledge graph.
 
     KIK-513: Accepts an optional ``graph_reader`` (GraphReader Protocol).
-    When not provided, imports from src.data.graph_query directly (backward compatible).
+    When not provided, uses the src.data.graph_query module (backward compatible).
     """
 
     def __init__(self, graph_reader: GraphReader | None = None) -> None:
         self._graph_reader = graph_reader
 
+    def _reader(self):
+        """Return the injected reader, else graph_query (None if unavailable)."""
+        if self._graph_reader is not None:
+            return self._graph_reader
+        return _graph_query
+
     def get_suggestions(
         self,
         context: str = "",
@@ -96,101 +161,106 @@ class ProactiveEngine:
     ) -> list[dict]:
         """Return up to 3 suggestions sorted by urgency (high > medium > low).
 
-        Each item: {emoji, title, reason, command_hint, urgency}
+        Each item: {emoji, title, reason, command_hint, urgency, symbol}
         """
-        suggestions: list[dict] = []
-        suggestions += self._check_time_triggers()
-        suggestions += self._check_state_triggers(symbol)
+        # One round trip for the time/state trigger queries when available
+        snapshot = _fetch_snapshot(self._reader())
+        suggestions: list[Suggestion] = []
+        suggestions += self._check_time_triggers(snapshot=snapshot)
+        suggestions += self._check_state_triggers(symbol, snapshot=snapshot)
         suggestions += self._check_contextual_triggers(sector)
         suggestions += self._check_context_triggers(context)
 
-        # Sort by urgency, deduplicate by title
-        _order = {"high": 0, "medium": 1, "low": 2}
-        suggestions.sort(key=lambda s: _order.get(s.get("urgency", "low"), 2))
-        seen: set[str] = set()
-        result: list[dict] = []
-        for s in suggestions:
-            key = s.get("title", "")
-            if key not in seen:
-                seen.add(key)
-                result.append(s)
-        return result[:3]
+        # Best (urgency, position) per title -- ties keep trigger order --
+        # then the 3 most urgent titles without sorting the full list
+        best: dict[str, tuple[int, int]] = {}
+        for i, s in enumerate(suggestions):
+            key = (_URGENCY_ORDER.get(s.urgency, 2), i)
+            if s.title not in best or key < best[s.title]:
+                best[s.title] = key
+        return [suggestions[i].to_dict() for _, i in heapq.nsmallest(3, best.values())]
 
     # ------------------------------------------------------------------
     # Time triggers
     # ------------------------------------------------------------------
 
-    def _check_time_triggers(self) -> list[dict]:
-        out: list[dict] = []
+    def _check_time_triggers(self, snapshot: dict | None = None) -> list[Suggestion]:
+        """Health check / thesis / earnings triggers.
+
+        *snapshot* (get_proactive_snapshot() output) replaces the graph
+        queries when given.
+        """
+        out: list[Suggestion] = []
+        reader = self._reader()
+        if reader is None and snapshot is None:
+            return out
 
         # Health check staleness
         try:
-            if self._graph_reader is not None:
-                last_hc = self._graph_reader.get_last_health_check_date()
-            else:
-                from src.data.graph_query import get_last_health_check_date
-                last_hc = get_last_health_check_date()
+            last_hc = (
+                snapshot["last_health_check_date"] if snapshot is not None
+                else reader.get_last_health_check_date()
+            )
             if last_hc is None:
-                out.append({
-                    "emoji": "📋",
-                    "title": "ヘルスチェックの実施",
-                    "reason": "ヘルスチェックの記録がありません",
-                    "command_hint": "portfolio health",
-                    "urgency": "medium",
-                })
+                out.append(Suggestion(
+                    emoji="📋",
+                    title=_TITLE_HEALTH,
+                    reason="ヘルスチェックの記録がありません",
+                    command_hint="portfolio health",
+                    urgency="medium",
+                ))
             else:
                 delta = (date.today() - date.fromisoformat(last_hc)).days
                 if delta >= _HEALTH_STALE_DAYS:
-                    out.append({
-                        "emoji": "📋",
-                        "title": "ヘルスチェックの実施",
-                        "reason": f"最終チェックから{delta}日経過",
-                        "command_hint": "portfolio health",
-                        "urgency": "high" if delta >= _HEALTH_HIGH_DAYS else "medium",
-                    })
+                    out.append(Suggestion(
+                        emoji="📋",
+                        title=_TITLE_HEALTH,
+                        reason=f"最終チェックから{delta}日経過",
+                        command_hint="portfolio health",
+                        urgency="high" if delta >= _HEALTH_HIGH_DAYS else "medium",
+                    ))
         except Exception:
             pass
 
         # Old thesis notes
         try:
-            if self._graph_reader is not None:
-                old_theses = self._graph_reader.get_old_thesis_notes(older_than_days=_THESIS_REVIEW_DAYS)
-            else:
-                from src.data.graph_query import get_old_thesis_notes
-                old_theses = get_old_thesis_notes(older_than_days=_THESIS_REVIEW_DAYS)
+            old_theses = (
+                snapshot["old_thesis_notes"] if snapshot is not None
+                else reader.get_old_thesis_notes(older_than_days=_THESIS_REVIEW_DAYS)
+            )
             for note in old_theses[:1]:
                 sym = note.get("symbol") or "保有銘柄"
                 days = note.get("days_old", _THESIS_REVIEW_DAYS)
-                out.append({
-                    "emoji": "🔄",
-                    "title": f"{sym}の投資テーゼを見直す",
-                    "reason": f"テーゼ記録から{days}日経過（要再検証）",
-                    "command_hint": (
+                out.append(Suggestion(
+                    emoji="🔄",
+                    title=_TITLE_THESIS_FMT.format(symbol=sym),
+                    reason=f"テーゼ記録から{days}日経過（要再検証）",
+                    command_hint=(
                         f"investment-note list --symbol {sym}"
                         if sym != "保有銘柄" else "investment-note list --type thesis"
                     ),
-                    "urgency": "medium",
-                })
+                    urgency="medium",
+                    symbol=sym if sym != "保有銘柄" else "",
+                ))
         except Exception:
             pass
 
         # Upcoming earnings events
         try:
-            if self._graph_reader is not None:
-                events = self._graph_reader.get_upcoming_events(within_days=_EARNINGS_WARN_DAYS)
-            else:
-                from src.data.graph_query import get_upcoming_events
-                events = get_upcoming_events(within_days=_EARNINGS_WARN_DAYS)
+            events = (
+                snapshot["upcoming_events"] if snapshot is not None
+                else reader.get_upcoming_events(within_days=_EARNINGS_WARN_DAYS)
+            )
             for ev in events[:1]:
                 ev_date = ev.get("date", "")
                 ev_text = str(ev.get("text", ""))[:60]
-                out.append({
-                    "emoji": "📅",
-                    "title": "決算イベントが近い",
-                    "reason": f"{ev_date} に予定: {ev_text} — 直前のレポート確認を推奨",
-                    "command_hint": "market-research market",
-                    "urgency": "high",
-                })
+                out.append(Suggestion(
+                    emoji="📅",
+                    title=_TITLE_EARNINGS,
+                    reason=f"{ev_date} に予定: {ev_text} — 直前のレポート確認を推奨",
+                    command_hint="market-research market",
+                    urgency="high",
+                ))
         except Exception:
             pass
 
@@ -200,50 +270,53 @@ class ProactiveEngine:
     # State triggers
     # ------------------------------------------------------------------
 
-    def _check_state_triggers(self, symbol: str = "") -> list[dict]:
-        out: list[dict] = []
+    def _check_state_triggers(
+        self, symbol: str = "", snapshot: dict | None = None,
+    ) -> list[Suggestion]:
+        """Recurring-pick / concern-note triggers (*snapshot* as in time triggers)."""
+        out: list[Suggestion] = []
+        reader = self._reader()
+        if reader is None:
+            return out
 
         # Recurring screening picks
         try:
-            if self._graph_reader is not None:
-                picks = self._graph_reader.get_recurring_picks(min_count=_RECURRING_MIN)
-            else:
-                from src.data.graph_query import get_recurring_picks
-                picks = get_recurring_picks(min_count=_RECURRING_MIN)
+            picks = (
+                snapshot["recurring_picks"] if snapshot is not None
+                else reader.get_recurring_picks(min_count=_RECURRING_MIN)
+            )
             for pick in picks[:1]:
                 sym = pick.get("symbol", "")
                 cnt = pick.get("count", _RECURRING_MIN)
-                out.append({
-                    "emoji": "🔍",
-                    "title": f"{sym}の詳細分析",
-                    "reason": f"スクリーニングで{cnt}回上位にランクイン",
-                    "command_hint": f"stock-report {sym}",
-                    "urgency": "medium",
-                })
+                out.append(Suggestion(
+                    emoji="🔍",
+                    title=_TITLE_PICK_FMT.format(symbol=sym),
+                    reason=f"スクリーニングで{cnt}回上位にランクイン",
+                    command_hint=f"stock-report {sym}",
+                    urgency="medium",
+                    symbol=sym,
+                ))
         except Exception:
             pass
 
         # Concern notes
         try:
-            if self._graph_reader is not None:
-                concerns = self._graph_reader.get_concern_notes(limit=1)
-            else:
-                from src.data.graph_query import get_concern_notes
-                concerns = get_concern_notes(limit=1)
+            concerns = reader.get_concern_notes(limit=1)
             for c in concerns:
                 sym = c.get("symbol") or ""
                 days = c.get("days_old", 0)
                 sym_display = sym if sym else "銘柄"
-                out.append({
-                    "emoji": "⚠️",
-                    "title": f"{sym_display}の懸念メモを再確認",
-                    "reason": f"{days}日前に懸念を記録済み — 状況変化を確認",
-                    "command_hint": (
+                out.append(Suggestion(
+                    emoji="⚠️",
+                    title=_TITLE_CONCERN_FMT.format(symbol=sym_display),
+                    reason=f"{days}日前に懸念を記録済み — 状況変化を確認",
+                    command_hint=(
                         f"investment-note list --symbol {sym}"
                         if sym else "investment-note list --type concern"
                     ),
-                    "urgency": "medium",
-                })
+                    urgency="medium",
+                    symbol=sym,
+                ))
         except Exception:
             pass
 
@@ -253,31 +326,27 @@ class ProactiveEngine:
     # Contextual triggers
     # ------------------------------------------------------------------
 
-    def _check_contextual_triggers(self, sector: str = "") -> list[dict]:
-        out: list[dict] = []
+    def _check_contextual_triggers(self, sector: str = "") -> list[Suggestion]:
+        out: list[Suggestion] = []
         if not sector:
             return out
+        reader = self._reader()
+        if reader is None:
+            return out
         try:
-            if self._graph_reader is not None:
-                research = self._graph_reader.get_industry_research_for_linking(sector, days=14, limit=1)
-                if not research:
-                    return out
-                holdings = self._graph_reader.get_current_holdings()
-            else:
-                from src.data.graph_query import get_current_holdings, get_industry_research_for_linking
-                research = get_industry_research_for_linking(sector, days=14, limit=1)
-                if not research:
-                    return out
-                holdings = get_current_holdings()
+            research = reader.get_industry_research_for_linking(sector, days=14, limit=1)
+            if not research:
+                return out
+            holdings = reader.get_current_holdings()
             held_sectors = {h.get("sector", "") for h in holdings}
             if sector in held_sectors:
-                out.append({
-                    "emoji": "💡",
-                    "title": f"{sector}セクターの最新リサーチがあります",
-                    "reason": "保有銘柄のセクターに関連する直近リサーチを検出",
-                    "command_hint": f"market-research industry {sector}",
-                    "urgency": "low",
-                })
+                out.append(Suggestion(
+                    emoji="💡",
+                    title=_TITLE_SECTOR_FMT.format(sector=sector),
+                    reason="保有銘柄のセクターに関連する直近リサーチを検出",
+                    command_hint=f"market-research industry {sector}",
+                    urgency="low",
+                ))
         except Exception:
             pass
         return out
@@ -286,21 +355,21 @@ class ProactiveEngine:
     # Context triggers (KIK-465) — keyword matching on execution results
     # ------------------------------------------------------------------
 
-    def _check_context_triggers(self, context: str = "") -> list[dict]:
+    def _check_context_triggers(self, context: str = "") -> list[Suggestion]:
         """Generate suggestions based on execution result context."""
         if not context:
             return []
-        out: list[dict] = []
+        out: list[Suggestion] = []
         context_lower = context.lower()
         for _key, pattern in _CONTEXT_PATTERNS.items():
             if any(kw.lower() in context_lower for kw in pattern["keywords"]):
-                out.append({
-                    "emoji": pattern["emoji"],
-                    "title": pattern["title"],
-                    "reason": f"実行結果に関連: {context[:60]}",
-                    "command_hint": pattern["command_hint"],
-                    "urgency": "low",
-                })
+                out.append(Suggestion(
+                    emoji=pattern["emoji"],
+                    title=pattern["title"],
+                    reason=f"実行結果に関連: {context[:60]}",
+                    command_hint=pattern["command_hint"],
+                    urgency="low",
+                ))
         return out[:2]
 
 
@@ -308,6 +377,10 @@ class ProactiveEngine:
 # Public convenience functions
 # ---------------------------------------------------------------------------
 
+# Stateless default engine reused by every get_suggestions() call without DI
+_ENGINE = ProactiveEngine()
+
+
 def get_suggestions(
     context: str = "",
     symbol: str = "",
@@ -321,26 +394,34 @@ def get_suggestions(
     ----------
     graph_reader : GraphReader, optional
         Optional dependency-injected graph reader (KIK-513 DIP).
-        When None, falls back to importing graph_query functions directly.
+        When None, falls back to the graph_query module.
     """
-    return ProactiveEngine(graph_reader=graph_reader).get_suggestions(
-        context=context, symbol=symbol, sector=sector
-    )
+    engine = _ENGINE if graph_reader is None else ProactiveEngine(graph_reader=graph_reader)
+    return engine.get_suggestions(context=context, symbol=symbol, sector=sector)
 
 
-def format_suggestions(suggestions: list[dict]) -> str:
-    """Format suggestion list as markdown for display after skill output."""
-    if not suggestions:
-        return ""
-    lines = [f"\n---\n💡 **次のアクション提案** ({len(suggestions)}件)\n"]
-    for i, s in enumerate(suggestions, 1):
+def _format_suggestion(i: int, s: Union[dict, Suggestion]) -> str:
+    """Render one numbered suggestion block (trailing newline included)."""
+    if isinstance(s, Suggestion):
+        emoji, title, reason, cmd = s.emoji, s.title, s.reason, s.command_hint
+    else:
         emoji = s.get("emoji", "💡")
         title = s.get("title", "")
         reason = s.get("reason", "")
         cmd = s.get("command_hint", "")
-        lines.append(f"{i}. {emoji} **{title}**")
-        lines.append(f"   {reason}")
-        if cmd:
-            lines.append(f"   → `{cmd}` を実行してください")
-        lines.append("")
-    return "\n".join(lines)
+    block = f"{i}. {emoji} **{title}**\n   {reason}\n"
+    if cmd:
+        block += f"   → `{cmd}` を実行してください\n"
+    return block
+
+
+def format_suggestions(suggestions: list[Union[dict, Suggestion]]) -> str:
+    """Format suggestion list as markdown for display after skill output.
+
+    Accepts either get_suggestions() dicts or Suggestion instances.
+    """
+    if not suggestions:
+        return ""
+    parts = [f"\n---\n💡 **次のアクション提案** ({len(suggestions)}件)\n"]
+    parts.extend(_format_suggestion(i, s) for i, s in enumerate(suggestions, 1))
+    return "\n".join(parts)
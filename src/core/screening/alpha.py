@@ -13,7 +13,7 @@ KIK-349 fixes:
   - Earnings growth penalty: negative growth reduces total change score
 """
 
-import numpy as np
+from bisect import bisect_left, bisect_right
 from typing import Optional
 
 
@@ -21,10 +21,43 @@ from typing import Optional
 _SECTOR_CAP_ACCRUALS = {"Utilities", "Financial Services"}
 
 
+_NAN = float("nan")
+
+# Threshold ladders: ascending cut points plus the score for each band.
+# Accruals score higher the *lower* the value (band = #cuts <= x);
+# the other three score higher the *higher* the value (band = #cuts < x).
+_ACCRUALS_CUTS = (-0.05, 0.0, 0.05, 0.10)
+_ACCRUALS_SCORES = (25.0, 20.0, 15.0, 10.0, 0.0)
+_REV_ACCEL_CUTS = (-0.05, 0.0, 0.05, 0.10)
+_FCF_YIELD_CUTS = (0.02, 0.05, 0.08, 0.12)  # KIK-349: raised (was 0.0/0.03/0.06/0.10)
+_ROE_SLOPE_CUTS = (-0.01, 0.0, 0.01, 0.03)
+_RISING_SCORES = (0.0, 10.0, 15.0, 20.0, 25.0)
+
+
+# The _*_score kernels take and return plain floats (NaN = missing) and
+# only index the tuples above, so they need no compile step: a short-lived
+# CLI pays nothing beyond the module import.  Batch scoring lives in
+# alpha_batch.
+
+
+def _or_none(value: float) -> Optional[float]:
+    """Map the kernels' NaN "missing" sentinel back to None."""
+    return None if value != value else value
+
+
 # ---------------------------------------------------------------------------
 # 1. Accruals (earnings quality) -- 25 pts
 # ---------------------------------------------------------------------------
 
+def _accruals_score(ni: float, ocf: float, ta: float) -> tuple[float, float]:
+    """Float kernel for the accruals score.  Returns (score, accruals|NaN)."""
+    if ta == 0:
+        return 0.0, _NAN
+
+    accruals = (ni - ocf) / ta
+    return _ACCRUALS_SCORES[bisect_right(_ACCRUALS_CUTS, accruals)], accruals
+
+
 def compute_accruals_score(stock_detail: dict) -> tuple[float, Optional[float]]:
     """Accruals score.  Returns (score, raw_accruals).
 
@@ -39,21 +72,10 @@ def compute_accruals_score(stock_detail: dict) -> tuple[float, Optional[float]]:
 
     if net_income is None or operating_cf is None or total_assets is None:
         return 0.0, None
-    if total_assets == 0:
-        return 0.0, None
-
-    accruals = (net_income - operating_cf) / total_assets
 
-    if accruals < -0.05:
-        score = 25.0
-    elif accruals < 0.0:
-        score = 20.0
-    elif accruals < 0.05:
-        score = 15.0
-    elif accruals < 0.10:
-        score = 10.0
-    else:
-        score = 0.0
+    score, accruals = _accruals_score(net_income, operating_cf, total_assets)
+    if accruals != accruals:
+        return 0.0, None
 
     # KIK-349: Cap for sectors with structurally low accruals
     sector = stock_detail.get("sector") or ""
@@ -67,6 +89,22 @@ def compute_accruals_score(stock_detail: dict) -> tuple[float, Optional[float]]:
 # 2. Revenue growth acceleration -- 25 pts
 # ---------------------------------------------------------------------------
 
+def _rev_accel_score(rev0: float, rev1: float, rev2: float) -> tuple[float, float]:
+    """Float kernel for revenue acceleration.  Returns (score, accel|NaN)."""
+    if rev1 == 0 or rev2 == 0:
+        return 0.0, _NAN
+
+    current_growth = (rev0 - rev1) / abs(rev1)
+    previous_growth = (rev1 - rev2) / abs(rev2)
+    acceleration = current_growth - previous_growth
+
+    # KIK-349: Guard — negative current growth means no genuine acceleration
+    if current_growth < 0:
+        return 0.0, acceleration
+
+    return _RISING_SCORES[bisect_left(_REV_ACCEL_CUTS, acceleration)], acceleration
+
+
 def compute_revenue_acceleration_score(stock_detail: dict) -> tuple[float, Optional[float]]:
     """Revenue growth acceleration score.  Returns (score, raw_acceleration).
 
@@ -86,35 +124,24 @@ def compute_revenue_acceleration_score(stock_detail: dict) -> tuple[float, Optio
 
     if rev0 is None or rev1 is None or rev2 is None:
         return 0.0, None
-    if rev1 == 0 or rev2 == 0:
-        return 0.0, None
-
-    current_growth = (rev0 - rev1) / abs(rev1)
-    previous_growth = (rev1 - rev2) / abs(rev2)
-    acceleration = current_growth - previous_growth
-
-    # KIK-349: Guard — negative current growth means no genuine acceleration
-    if current_growth < 0:
-        return 0.0, acceleration
-
-    if acceleration > 0.10:
-        score = 25.0
-    elif acceleration > 0.05:
-        score = 20.0
-    elif acceleration > 0.0:
-        score = 15.0
-    elif acceleration > -0.05:
-        score = 10.0
-    else:
-        score = 0.0
 
-    return score, acceleration
+    score, acceleration = _rev_accel_score(rev0, rev1, rev2)
+    return score, _or_none(acceleration)
 
 
 # ---------------------------------------------------------------------------
 # 3. FCF yield -- 25 pts
 # ---------------------------------------------------------------------------
 
+def _fcf_yield_score(fcf: float, market_cap: float) -> tuple[float, float]:
+    """Float kernel for the FCF yield score.  Returns (score, yield|NaN)."""
+    if market_cap == 0:
+        return 0.0, _NAN
+
+    fcf_yield = fcf / market_cap
+    return _RISING_SCORES[bisect_left(_FCF_YIELD_CUTS, fcf_yield)], fcf_yield
+
+
 def compute_fcf_yield_score(stock_detail: dict) -> tuple[float, Optional[float]]:
     """FCF yield score.  Returns (score, raw_fcf_yield).
 
@@ -128,35 +155,43 @@ def compute_fcf_yield_score(stock_detail: dict) -> tuple[float, Optional[float]]
 
     if fcf is None or market_cap is None:
         return 0.0, None
-    if market_cap == 0:
-        return 0.0, None
-
-    fcf_yield = fcf / market_cap
-
-    # KIK-349: Raised thresholds (was 0.10/0.06/0.03/0.0)
-    if fcf_yield > 0.12:
-        score = 25.0
-    elif fcf_yield > 0.08:
-        score = 20.0
-    elif fcf_yield > 0.05:
-        score = 15.0
-    elif fcf_yield > 0.02:
-        score = 10.0
-    else:
-        score = 0.0
 
-    return score, fcf_yield
+    score, fcf_yield = _fcf_yield_score(fcf, market_cap)
+    return score, _or_none(fcf_yield)
 
 
 # ---------------------------------------------------------------------------
 # 4. ROE improvement trend -- 25 pts
 # ---------------------------------------------------------------------------
 
+def _roe_trend_score(
+    ni0: float, eq0: float, ni1: float, eq1: float, ni2: float, eq2: float,
+) -> tuple[float, float]:
+    """Float kernel for the ROE trend score.  Returns (score, slope|NaN).
+
+    Index 0 is the latest period, 2 the oldest.
+    """
+    if eq0 == 0 or eq1 == 0 or eq2 == 0:
+        return 0.0, _NAN
+    roe0, roe1, roe2 = ni0 / eq0, ni1 / eq1, ni2 / eq2
+
+    # KIK-349: Exclude red→black recovery and low-ROE stocks
+    if roe0 < 0 or roe1 < 0 or roe2 < 0:
+        return 0.0, _NAN
+    if roe0 < 0.08:
+        return 0.0, _NAN
+
+    # Closed-form OLS slope over chronological x = [0, 1, 2]
+    slope = (roe0 - roe2) / 2.0
+    return _RISING_SCORES[bisect_left(_ROE_SLOPE_CUTS, slope)], slope
+
+
 def compute_roe_trend_score(stock_detail: dict) -> tuple[float, Optional[float]]:
     """ROE improvement trend score.  Returns (score, raw_slope).
 
     Calculates ROE for three periods and fits a linear regression to
-    determine if ROE is improving over time.
+    determine if ROE is improving over time.  For x = [0, 1, 2] the OLS
+    slope reduces to (newest - oldest) / 2, so no least-squares fit is needed.
 
     KIK-349: Requires latest ROE >= 8% and all periods positive.
     Excludes red-to-black recovery (normalization, not improvement).
@@ -168,42 +203,13 @@ def compute_roe_trend_score(stock_detail: dict) -> tuple[float, Optional[float]]
         return 0.0, None
     if len(ni_hist) < 3 or len(eq_hist) < 3:
         return 0.0, None
-
-    # Compute ROE for latest 3 periods
-    roes = []
-    for i in range(3):
-        ni = ni_hist[i]
-        eq = eq_hist[i]
-        if ni is None or eq is None or eq == 0:
-            return 0.0, None
-        roes.append(ni / eq)
-
-    # KIK-349: Exclude red→black recovery and low-ROE stocks
-    if any(r < 0 for r in roes):
+    if any(v is None for v in ni_hist[:3]) or any(v is None for v in eq_hist[:3]):
         return 0.0, None
-    if roes[0] < 0.08:
-        return 0.0, None
-
-    # roes[0]=latest, roes[1]=mid, roes[2]=oldest
-    # polyfit expects x in chronological order: oldest -> newest
-    y = [roes[2], roes[1], roes[0]]
-    x = [0, 1, 2]
 
-    coeffs = np.polyfit(x, y, deg=1)
-    slope = float(coeffs[0])
-
-    if slope > 0.03:
-        score = 25.0
-    elif slope > 0.01:
-        score = 20.0
-    elif slope > 0.0:
-        score = 15.0
-    elif slope > -0.01:
-        score = 10.0
-    else:
-        score = 0.0
-
-    return score, slope
+    score, slope = _roe_trend_score(
+        ni_hist[0], eq_hist[0], ni_hist[1], eq_hist[1], ni_hist[2], eq_hist[2],
+    )
+    return score, _or_none(slope)
 
 
 # ---------------------------------------------------------------------------
@@ -249,9 +255,12 @@ def compute_change_score(stock_detail: dict) -> dict:
     total = acc_score + rev_score + fcf_score + roe_score + penalty
     total = max(total, 0.0)  # Floor at 0
 
-    passed = sum(
-        1 for s in [acc_score, rev_score, fcf_score, roe_score]
-        if s >= _PASS_THRESHOLD
+    # bools add as ints -- no list/generator per call
+    passed = (
+        (acc_score >= _PASS_THRESHOLD)
+        + (rev_score >= _PASS_THRESHOLD)
+        + (fcf_score >= _PASS_THRESHOLD)
+        + (roe_score >= _PASS_THRESHOLD)
     )
 
     return {
@@ -0,0 +1,133 @@
+"""Vectorized change score over a screening universe.
+
+Batch counterpart of ``alpha.compute_change_score``.  Kept separate so
+that importing ``alpha`` for single-stock scoring (health checks,
+reports) does not pull in NumPy.
+"""
+
+import numpy as np
+
+from src.core.screening.alpha import (
+    _ACCRUALS_CUTS,
+    _ACCRUALS_SCORES,
+    _FCF_YIELD_CUTS,
+    _PASS_THRESHOLD,
+    _REV_ACCEL_CUTS,
+    _RISING_SCORES,
+    _ROE_SLOPE_CUTS,
+    _SECTOR_CAP_ACCRUALS,
+)
+
+
+def _column(stock_details: list[dict], key: str) -> np.ndarray:
+    """Extract a scalar field as a float array (NaN for missing)."""
+    values = [d.get(key) for d in stock_details]
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def _ladder(values: np.ndarray, cuts: tuple, scores: tuple, side: str) -> np.ndarray:
+    """Vectorized threshold ladder via searchsorted (NaN scores 0)."""
+    banded = np.asarray(scores)[np.searchsorted(cuts, values, side=side)]
+    return np.where(np.isnan(values), 0.0, banded)
+
+
+def _history_matrix(stock_details: list[dict], key: str) -> np.ndarray:
+    """Extract the latest 3 periods of a history field as an (N, 3) array.
+
+    Rows with fewer than 3 periods, or a None in the first 3, are all-NaN.
+    """
+    out = np.full((len(stock_details), 3), np.nan)
+    for i, d in enumerate(stock_details):
+        hist = d.get(key)
+        if not hist or len(hist) < 3:
+            continue
+        head = hist[:3]
+        if any(v is None for v in head):
+            continue
+        out[i] = head
+    return out
+
+
+def compute_change_score_batch(stock_details: list[dict]) -> dict:
+    """Vectorized ``compute_change_score`` over many stocks at once.
+
+    Produces the same scores as calling ``compute_change_score`` per stock,
+    but converts the inputs to parallel NumPy columns and applies every
+    threshold ladder (shared with ``alpha``) via ``np.searchsorted``.
+
+    Returns:
+        dict of arrays, each with length N along axis 0:
+            scores           -- (N, 4) [accruals, revenue_acceleration,
+                                fcf_yield, roe_trend] scores
+            raw              -- (N, 4) raw indicator values (NaN if missing)
+            earnings_penalty -- (N,) penalty for negative earnings growth
+            change_score     -- (N,) aggregate score 0-100
+            passed_count     -- (N,) indicators scoring >= 15
+            quality_pass     -- (N,) True if passed_count >= 3
+    """
+    n = len(stock_details)
+    scores = np.zeros((n, 4))
+    raw = np.full((n, 4), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 1. Accruals
+        ni = _column(stock_details, "net_income_stmt")
+        ocf = _column(stock_details, "operating_cashflow")
+        ta = _column(stock_details, "total_assets")
+        valid = ~(np.isnan(ni) | np.isnan(ocf) | np.isnan(ta)) & (ta != 0)
+        acc = np.where(valid, (ni - ocf) / ta, np.nan)
+        acc_score = _ladder(acc, _ACCRUALS_CUTS, _ACCRUALS_SCORES, "right")
+        capped = np.array(
+            [(d.get("sector") or "") in _SECTOR_CAP_ACCRUALS for d in stock_details],
+            dtype=bool,
+        )
+        scores[:, 0] = np.where(capped, np.minimum(acc_score, 15.0), acc_score)
+        raw[:, 0] = acc
+
+        # 2. Revenue acceleration
+        rev = _history_matrix(stock_details, "revenue_history")
+        rev0, rev1, rev2 = rev[:, 0], rev[:, 1], rev[:, 2]
+        valid = ~np.isnan(rev).any(axis=1) & (rev1 != 0) & (rev2 != 0)
+        current = (rev0 - rev1) / np.abs(rev1)
+        accel = np.where(valid, current - (rev1 - rev2) / np.abs(rev2), np.nan)
+        accel_score = _ladder(accel, _REV_ACCEL_CUTS, _RISING_SCORES, "left")
+        scores[:, 1] = np.where(current < 0, 0.0, accel_score)
+        raw[:, 1] = accel
+
+        # 3. FCF yield
+        fcf = _column(stock_details, "fcf")
+        mc = _column(stock_details, "market_cap")
+        valid = ~(np.isnan(fcf) | np.isnan(mc)) & (mc != 0)
+        fy = np.where(valid, fcf / mc, np.nan)
+        scores[:, 2] = _ladder(fy, _FCF_YIELD_CUTS, _RISING_SCORES, "left")
+        raw[:, 2] = fy
+
+        # 4. ROE trend (closed-form slope over x = [0, 1, 2])
+        ni_hist = _history_matrix(stock_details, "net_income_history")
+        eq_hist = _history_matrix(stock_details, "equity_history")
+        roes = ni_hist / eq_hist
+        valid = (
+            ~np.isnan(roes).any(axis=1)
+            & (eq_hist != 0).all(axis=1)
+            & (roes >= 0).all(axis=1)
+            & (roes[:, 0] >= 0.08)
+        )
+        slope = np.where(valid, (roes[:, 0] - roes[:, 2]) / 2.0, np.nan)
+        scores[:, 3] = _ladder(slope, _ROE_SLOPE_CUTS, _RISING_SCORES, "left")
+        raw[:, 3] = slope
+
+    # Earnings growth penalty
+    eg = _column(stock_details, "earnings_growth")
+    penalty = np.select([eg < -0.20, eg < -0.10, eg < 0], [-20.0, -15.0, -10.0], 0.0)
+
+    total = np.maximum(scores.sum(axis=1) + penalty, 0.0)
+    passed = (scores >= _PASS_THRESHOLD).sum(axis=1)
+
+    return {
+        "scores": scores,
+        "raw": raw,
+        "earnings_penalty": penalty,
+        "change_score": total,
+        "passed_count": passed,
+        "quality_pass": passed >= 3,
+    }
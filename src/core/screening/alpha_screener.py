@@ -1,6 +1,8 @@
 """AlphaScreener: value + change quality + pullback multi-axis screening."""
 
-from src.core.screening.alpha import compute_change_score
+import math
+
+from src.core.screening.alpha_batch import compute_change_score_batch
 from src.core.screening.indicators import calculate_value_score
 from src.core.screening.query_builder import build_query, load_preset
 from src.core.screening.query_screener import QueryScreener
@@ -48,7 +50,8 @@ class AlphaScreener:
             fundamentals.append(normalized)
 
         # Step 2: Change quality check (requires get_stock_detail)
-        quality_passed = []
+        candidates = []
+        details = []
         for stock in fundamentals:
             symbol = stock.get("symbol")
             if not symbol:
@@ -58,23 +61,33 @@ class AlphaScreener:
             if detail is None:
                 continue
 
-            change_result = compute_change_score(detail)
+            candidates.append(stock)
+            details.append(detail)
+
+        # Score the whole candidate set in one vectorized pass
+        batch = compute_change_score_batch(details)
+        scores = batch["scores"]
+        raw = batch["raw"]
 
+        quality_passed = []
+        for i, stock in enumerate(candidates):
             # 3/4 conditions must pass (quality_pass)
-            if not change_result.get("quality_pass"):
+            if not batch["quality_pass"][i]:
                 continue
 
+            raw_values = [None if math.isnan(v) else float(v) for v in raw[i]]
+
             # Attach change score data
-            stock["change_score"] = change_result["change_score"]
-            stock["accruals_score"] = change_result["accruals"]["score"]
-            stock["accruals_raw"] = change_result["accruals"]["raw"]
-            stock["rev_accel_score"] = change_result["revenue_acceleration"]["score"]
-            stock["rev_accel_raw"] = change_result["revenue_acceleration"]["raw"]
-            stock["fcf_yield_score"] = change_result["fcf_yield"]["score"]
-            stock["fcf_yield_raw"] = change_result["fcf_yield"]["raw"]
-            stock["roe_trend_score"] = change_result["roe_trend"]["score"]
-            stock["roe_trend_raw"] = change_result["roe_trend"]["raw"]
-            stock["quality_passed_count"] = change_result["passed_count"]
+            stock["change_score"] = float(batch["change_score"][i])
+            stock["accruals_score"] = float(scores[i, 0])
+            stock["accruals_raw"] = raw_values[0]
+            stock["rev_accel_score"] = float(scores[i, 1])
+            stock["rev_accel_raw"] = raw_values[1]
+            stock["fcf_yield_score"] = float(scores[i, 2])
+            stock["fcf_yield_raw"] = raw_values[2]
+            stock["roe_trend_score"] = float(scores[i, 3])
+            stock["roe_trend_raw"] = raw_values[3]
+            stock["quality_passed_count"] = int(batch["passed_count"][i])
             quality_passed.append(stock)
 
         if not quality_passed:
@@ -1,5 +1,6 @@
 """Build yfinance EquityQuery objects from screening criteria dicts."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,16 @@ from yfinance import EquityQuery
 _CONFIG_PATH = Path(__file__).resolve().parent.parent.parent.parent / "config" / "screening_presets.yaml"
 _THEMES_PATH = Path(__file__).resolve().parent.parent.parent.parent / "config" / "themes.yaml"
 
+# libyaml C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime: float) -> dict:
+    """Parse a YAML config once per (path, mtime); editing the file invalidates it."""
+    with open(path_str, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
 
 def load_preset(preset_name: str) -> dict:
     """Load screening criteria from the presets YAML file.
@@ -28,12 +39,12 @@ def load_preset(preset_name: str) -> dict:
     ValueError
         If the preset is not found.
     """
-    with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = _load_config_cached(str(_CONFIG_PATH), _CONFIG_PATH.stat().st_mtime)
     presets = config.get("presets", {})
     if preset_name not in presets:
         raise ValueError(f"Unknown preset: '{preset_name}'. Available: {list(presets.keys())}")
-    return presets[preset_name].get("criteria", {})
+    # Copy: callers update() the criteria with region overrides
+    return dict(presets[preset_name].get("criteria", {}))
 
 
 # ---------------------------------------------------------------------------
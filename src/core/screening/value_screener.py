@@ -1,12 +1,19 @@
 """ValueScreener: legacy symbol-list-based value screening."""
 
+import heapq
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Optional
 
 from src.core.screening.filters import apply_filters
 from src.core.screening.indicators import calculate_value_score
 from src.core.screening.query_builder import load_preset
 
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+_VALUE_SCORE = itemgetter("value_score")
+
 
 class ValueScreener:
     """Screen stocks for value investment opportunities.
@@ -16,7 +23,7 @@ class ValueScreener:
         ``--mode legacy`` は将来削除予定です。
     """
 
-    def __init__(self, yahoo_client, market):
+    def __init__(self, yahoo_client, market, max_workers: Optional[int] = None):
         """Initialise the screener.
 
         Parameters
@@ -26,6 +33,9 @@ class ValueScreener:
         market : Market
             Must expose ``get_default_symbols() -> list[str]``
             and ``get_thresholds() -> dict``.
+        max_workers : int, optional
+            Concurrent ``get_stock_info`` calls (default: SCREEN_MAX_WORKERS
+            env, 5). Lower it to stay under Yahoo's rate limit.
         """
         warnings.warn(
             "ValueScreener は非推奨です。QueryScreener を使用してください。"
@@ -35,6 +45,23 @@ class ValueScreener:
         )
         self.yahoo_client = yahoo_client
         self.market = market
+        self.max_workers = max_workers or _MAX_WORKERS
+        self._default_symbols: Optional[list[str]] = None
+        self._thresholds: Optional[dict] = None
+
+    @property
+    def default_symbols(self) -> list[str]:
+        """``market.get_default_symbols()``, fetched once per screener."""
+        if self._default_symbols is None:
+            self._default_symbols = self.market.get_default_symbols()
+        return self._default_symbols
+
+    @property
+    def thresholds(self) -> dict:
+        """``market.get_thresholds()``, fetched once per screener."""
+        if self._thresholds is None:
+            self._thresholds = self.market.get_thresholds()
+        return self._thresholds
 
     def screen(
         self,
@@ -42,6 +69,7 @@ class ValueScreener:
         criteria: Optional[dict] = None,
         preset: Optional[str] = None,
         top_n: int = 20,
+        prefetched: Optional[dict] = None,
     ) -> list[dict]:
         """Run the screening process and return the top results.
 
@@ -56,6 +84,9 @@ class ValueScreener:
             Ignored when *criteria* is explicitly provided.
         top_n : int
             Maximum number of results to return, sorted by value score descending.
+        prefetched : dict, optional
+            symbol -> stock info mapping (e.g. from ``batch_quote``).
+            Symbols present here are not re-fetched from the client.
 
         Returns
         -------
@@ -65,7 +96,10 @@ class ValueScreener:
         """
         # Resolve symbols
         if symbols is None:
-            symbols = self.market.get_default_symbols()
+            symbols = self.default_symbols
+        # Callers may pass unions (watchlist + portfolio + preset); score
+        # each symbol once, keeping first-seen order.
+        symbols = list(dict.fromkeys(symbols))
 
         # Resolve criteria (explicit criteria takes priority over preset)
         if criteria is None:
@@ -74,12 +108,23 @@ class ValueScreener:
             else:
                 criteria = {}
 
-        thresholds = self.market.get_thresholds()
+        thresholds = self.thresholds
 
         results: list[dict] = []
 
+        # Fetch symbols not already prefetched concurrently (I/O bound);
+        # filtering and scoring stay on this thread in input order.
+        stock_data = dict(prefetched) if prefetched else {}
+        missing = [s for s in symbols if s not in stock_data]
+        if len(missing) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                stock_data.update(zip(missing, executor.map(self.yahoo_client.get_stock_info, missing)))
+        else:
+            for symbol in missing:
+                stock_data[symbol] = self.yahoo_client.get_stock_info(symbol)
+
         for symbol in symbols:
-            data = self.yahoo_client.get_stock_info(symbol)
+            data = stock_data[symbol]
             if data is None:
                 continue
 
@@ -90,6 +135,9 @@ class ValueScreener:
             # Calculate value score
             score = calculate_value_score(data, thresholds)
 
+            # Literal dict of .get() calls: stock info may lack keys (ETFs,
+            # sparse yfinance payloads), and in measurements this form beat
+            # an itemgetter/zip rebuild per row.
             results.append({
                 "symbol": data.get("symbol", symbol),
                 "name": data.get("name"),
@@ -102,6 +150,8 @@ class ValueScreener:
                 "value_score": score,
             })
 
-        # Sort by value_score descending, take top N
-        results.sort(key=lambda r: r["value_score"], reverse=True)
-        return results[:top_n]
+        # Top N by value_score descending (nlargest: O(N log K), same order as
+        # a stable reverse sort)
+        if top_n >= len(results):
+            return sorted(results, key=_VALUE_SCORE, reverse=True)
+        return heapq.nlargest(top_n, results, key=_VALUE_SCORE)
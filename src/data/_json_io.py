@@ -0,0 +1,65 @@
+"""JSON (de)serialization with optional orjson acceleration.
+
+orjson (C extension) is used when installed; otherwise the stdlib json
+module.  Output is UTF-8 with non-ASCII kept, and ``indent=True`` uses the
+same layout as ``json.dump(..., ensure_ascii=False, indent=2)`` so note
+files stay human-readable either way; the default is compact (no
+whitespace), which is what the yahoo_client cache stores.
+
+The two backends are not byte-identical: orjson writes some floats
+differently (``1e16`` vs ``1e+16``) and serializes NaN/Infinity as
+``null`` where the stdlib writes ``NaN``/``Infinity``.  orjson also rejects
+those tokens on read, so ``loads`` retries with the stdlib to keep older
+files written by ``json.dump`` loadable.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    _OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=(_OPTS | orjson.OPT_INDENT_2) if indent else _OPTS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits -- let the stdlib handle it
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    # Compact like orjson: cache payloads are machine-read only
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity from json.dump -- the stdlib accepts them
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(obj: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """Serialize *obj* and write it to *path* (indented by default)."""
+    data = dumps(obj, indent=indent)
+    with open(path, "wb") as f:
+        f.write(data)
@@ -0,0 +1,86 @@
+"""SQLite-backed key/value cache with per-entry TTL.
+
+Shared by the yahoo_client disk cache and the graph linker's LLM response
+cache.  Each cache is one SQLite file (WAL mode); each table stores
+``(symbol TEXT PRIMARY KEY, cached_at REAL, payload BLOB)`` where payload is
+JSON via ``_json_io``.  The key column is named ``symbol`` because the
+yahoo_client tables were first; any string key works.
+
+sqlite3 connections may not cross threads and screeners fetch concurrently,
+so each thread keeps its own connection per database path.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from src.data._json_io import dumps, loads
+
+
+_local = threading.local()
+
+
+def connect(
+    path: Path,
+    tables: Iterable[str],
+    create: bool = True,
+    on_create: Optional[Callable[[sqlite3.Connection], None]] = None,
+) -> Optional[sqlite3.Connection]:
+    """Return this thread's connection to the cache DB at *path*.
+
+    Missing *tables* are created on first connect.  *on_create* runs once
+    when the file did not exist yet (e.g. to import a legacy cache).  With
+    ``create=False`` returns None instead of creating a missing DB, so that
+    reads never touch the filesystem beyond a stat().
+    """
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is not None:
+        return conn
+    is_new = not path.exists()
+    if not create and is_new:
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), isolation_level=None, timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for table in tables:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "symbol TEXT PRIMARY KEY, cached_at REAL NOT NULL, payload BLOB NOT NULL)"
+        )
+    if is_new and on_create is not None:
+        on_create(conn)
+    conns[path] = conn
+    return conn
+
+
+def get(conn: sqlite3.Connection, table: str, key: str, ttl_seconds: float) -> Optional[Any]:
+    """Return the cached payload for *key* if present and within *ttl_seconds*."""
+    try:
+        row = conn.execute(
+            f"SELECT cached_at, payload FROM {table} WHERE symbol = ?", (key,)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    cached_at, payload = row
+    if time.time() - cached_at > ttl_seconds:
+        return None
+    try:
+        return loads(payload)
+    except (ValueError, TypeError):
+        return None
+
+
+def put(conn: sqlite3.Connection, table: str, key: str, data: Any) -> None:
+    """Insert or replace the payload for *key* stamped with the current time."""
+    conn.execute(
+        f"INSERT OR REPLACE INTO {table} (symbol, cached_at, payload) VALUES (?, ?, ?)",
+        (key, time.time(), dumps(data)),
+    )
@@ -59,6 +59,7 @@ from src.data.graph_query.proactive import (  # noqa: F401
     get_last_health_check_date,
     get_old_thesis_notes,
     get_concern_notes,
+    get_proactive_snapshot,
 )
 
 # --- nl_query.py: Natural language → graph query dispatcher (KIK-409, KIK-517) ---
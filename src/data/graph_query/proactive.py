@@ -29,6 +29,21 @@ def get_last_health_check_date() -> Optional[str]:
         return None
 
 
+def _thesis_rows_to_notes(rows, older_than_days: int) -> list[dict]:
+    """Convert {symbol, note_date} rows into {symbol, days_old} dicts."""
+    from datetime import date
+    today = date.today()
+    out = []
+    for r in rows:
+        note_date = r["note_date"] or ""
+        days_old = (
+            (today - date.fromisoformat(note_date)).days
+            if note_date else older_than_days
+        )
+        out.append({"symbol": r["symbol"], "days_old": days_old})
+    return out
+
+
 def get_old_thesis_notes(older_than_days: int = 90) -> list[dict]:
     """Return thesis notes older than N days (KIK-435).
 
@@ -47,33 +62,37 @@ def get_old_thesis_notes(older_than_days: int = 90) -> list[dict]:
                     "ORDER BY n.date ASC LIMIT 3",
                     since=since,
                 )
-                out = []
-                for r in result:
-                    note_date = r["note_date"] or ""
-                    days_old = (
-                        (date.today() - date.fromisoformat(note_date)).days
-                        if note_date else older_than_days
-                    )
-                    out.append({"symbol": r["symbol"], "days_old": days_old})
+                out = _thesis_rows_to_notes(result, older_than_days)
                 if out:
                     return out
         except Exception:
             pass
-    # JSON fallback
+    return _json_old_thesis_notes(older_than_days)
+
+
+def _json_old_thesis_notes(older_than_days: int) -> list[dict]:
+    """JSON (note_manager) fallback for get_old_thesis_notes."""
+    from datetime import date, timedelta
     try:
         from src.data.note_manager import load_notes
         notes = load_notes(note_type="thesis")
-        cutoff = (date.today() - timedelta(days=older_than_days)).isoformat()
+        today = date.today()
+        cutoff = (today - timedelta(days=older_than_days)).isoformat()
         out = []
+        # ISO strings compare like dates: filter on the string and parse
+        # only the (at most 3) notes that are returned
         for n in notes:
-            if n.get("date", "") <= cutoff:
-                note_date = n.get("date", "")
-                days_old = (
-                    (date.today() - date.fromisoformat(note_date)).days
-                    if note_date else older_than_days
-                )
-                out.append({"symbol": n.get("symbol", ""), "days_old": days_old})
-        return out[:3]
+            note_date = n.get("date", "")
+            if note_date > cutoff:
+                continue
+            days_old = (
+                (today - date.fromisoformat(note_date)).days
+                if note_date else older_than_days
+            )
+            out.append({"symbol": n.get("symbol", ""), "days_old": days_old})
+            if len(out) == 3:
+                break
+        return out
     except Exception:
         return []
 
@@ -98,3 +117,72 @@ def get_concern_notes(limit: int = 1) -> list[dict]:
         return out
     except Exception:
         return []
+
+
+# One round-trip for the Neo4j-backed proactive triggers.  Each CALL
+# aggregates to exactly one row, so an empty subquery never drops the others.
+_SNAPSHOT_CYPHER = (
+    "CALL { OPTIONAL MATCH (h:HealthCheck) RETURN max(h.date) AS last_hc } "
+    "CALL { MATCH (n:Note {type: 'thesis'}) WHERE n.date <= $since "
+    "  WITH n ORDER BY n.date ASC LIMIT 3 "
+    "  RETURN collect({symbol: n.symbol, note_date: n.date}) AS thesis } "
+    "CALL { MATCH (:MarketContext)-[:HAS_EVENT]->(e:UpcomingEvent) "
+    "  WHERE e.date >= $today AND e.date <= $until "
+    "  WITH e ORDER BY e.date LIMIT $event_limit "
+    "  RETURN collect({date: e.date, text: e.text}) AS events } "
+    "CALL { MATCH (sc:Screen)-[:SURFACED]->(s:Stock) "
+    "  WHERE NOT exists { MATCH (:Trade)-[:BOUGHT]->(s) } "
+    "  WITH s.symbol AS symbol, count(sc) AS cnt, max(sc.date) AS last_date "
+    "  WHERE cnt >= $min_count "
+    "  WITH symbol, cnt, last_date ORDER BY cnt DESC, last_date DESC "
+    "  RETURN collect({symbol: symbol, count: cnt, last_date: last_date}) AS picks } "
+    "RETURN last_hc, thesis, events, picks"
+)
+
+
+def get_proactive_snapshot(
+    older_than_days: int = 90,
+    within_days: int = 7,
+    min_count: int = 3,
+    event_limit: int = 10,
+) -> Optional[dict]:
+    """Fetch the Neo4j inputs of the proactive time/state triggers at once.
+
+    Same results as get_last_health_check_date(), get_old_thesis_notes(),
+    get_upcoming_events(within_days=...) and get_recurring_picks(), but in a
+    single Cypher round-trip.  Thesis notes still fall back to JSON when the
+    graph has none.  Returns None when Neo4j is unavailable or the query
+    fails, so callers can fall back to the individual queries.
+
+    Returns dict with keys: last_health_check_date, old_thesis_notes,
+    upcoming_events, recurring_picks.
+    """
+    from datetime import date, timedelta
+    driver = _common._get_driver()
+    if driver is None:
+        return None
+    today = date.today()
+    try:
+        with driver.session() as session:
+            record = session.run(
+                _SNAPSHOT_CYPHER,
+                since=(today - timedelta(days=older_than_days)).isoformat(),
+                today=today.isoformat(),
+                until=(today + timedelta(days=within_days)).isoformat(),
+                min_count=min_count,
+                event_limit=event_limit,
+            ).single()
+        if record is None:
+            return None
+        thesis = _thesis_rows_to_notes(record["thesis"], older_than_days)
+        snapshot = {
+            "last_health_check_date": record["last_hc"],
+            "old_thesis_notes": thesis,
+            "upcoming_events": [dict(e) for e in record["events"]],
+            "recurring_picks": [dict(p) for p in record["picks"]],
+        }
+    except Exception:
+        return None
+    if not thesis:
+        snapshot["old_thesis_notes"] = _json_old_thesis_notes(older_than_days)
+    return snapshot
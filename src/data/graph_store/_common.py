@@ -114,9 +114,12 @@ def close():
 # Helpers
 # ---------------------------------------------------------------------------
 
+_SAFE_ID_RE = re.compile(r"[^a-zA-Z0-9]")
+
+
 def _safe_id(text: str) -> str:
     """Make text safe for use in a node ID (replace non-alphanum with _)."""
-    return re.sub(r"[^a-zA-Z0-9]", "_", text)
+    return _SAFE_ID_RE.sub("_", text)
 
 
 def _truncate(text: str, max_len: int = 500) -> str:
@@ -9,29 +9,108 @@ Graceful degradation: no-op when API key is unset, Neo4j is unreachable,
 or any exception occurs.
 """
 
-import json
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv(Path(__file__).resolve().parents[2] / ".env")
 
 
 _API_URL = "https://api.anthropic.com/v1/messages"
 _MODEL = "claude-haiku-4-5-20251001"
-_SUPPORTED_REL_TYPES = {"INFLUENCES", "CONTRADICTS", "CONTEXT_OF", "INFORMS", "SUPPORTS"}
+_SUPPORTED_REL_TYPES = frozenset({"INFLUENCES", "CONTRADICTS", "CONTEXT_OF", "INFORMS", "SUPPORTS"})
 _CONFIDENCE_THRESHOLD = 0.6
 _MAX_CANDIDATES = 10
 _LLM_TIMEOUT = 20  # seconds
+# Concurrent LLM calls in link_many (matches the session pool size)
+_LINK_MAX_WORKERS = int(os.environ.get("LINK_MAX_WORKERS", "4"))
+
+# Static text is fixed at import; only {node_desc} / {cands_text} vary per call.
+_PROMPT_TEMPLATE = (
+    "あなたは投資知識グラフのリレーション判定エンジンです。\n\n"
+    "## 新ノード\n{node_desc}\n\n"
+    "## 既存ノード候補\n{cands_text}\n\n"
+    "## タスク\n"
+    "新ノードと各候補の意味的関係を判定してください。\n"
+    f"confidence が {_CONFIDENCE_THRESHOLD} 未満の関係は含めない。"
+    "関係がない場合は [] を返す。\n\n"
+    "## 関係種別\n"
+    "- INFLUENCES: 新ノードが既存ノードの価値・見通しに直接影響する\n"
+    "- CONTRADICTS: 新ノードが既存ノードの投資テーゼと矛盾する\n"
+    "- CONTEXT_OF: 新ノードが既存ノードを解釈するコンテキストになる\n"
+    "- INFORMS: 新ノードが既存ノードの判断材料を提供する\n"
+    "- SUPPORTS: 新ノードが既存ノードの投資テーゼを支持する\n\n"
+    "## 出力形式（JSON配列のみ、説明・コードブロック不要）\n"
+    '[{{"rel_type":"INFLUENCES","to_id":"candidate_0","confidence":0.85,"reason":"理由"}}]'
+)
+
+# Raw LLM link responses, keyed by prompt hash.  Judgements depend only on
+# the prompt; 7 days covers re-imports and retries after a failed Neo4j write.
+_LINK_CACHE_PATH = Path(__file__).resolve().parents[3] / "data" / "cache" / "llm_link.sqlite"
+_LINK_CACHE_TABLES = ("llm_link",)
+_LINK_CACHE_TTL_SECONDS = 7 * 86400.0
+
+# link_report / link_note / link_research run back to back in a session;
+# one keep-alive Session avoids a TLS handshake per call.
+_SESSION: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Return the shared Anthropic API session (created on first use)."""
+    global _SESSION
+    if _SESSION is None:
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        _SESSION = session
+    return _SESSION
+
 
+@lru_cache(maxsize=2)
+def _headers(api_key: str) -> dict:
+    """Request headers for *api_key* (built once per key)."""
+    return {
+        "x-api-key": api_key,
+        "anthropic-version": "2023-06-01",
+        "content-type": "application/json",
+    }
 
+
+from src.data import _sqlite_cache  # noqa: E402
+from src.data._json_io import loads  # noqa: E402
 from src.data.graph_store._common import _safe_id  # noqa: E402 (KIK-507: dedup)
 
 
+def _read_link_cache(key: str) -> Optional[str]:
+    """Read a cached LLM link response if still valid (7d TTL)."""
+    conn = _sqlite_cache.connect(_LINK_CACHE_PATH, _LINK_CACHE_TABLES, create=False)
+    if conn is None:
+        return None
+    data = _sqlite_cache.get(conn, "llm_link", key, _LINK_CACHE_TTL_SECONDS)
+    return data.get("raw") if data else None
+
+
+def _write_link_cache(key: str, raw: str) -> None:
+    """Write an LLM link response to the cache."""
+    conn = _sqlite_cache.connect(_LINK_CACHE_PATH, _LINK_CACHE_TABLES)
+    _sqlite_cache.put(conn, "llm_link", key, {"raw": raw})
+
+
 # ---------------------------------------------------------------------------
 # AIGraphLinker
 # ---------------------------------------------------------------------------
@@ -66,42 +145,65 @@ class AIGraphLinker:
         if not self.is_available() or not candidates:
             return []
         prompt = self._build_prompt(new_node, candidates[:_MAX_CANDIDATES])
-        raw = self._call_llm(prompt)
+        raw = self._cached_llm(prompt)
         if not raw:
             return []
         return self._parse_relationships(raw, candidates[:_MAX_CANDIDATES])
 
+    def _cached_llm(self, prompt: str) -> str:
+        """_call_llm with a disk cache keyed by the prompt hash.
+
+        Replays of the same node/candidates (re-imports, retries after a
+        failed Neo4j write) skip the API call.  Failed calls ('') are not
+        cached; cache errors fall through to the API.
+        """
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        try:
+            cached = _read_link_cache(key)
+        except Exception:
+            cached = None
+        if cached:
+            return cached
+        raw = self._call_llm(prompt)
+        if raw:
+            try:
+                _write_link_cache(key, raw)
+            except Exception:
+                pass
+        return raw
+
+    def link_many(
+        self,
+        items: list[tuple[dict, list[dict]]],
+        max_workers: Optional[int] = None,
+    ) -> list[list[dict]]:
+        """Run :meth:`link_on_save` for many (new_node, candidates) pairs.
+
+        The LLM round-trips are I/O bound, so they are issued concurrently
+        over the shared keep-alive session.  Results are in input order.
+        """
+        if not items:
+            return []
+        if not self.is_available():
+            return [[] for _ in items]
+        workers = min(max_workers or _LINK_MAX_WORKERS, len(items))
+        if workers <= 1:
+            return [self.link_on_save(node, cands) for node, cands in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.link_on_save(*item), items))
+
     def _build_prompt(self, new_node: dict, candidates: list[dict]) -> str:
         """Build the relationship detection prompt."""
         node_type = new_node.get("type", "Node")
         target = new_node.get("target") or new_node.get("symbol") or ""
         description = (new_node.get("summary") or new_node.get("content") or "")[:300]
-        node_desc = f"種別: {node_type}\n対象: {target}\n内容要約: {description}"
-
-        cand_lines = []
-        for i, c in enumerate(candidates):
-            ctype = c.get("type", "?")
-            cid = c.get("id", "?")
-            csummary = str(c.get("summary") or c.get("content") or c.get("verdict") or "")[:200]
-            cand_lines.append(f"[candidate_{i}] {ctype} ({cid}): {csummary}")
-        cands_text = "\n".join(cand_lines)
-
-        return (
-            "あなたは投資知識グラフのリレーション判定エンジンです。\n\n"
-            f"## 新ノード\n{node_desc}\n\n"
-            f"## 既存ノード候補\n{cands_text}\n\n"
-            "## タスク\n"
-            "新ノードと各候補の意味的関係を判定してください。\n"
-            f"confidence が {_CONFIDENCE_THRESHOLD} 未満の関係は含めない。"
-            "関係がない場合は [] を返す。\n\n"
-            "## 関係種別\n"
-            "- INFLUENCES: 新ノードが既存ノードの価値・見通しに直接影響する\n"
-            "- CONTRADICTS: 新ノードが既存ノードの投資テーゼと矛盾する\n"
-            "- CONTEXT_OF: 新ノードが既存ノードを解釈するコンテキストになる\n"
-            "- INFORMS: 新ノードが既存ノードの判断材料を提供する\n"
-            "- SUPPORTS: 新ノードが既存ノードの投資テーゼを支持する\n\n"
-            "## 出力形式（JSON配列のみ、説明・コードブロック不要）\n"
-            '[{"rel_type":"INFLUENCES","to_id":"candidate_0","confidence":0.85,"reason":"理由"}]'
+        return _PROMPT_TEMPLATE.format(
+            node_desc=f"種別: {node_type}\n対象: {target}\n内容要約: {description}",
+            cands_text="\n".join(
+                f"[candidate_{i}] {c.get('type', '?')} ({c.get('id', '?')}): "
+                f"{str(c.get('summary') or c.get('content') or c.get('verdict') or '')[:200]}"
+                for i, c in enumerate(candidates)
+            ),
         )
 
     def _call_llm(self, prompt: str, timeout: int = _LLM_TIMEOUT) -> str:
@@ -110,17 +212,15 @@ class AIGraphLinker:
         if not api_key:
             return ""
         try:
-            headers = {
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            }
             payload = {
                 "model": _MODEL,
                 "max_tokens": 512,
                 "messages": [{"role": "user", "content": prompt}],
             }
-            resp = requests.post(_API_URL, headers=headers, json=payload, timeout=timeout)
+            resp = _get_session().post(
+                _API_URL, headers=_headers(api_key), json=payload,
+                timeout=timeout, stream=False,
+            )
             if resp.status_code != 200:
                 return ""
             data = resp.json()
@@ -139,37 +239,35 @@ class AIGraphLinker:
         if start == -1 or end == -1 or end < start:
             return []
         try:
-            items = json.loads(raw[start:end + 1])
-        except (json.JSONDecodeError, ValueError):
+            items = loads(raw[start:end + 1])
+        except ValueError:
             return []
         if not isinstance(items, list):
             return []
 
+        # "candidate_N" index → node id, built once for all relationships
+        id_map = [c.get("id") for c in candidates]
+        n_ids = len(id_map)
+
         result = []
         for item in items:
             if not isinstance(item, dict):
                 continue
             rel_type = item.get("rel_type", "")
-            candidate_ref = str(item.get("to_id", ""))
+            if rel_type not in _SUPPORTED_REL_TYPES:
+                continue
             try:
                 confidence = float(item.get("confidence", 0))
             except (TypeError, ValueError):
                 continue
-            reason = str(item.get("reason", ""))
-
-            if rel_type not in _SUPPORTED_REL_TYPES:
-                continue
             if confidence < _CONFIDENCE_THRESHOLD:
                 continue
 
-            # Map "candidate_N" → actual node id
-            to_id = None
-            if candidate_ref.startswith("candidate_"):
-                idx_str = candidate_ref[len("candidate_"):]
-                if idx_str.isdigit():
-                    idx = int(idx_str)
-                    if 0 <= idx < len(candidates):
-                        to_id = candidates[idx].get("id")
+            prefix, _, idx_str = str(item.get("to_id", "")).rpartition("_")
+            if prefix != "candidate" or not idx_str.isdigit():
+                continue
+            idx = int(idx_str)
+            to_id = id_map[idx] if idx < n_ids else None
             if not to_id:
                 continue
 
@@ -177,7 +275,7 @@ class AIGraphLinker:
                 "rel_type": rel_type,
                 "to_id": to_id,
                 "confidence": confidence,
-                "reason": reason,
+                "reason": str(item.get("reason", "")),
             })
         return result
 
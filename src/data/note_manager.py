@@ -5,17 +5,29 @@ attached to specific stocks or to categories (portfolio, market, general).
 The JSON file is the master; Neo4j is a view.
 """
 
-import json
-import uuid
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
+from src.data._json_io import JSONDecodeError, dump_file, load_file
+
 
 _NOTES_DIR = "data/notes"
 _VALID_TYPES = {"thesis", "observation", "concern", "review", "target", "lesson", "journal"}
 _VALID_CATEGORIES = {"stock", "portfolio", "market", "general"}
 
+# Note id suffix: 32 random bits like uuid4().hex[:8], from a private PRNG
+# (seeded from os.urandom once) instead of an urandom call per note.
+_ID_RNG = random.Random()
+
+# KIK-434 AI linking is a 1-2s LLM round-trip and best-effort, so it runs
+# off the save path.  concurrent.futures joins these workers at interpreter
+# exit, so CLI runs still finish linking before the process ends.
+_LINK_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="note-link")
+
 
 def _notes_dir(base_dir: str = _NOTES_DIR) -> Path:
     d = Path(base_dir)
@@ -82,11 +94,11 @@ def save_note(
 
     # Build ID and filename based on symbol or category
     if symbol:
-        note_id = f"note_{today}_{symbol}_{uuid.uuid4().hex[:8]}"
+        note_id = f"note_{today}_{symbol}_{_ID_RNG.getrandbits(32):08x}"
         safe_symbol = symbol.replace(".", "_").replace("/", "_")
         filename = f"{today}_{safe_symbol}_{note_type}.json"
     else:
-        note_id = f"note_{today}_{resolved_category}_{uuid.uuid4().hex[:8]}"
+        note_id = f"note_{today}_{resolved_category}_{_ID_RNG.getrandbits(32):08x}"
         filename = f"{today}_{resolved_category}_{note_type}.json"
 
     note = {
@@ -126,65 +138,198 @@ def save_note(
     existing = []
     if path.exists():
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_file(path)
             existing = data if isinstance(data, list) else [data]
-        except (json.JSONDecodeError, OSError):
+        except (JSONDecodeError, OSError):
             existing = []
 
     existing.append(note)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(existing, f, ensure_ascii=False, indent=2)
+    dump_file(existing, path)
 
     # 2. Write to Neo4j (view) -- graceful degradation
     try:
-        from src.data.graph_store import merge_note
-        from src.data.history_store import _build_embedding
-        sem_summary, emb = _build_embedding(
-            "note", symbol=symbol or "", note_type=note_type, content=content,
-            trigger=note.get("trigger", ""),
-            expected_action=note.get("expected_action", ""),
-        )
-        merge_note(
-            note_id=note_id,
-            note_date=today,
-            note_type=note_type,
-            content=content,
-            symbol=symbol or None,
-            source=source,
-            category=resolved_category,
-            semantic_summary=sem_summary,
-            embedding=emb,
-        )
-        # KIK-473: Create ABOUT relationships for detected symbols in journal notes
-        if detected_symbols:
-            from src.data.graph_store import _get_mode, _get_driver
-            if _get_mode() != "off":
-                driver = _get_driver()
-                if driver is not None:
-                    with driver.session() as session:
-                        for ds in detected_symbols:
-                            session.run(
-                                "MATCH (n:Note {id: $note_id}) "
-                                "MERGE (s:Stock {symbol: $symbol}) "
-                                "MERGE (n)-[:ABOUT]->(s)",
-                                note_id=note_id, symbol=ds,
-                            )
+        _write_note_graph(note, detected_symbols)
     except Exception:
         pass  # Neo4j unavailable, JSON is the master
 
-    # KIK-434: AI graph linking (graceful degradation)
+    # KIK-434: AI graph linking (graceful degradation, background)
+    link_symbols = detected_symbols or [symbol]
+    try:
+        _LINK_EXECUTOR.submit(_link_note_background, note_id, link_symbols, note_type, content)
+    except RuntimeError:  # executor already shut down (interpreter exit)
+        _link_note_background(note_id, link_symbols, note_type, content)
+
+    return note
+
+
+def _write_note_graph(note: dict, detected_symbols: list[str]) -> None:
+    """Merge *note* into Neo4j with its embedding and ABOUT relationships.
+
+    Checks the write mode first: ``_get_mode()`` caches reachability for
+    ``_MODE_TTL`` seconds (KIK-413), so while Neo4j is down a save skips
+    the embedding request and connection attempt instead of paying for
+    them every time.
+    """
+    from src.data.graph_store import _get_driver, _get_mode, merge_note
+    if _get_mode() == "off":
+        return
+    from src.data.history_store import _build_embedding
+    symbol = note["symbol"]
+    sem_summary, emb = _build_embedding(
+        "note", symbol=symbol, note_type=note["type"], content=note["content"],
+        trigger=note.get("trigger", ""),
+        expected_action=note.get("expected_action", ""),
+    )
+    merge_note(
+        note_id=note["id"],
+        note_date=note["date"],
+        note_type=note["type"],
+        content=note["content"],
+        symbol=symbol or None,
+        source=note["source"],
+        category=note["category"],
+        semantic_summary=sem_summary,
+        embedding=emb,
+    )
+    # KIK-473: Create ABOUT relationships for detected symbols in journal notes
+    if detected_symbols:
+        driver = _get_driver()
+        if driver is not None:
+            with driver.session() as session:
+                for ds in detected_symbols:
+                    session.run(
+                        "MATCH (n:Note {id: $note_id}) "
+                        "MERGE (s:Stock {symbol: $symbol}) "
+                        "MERGE (n)-[:ABOUT]->(s)",
+                        note_id=note["id"], symbol=ds,
+                    )
+
+
+def _link_note_background(
+    note_id: str,
+    symbols: list[Optional[str]],
+    note_type: str,
+    content: str,
+) -> None:
+    """Run link_note for each symbol, swallowing all errors."""
     try:
         from src.data.graph_linker import link_note
-        if detected_symbols:
-            for ds in detected_symbols:
-                link_note(note_id, ds, note_type, content)
-        else:
-            link_note(note_id, symbol, note_type, content)
+        for sym in symbols:
+            link_note(note_id, sym, note_type, content)
     except Exception:
         pass
 
-    return note
+
+# ---------------------------------------------------------------------------
+# Notes index: per-file metadata so load_notes only opens files that match
+# ---------------------------------------------------------------------------
+
+# No .json suffix so that glob("*.json") readers (e.g. init_graph) skip it
+_INDEX_NAME = ".notes_index"
+_INDEX_VERSION = 1
+_INDEX_META_KEYS = ("id", "date", "symbol", "category", "type")
+# notes dir -> (index file mtime_ns, files); skips re-parsing an unchanged index
+_INDEX_CACHE: dict[str, tuple[int, dict]] = {}
+
+
+def _matches(
+    note: dict,
+    symbol: Optional[str],
+    note_type: Optional[str],
+    category: Optional[str],
+) -> bool:
+    return (
+        (not symbol or note.get("symbol") == symbol)
+        and (not note_type or note.get("type") == note_type)
+        and (not category or note.get("category") == category)
+    )
+
+
+def _read_index(d: Path) -> dict:
+    """Return the indexed ``{filename: record}`` map, or {} if absent/invalid."""
+    path = d / _INDEX_NAME
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    key = str(d)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        data = load_file(path)
+    except (JSONDecodeError, OSError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+        return {}
+    files = data.get("files") or {}
+    _INDEX_CACHE[key] = (mtime, files)
+    return files
+
+
+def _write_index(d: Path, files: dict) -> None:
+    """Atomically replace the index file (best effort)."""
+    path = d / _INDEX_NAME
+    tmp = d / f"{_INDEX_NAME}.tmp"
+    try:
+        dump_file({"version": _INDEX_VERSION, "files": files}, tmp, indent=False)
+        os.replace(tmp, path)
+        _INDEX_CACHE[str(d)] = (path.stat().st_mtime_ns, files)
+    except OSError:
+        pass
+
+
+def _scan_index(d: Path) -> tuple[dict, dict]:
+    """Bring the index up to date with the note files in *d*.
+
+    Each file is validated by (mtime_ns, size) from a single scandir pass;
+    only new or modified files are parsed.  Manual edits and files written
+    by older versions are therefore picked up without a full rescan.
+
+    Returns ``(files, fresh)`` where *files* maps filename to
+    ``{"mtime_ns", "size", "notes": [metadata...]}`` and *fresh* holds the
+    full notes of files parsed during this call (so they are not re-read).
+    """
+    old = _read_index(d)
+    files: dict[str, dict] = {}
+    fresh: dict[str, list] = {}
+    changed = False
+    with os.scandir(d) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".json"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            rec = old.get(name)
+            if (
+                isinstance(rec, dict)
+                and isinstance(rec.get("notes"), list)
+                and rec.get("mtime_ns") == st.st_mtime_ns
+                and rec.get("size") == st.st_size
+            ):
+                files[name] = rec
+                continue
+            try:
+                data = load_file(entry.path)
+                notes = data if isinstance(data, list) else [data]
+            except (JSONDecodeError, OSError):
+                notes = []  # indexed as empty until the file changes
+            fresh[name] = notes
+            files[name] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "notes": [
+                    {k: n.get(k) for k in _INDEX_META_KEYS}
+                    for n in notes if isinstance(n, dict)
+                ],
+            }
+            changed = True
+    if changed or len(files) != len(old):
+        _write_index(d, files)
+    return files, fresh
 
 
 def load_notes(
@@ -195,6 +340,10 @@ def load_notes(
 ) -> list[dict]:
     """Load notes from JSON files.
 
+    A hidden ``.notes_index`` file in *base_dir* records each file's notes'
+    id/date/symbol/category/type, so filtered loads open only the files
+    that contain a match.
+
     Parameters
     ----------
     symbol : str, optional
@@ -215,23 +364,23 @@ def load_notes(
     if not d.exists():
         return []
 
+    files, fresh = _scan_index(d)
     all_notes = []
-    for fp in d.glob("*.json"):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            notes = data if isinstance(data, list) else [data]
-            all_notes.extend(notes)
-        except (json.JSONDecodeError, OSError):
+    for name, rec in files.items():
+        # Skip files whose indexed notes cannot match (no open/parse)
+        if not any(_matches(m, symbol, note_type, category) for m in rec["notes"]):
             continue
-
-    # Filter
-    if symbol:
-        all_notes = [n for n in all_notes if n.get("symbol") == symbol]
-    if note_type:
-        all_notes = [n for n in all_notes if n.get("type") == note_type]
-    if category:
-        all_notes = [n for n in all_notes if n.get("category") == category]
+        notes = fresh.get(name)
+        if notes is None:
+            try:
+                data = load_file(d / name)
+            except (JSONDecodeError, OSError):
+                continue
+            notes = data if isinstance(data, list) else [data]
+        all_notes.extend(
+            n for n in notes
+            if isinstance(n, dict) and _matches(n, symbol, note_type, category)
+        )
 
     # Sort by date descending
     all_notes.sort(key=lambda n: n.get("date", ""), reverse=True)
@@ -244,28 +393,36 @@ def delete_note(
 ) -> bool:
     """Delete a note by ID from JSON files.
 
+    The notes index locates the file holding *note_id*, so only that file
+    is opened and rewritten.
+
     Returns True if found and deleted.
     """
     d = Path(base_dir)
     if not d.exists():
         return False
 
+    files, _ = _scan_index(d)
+    candidates = [
+        name for name, rec in files.items()
+        if any(m.get("id") == note_id for m in rec["notes"])
+    ]
+
     found = False
-    for fp in d.glob("*.json"):
+    for name in candidates:
+        fp = d / name
         try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_file(fp)
             notes = data if isinstance(data, list) else [data]
             filtered = [n for n in notes if n.get("id") != note_id]
             if len(filtered) < len(notes):
                 if filtered:
-                    with open(fp, "w", encoding="utf-8") as f:
-                        json.dump(filtered, f, ensure_ascii=False, indent=2)
+                    dump_file(filtered, fp)
                 else:
                     fp.unlink()
                 found = True
                 break
-        except (json.JSONDecodeError, OSError):
+        except (JSONDecodeError, OSError):
             continue
 
     # Delete from Neo4j (view) -- graceful degradation
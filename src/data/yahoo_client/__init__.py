@@ -1,10 +1,17 @@
-"""Yahoo Finance API wrapper with JSON file-based caching (KIK-449).
+"""Yahoo Finance API wrapper with SQLite-backed caching (KIK-449).
 
 This package was split from a single yahoo_client.py module into submodules
 for maintainability.  All public and internal symbols are re-exported here
 so that existing imports (``from src.data import yahoo_client``,
 ``from src.data.yahoo_client import get_stock_info``, etc.) continue to work
 without changes.
+
+HTTP connections: every call goes through yfinance, whose ``YfData``
+singleton owns one curl_cffi session (cookie/crumb + browser
+impersonation) shared by all tickers, screens and threads.  Connections
+are therefore already kept alive across markets; do not pass a
+``requests.Session`` to yfinance, as Yahoo rejects non-impersonated
+clients more often and caching sessions are refused outright.
 """
 
 # -- Re-export submodules so that patch paths like
@@ -17,10 +24,9 @@ import yfinance as yf  # noqa: F401  (used by test patches)
 from src.data.yahoo_client._cache import (  # noqa: F401
     CACHE_DIR,
     CACHE_TTL_HOURS,
-    _cache_path,
+    _db_path,
     _read_cache,
     _write_cache,
-    _detail_cache_path,
     _read_detail_cache,
     _write_detail_cache,
 )
@@ -45,6 +51,9 @@ from src.data.yahoo_client.detail import (  # noqa: F401
 # -- Screening --
 from src.data.yahoo_client.screen import screen_stocks  # noqa: F401
 
+# -- Batched prefetch for symbol-list screening --
+from src.data.yahoo_client.batch import batch_quote  # noqa: F401
+
 # -- Price history & news --
 from src.data.yahoo_client.history import (  # noqa: F401
     get_price_history,
@@ -70,6 +79,7 @@ __all__ = [
     "get_stock_info",
     "get_multiple_stocks",
     "get_stock_detail",
+    "batch_quote",
     "screen_stocks",
     "get_price_history",
     "get_stock_news",
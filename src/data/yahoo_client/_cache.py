@@ -1,76 +1,165 @@
-"""Cache helpers for yahoo_client (KIK-449)."""
-
-import json
-from datetime import datetime, timedelta
+"""Cache helpers for yahoo_client (KIK-449).
+
+Cached payloads live in a single SQLite file (``CACHE_DIR/cache.sqlite``,
+WAL mode) rather than one JSON file per symbol, so a 500-symbol screen is
+500 indexed lookups on one connection instead of 500 open/parse cycles.
+
+Tables (same schema: symbol, cached_at epoch, JSON payload):
+  cache    -- get_stock_info            (24h TTL)
+  detail   -- get_stock_detail          (24h TTL)
+  history  -- get_price_history, keyed "SYMBOL:period"  (1h TTL)
+  macro    -- get_macro_indicators, single "all" row    (1h TTL)
+  news     -- get_stock_news, keyed "SYMBOL:count"      (10min TTL)
+"""
+
+import sqlite3
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Optional
+
+from src.data import _sqlite_cache
+from src.data._json_io import dumps, loads
 
 
 CACHE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data" / "cache"
 CACHE_TTL_HOURS = 24
 
+# Shorter than CACHE_TTL_HOURS: prices move intra-day, but re-running a
+# report within the hour should not hit Yahoo again.
+HISTORY_CACHE_TTL_HOURS = 1
+
+# Macro closes move once a day and news every few minutes; these only
+# spare repeated fetches within one research session.
+MACRO_CACHE_TTL_HOURS = 1
+NEWS_CACHE_TTL_MINUTES = 10
+
+_CACHE_TTL_SECONDS = CACHE_TTL_HOURS * 3600.0
+_HISTORY_TTL_SECONDS = HISTORY_CACHE_TTL_HOURS * 3600.0
+_MACRO_TTL_SECONDS = MACRO_CACHE_TTL_HOURS * 3600.0
+_NEWS_TTL_SECONDS = NEWS_CACHE_TTL_MINUTES * 60.0
+
+_DB_NAME = "cache.sqlite"
+_TABLES = ("cache", "detail", "history", "macro", "news")
+
+
+def _db_path() -> Path:
+    """Return the SQLite cache file path."""
+    return CACHE_DIR / _DB_NAME
+
+
+def _db(create: bool = True) -> Optional[sqlite3.Connection]:
+    """Return this thread's connection to the cache DB.
+
+    With ``create=False`` returns None instead of creating a missing DB, so
+    that reads never touch the filesystem beyond a stat().
+    """
+    return _sqlite_cache.connect(
+        _db_path(), _TABLES, create=create, on_create=_import_legacy_json,
+    )
+
+
+def _import_legacy_json(conn: sqlite3.Connection) -> None:
+    """Carry still-valid pre-SQLite JSON cache files into a new database.
+
+    Older versions wrote ``<SYMBOL>.json`` / ``<SYMBOL>_detail.json`` with an
+    ISO-8601 ``_cached_at``; it is parsed here once and stored as an epoch,
+    so reads never call fromisoformat.  Files are left in place.
+    """
+    now = time.time()
+    rows = []
+    for fp in CACHE_DIR.glob("*.json"):
+        if "_history_" in fp.stem:
+            continue
+        table = "detail" if fp.stem.endswith("_detail") else "cache"
+        try:
+            data = loads(fp.read_bytes())
+            cached_at = datetime.fromisoformat(data.pop("_cached_at")).timestamp()
+            symbol = data["symbol"]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            continue
+        if now - cached_at <= _CACHE_TTL_SECONDS:
+            rows.append((table, symbol, cached_at, dumps(data)))
+    for table, symbol, cached_at, payload in rows:
+        conn.execute(
+            f"INSERT OR REPLACE INTO {table} (symbol, cached_at, payload) VALUES (?, ?, ?)",
+            (symbol, cached_at, payload),
+        )
+
+
+def _get(table: str, key: str, ttl_seconds: float) -> Optional[dict]:
+    """Return the cached payload for *key* if present and within *ttl_seconds*."""
+    conn = _db(create=False)
+    if conn is None:
+        return None
+    return _sqlite_cache.get(conn, table, key, ttl_seconds)
+
 
-def _cache_path(symbol: str) -> Path:
-    """Return the cache file path for a given symbol."""
-    safe_name = symbol.replace(".", "_").replace("/", "_")
-    return CACHE_DIR / f"{safe_name}.json"
+def _put(table: str, key: str, data: dict) -> None:
+    """Insert or replace the payload for *key* stamped with the current time."""
+    _sqlite_cache.put(_db(), table, key, data)
 
 
 def _read_cache(symbol: str) -> Optional[dict]:
-    """Read cached data if it exists and is still valid."""
-    path = _cache_path(symbol)
-    if not path.exists():
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        cached_at = datetime.fromisoformat(data.get("_cached_at", ""))
-        if datetime.now() - cached_at > timedelta(hours=CACHE_TTL_HOURS):
-            return None
-        return data
-    except (json.JSONDecodeError, ValueError, KeyError):
-        return None
+    """Read cached stock info if it exists and is still valid (24h TTL)."""
+    return _get("cache", symbol, _CACHE_TTL_SECONDS)
 
 
 def _write_cache(symbol: str, data: dict) -> None:
-    """Write data to cache with a timestamp."""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    data["_cached_at"] = datetime.now().isoformat()
-    path = _cache_path(symbol)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """Write stock info to the cache."""
+    _put("cache", symbol, data)
 
 
 # ---------------------------------------------------------------------------
 # Detail cache helpers
 # ---------------------------------------------------------------------------
 
-def _detail_cache_path(symbol: str) -> Path:
-    """Return the detail-cache file path for a given symbol."""
-    safe_name = symbol.replace(".", "_").replace("/", "_")
-    return CACHE_DIR / f"{safe_name}_detail.json"
-
-
 def _read_detail_cache(symbol: str) -> Optional[dict]:
     """Read detail-cached data if it exists and is still valid (24h TTL)."""
-    path = _detail_cache_path(symbol)
-    if not path.exists():
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        cached_at = datetime.fromisoformat(data.get("_cached_at", ""))
-        if datetime.now() - cached_at > timedelta(hours=CACHE_TTL_HOURS):
-            return None
-        return data
-    except (json.JSONDecodeError, ValueError, KeyError):
-        return None
+    return _get("detail", symbol, _CACHE_TTL_SECONDS)
 
 
 def _write_detail_cache(symbol: str, data: dict) -> None:
-    """Write detail data to cache with a timestamp."""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    data["_cached_at"] = datetime.now().isoformat()
-    path = _detail_cache_path(symbol)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """Write detail data to the cache."""
+    _put("detail", symbol, data)
+
+
+# ---------------------------------------------------------------------------
+# Price-history cache helpers
+# ---------------------------------------------------------------------------
+
+def _read_history_cache(symbol: str, period: str) -> Optional[dict]:
+    """Read cached price-history payload if it exists and is still valid (1h TTL)."""
+    return _get("history", f"{symbol}:{period}", _HISTORY_TTL_SECONDS)
+
+
+def _write_history_cache(symbol: str, period: str, data: dict) -> None:
+    """Write a price-history payload to the cache."""
+    _put("history", f"{symbol}:{period}", data)
+
+
+# ---------------------------------------------------------------------------
+# Macro / news cache helpers (list payloads stored as {"items": [...]})
+# ---------------------------------------------------------------------------
+
+def _read_macro_cache() -> Optional[list]:
+    """Read cached macro indicators if still valid (1h TTL)."""
+    data = _get("macro", "all", _MACRO_TTL_SECONDS)
+    return data.get("items") if data else None
+
+
+def _write_macro_cache(items: list) -> None:
+    """Write macro indicators to the cache."""
+    _put("macro", "all", {"items": items})
+
+
+def _read_news_cache(symbol: str, count: int) -> Optional[list]:
+    """Read cached news items if still valid (10min TTL)."""
+    data = _get("news", f"{symbol}:{count}", _NEWS_TTL_SECONDS)
+    return data.get("items") if data else None
+
+
+def _write_news_cache(symbol: str, count: int, items: list) -> None:
+    """Write news items to the cache."""
+    _put("news", f"{symbol}:{count}", {"items": items})
+
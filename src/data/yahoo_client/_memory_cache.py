@@ -1,10 +1,11 @@
 """Thread-safe in-memory LRU cache with TTL (KIK-531).
 
 Provides short-lived caching (default 5 min) to avoid redundant API calls
-within a single screening session.  Two module-level singletons are exposed:
+within a single screening session.  Three module-level singletons are exposed:
 
     price_history_cache  – keyed by "SYMBOL:period"
     stock_detail_cache   – keyed by symbol
+    stock_info_cache     – keyed by symbol (in front of the SQLite cache)
 
 Environment variable ``MEMORY_CACHE_TTL`` (seconds) overrides the default TTL.
 Set it to ``0`` to disable in-memory caching entirely.
@@ -93,9 +94,12 @@ _default_ttl = float(_env_ttl) if _env_ttl is not None else 300.0
 
 price_history_cache = MemoryCache(maxsize=256, ttl_seconds=_default_ttl)
 stock_detail_cache = MemoryCache(maxsize=256, ttl_seconds=_default_ttl)
+# Sized for a full symbol-list screen (hundreds of symbols per market)
+stock_info_cache = MemoryCache(maxsize=4096, ttl_seconds=_default_ttl)
 
 
 def clear_memory_cache() -> None:
-    """Clear both singleton caches (useful for tests)."""
+    """Clear all singleton caches (useful for tests)."""
     price_history_cache.clear()
     stock_detail_cache.clear()
+    stock_info_cache.clear()
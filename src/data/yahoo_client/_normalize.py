@@ -1,5 +1,6 @@
 """Internal normalization and sanitization utilities (KIK-449)."""
 
+import math
 from typing import Any, Optional
 
 
@@ -10,7 +11,7 @@ def _safe_get(info: dict, key: str) -> Any:
         if value is None:
             return None
         # yfinance occasionally returns 'Infinity' or NaN
-        if isinstance(value, float) and (value != value or abs(value) == float("inf")):
+        if isinstance(value, float) and not math.isfinite(value):
             return None
         return value
     except Exception:
@@ -0,0 +1,104 @@
+"""Request spacing for Yahoo Finance calls.
+
+``throttle()`` replaces the unconditional ``time.sleep(1)`` before each
+request: it only sleeps for whatever is left of ``_MIN_INTERVAL`` since the
+previous request.  The first request, and requests that follow cache hits
+or slow processing, go out immediately; back-to-back requests are still
+spaced 1s apart.
+
+The limit is process-wide: every thread reserves the next free slot under
+one lock, so concurrent screeners, page fetches and markets together stay
+at 1 req/s instead of each thread keeping its own timer.  yfinance owns
+its curl_cffi session (see package docstring), so limiting is done here
+rather than in a custom session.
+
+``retry_transient`` retries a fetch that failed with a rate-limit (HTTP 429)
+or timeout error, backing off exponentially with jitter, so a single
+transient failure on a long run does not drop that symbol's data.
+"""
+
+import functools
+import random
+import re
+import threading
+import time
+from typing import Callable, TypeVar
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+
+    _TRANSIENT_ERRORS: tuple = (YFRateLimitError, TimeoutError)
+except ImportError:  # older yfinance without the typed exception
+    _TRANSIENT_ERRORS = (TimeoutError,)
+
+_MIN_INTERVAL = 1.0
+
+_RETRY_TRIES = 4
+_RETRY_BASE_DELAY = 2.0
+_RETRY_JITTER = (0.0, 2.0)
+
+# HTTP status at the start of a requests-style message ("429 Client Error: ...");
+# anchored so symbols/URLs containing "429" (e.g. 4293.T) do not match
+_HTTP_429_RE = re.compile(r"^429\b")
+
+# Monotonic time of the next free request slot, shared by all threads
+_lock = threading.Lock()
+_next_slot = 0.0
+
+T = TypeVar("T")
+
+
+def throttle(min_interval: float = _MIN_INTERVAL) -> None:
+    """Wait for the next process-wide request slot (*min_interval* apart).
+
+    The slot is reserved under the lock and the wait happens outside it,
+    so N threads calling at once are released *min_interval* apart.
+    """
+    global _next_slot
+    with _lock:
+        now = time.monotonic()
+        slot = max(now, _next_slot)
+        _next_slot = slot + min_interval
+    wait = slot - now
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """True for rate-limit / timeout errors worth retrying."""
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return True
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is not None:
+        return status == 429
+    msg = str(exc)
+    return "Too Many Requests" in msg or _HTTP_429_RE.match(msg) is not None
+
+
+def retry_transient(
+    tries: int = _RETRY_TRIES,
+    base_delay: float = _RETRY_BASE_DELAY,
+    jitter: tuple[float, float] = _RETRY_JITTER,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Retry the decorated call on transient errors, up to *tries* attempts.
+
+    Waits ``base_delay * 2**attempt + uniform(*jitter)`` seconds between
+    attempts (2-4s, 4-6s, 8-10s by default).  Other exceptions, and the last
+    transient one, propagate unchanged to the caller's error handling.
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            attempt = 0
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    attempt += 1
+                    if attempt >= tries or not _is_transient(e):
+                        raise
+                    delay = base_delay * 2 ** (attempt - 1) + random.uniform(*jitter)
+                    print(f"[yahoo_client] {e} -- retrying in {delay:.1f}s")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
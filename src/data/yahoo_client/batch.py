@@ -0,0 +1,49 @@
+"""Batched stock-info prefetch for symbol-list screening."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from src.data.yahoo_client.detail import get_stock_info
+
+# Every API fetch waits for the process-wide 1 req/s throttle; two workers
+# overlap one request's latency with the next slot, more would only queue.
+_MAX_WORKERS = int(os.environ.get("BATCH_QUOTE_MAX_WORKERS", "2"))
+
+
+def _fetch_chunk(chunk: list[str]) -> dict[str, Optional[dict]]:
+    """Fetch stock info for one chunk of symbols."""
+    return {symbol: get_stock_info(symbol) for symbol in chunk}
+
+
+def batch_quote(
+    symbols: list[str], batch_size: int = 20,
+) -> dict[str, Optional[dict]]:
+    """Prefetch ``get_stock_info`` for a whole symbol universe.
+
+    Symbols are de-duplicated, split into chunks of *batch_size* and the
+    chunks are fetched concurrently (I/O bound).  The returned dict can be
+    passed to ``ValueScreener.screen(prefetched=...)`` so that per-symbol
+    lookups become in-memory hits.
+
+    Yahoo's multi-symbol spark endpoint only returns price series, not the
+    fundamentals the screeners need, so each chunk still goes through
+    ``get_stock_info`` (and therefore its cache, the shared request throttle
+    and the 429/timeout retry).
+
+    Returns
+    -------
+    dict[str, dict | None]
+        symbol -> stock info (None on failure), in input order.
+    """
+    unique = list(dict.fromkeys(symbols))
+    if not unique:
+        return {}
+    size = max(1, batch_size)
+    chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+
+    fetched: dict[str, Optional[dict]] = {}
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(chunks))) as executor:
+        for part in executor.map(_fetch_chunk, chunks):
+            fetched.update(part)
+    return {symbol: fetched.get(symbol) for symbol in unique}
@@ -1,7 +1,6 @@
 """Stock info and detail fetching (KIK-449, KIK-531)."""
 
 import socket
-import time
 from typing import Any, Optional
 
 import pandas as pd
@@ -13,12 +12,13 @@ from src.data.yahoo_client._cache import (
     _read_detail_cache,
     _write_detail_cache,
 )
-from src.data.yahoo_client._memory_cache import stock_detail_cache
+from src.data.yahoo_client._memory_cache import stock_detail_cache, stock_info_cache
 from src.data.yahoo_client._normalize import (
     _normalize_ratio,
     _safe_get,
     _sanitize_anomalies,
 )
+from src.data.yahoo_client._rate_limit import retry_transient, throttle
 
 
 def _try_get_field(df: Any, field_names: list[str]) -> Optional[float]:
@@ -112,20 +112,37 @@ def _build_dividend_history_from_actions(
         return [], []
 
 
+def _cached_stock_info(symbol: str) -> Optional[dict]:
+    """Return stock info from memory, then the disk cache (no API call)."""
+    cached = stock_info_cache.get(symbol)
+    if cached is None:
+        cached = _read_cache(symbol)
+        if cached is not None:
+            stock_info_cache.set(symbol, cached)
+    return cached
+
+
+@retry_transient()
+def _fetch_info(symbol: str) -> dict:
+    """``Ticker.info`` behind the shared throttle, retried on 429/timeouts."""
+    throttle()
+    return yf.Ticker(symbol).info
+
+
 def get_stock_info(symbol: str) -> Optional[dict]:
     """Fetch basic stock information for a single symbol.
 
     Returns a dict with standardized keys, or None if the fetch fails entirely.
     Individual fields that are unavailable are set to None.
+    Uses memory → disk → API cache tiers (same as get_stock_detail).
     """
     # Check cache first
-    cached = _read_cache(symbol)
+    cached = _cached_stock_info(symbol)
     if cached is not None:
         return cached
 
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = _fetch_info(symbol)
 
         if not info or info.get("regularMarketPrice") is None:
             return None
@@ -170,7 +187,11 @@ def get_stock_info(symbol: str) -> Optional[dict]:
         }
 
         _sanitize_anomalies(result)
-        _write_cache(symbol, result)
+        stock_info_cache.set(symbol, result)
+        try:
+            _write_cache(symbol, result)
+        except Exception:
+            pass  # cache write is best-effort
         return result
 
     except (TimeoutError, socket.timeout) as e:
@@ -193,16 +214,16 @@ def get_stock_info(symbol: str) -> Optional[dict]:
 
 
 def get_multiple_stocks(symbols: list[str]) -> dict[str, Optional[dict]]:
-    """Fetch stock info for multiple symbols with a 1-second delay between requests.
+    """Fetch stock info for multiple symbols, spacing API requests 1 second apart.
+
+    Cache hits are served without the delay; only API fetches go through
+    the shared throttle (inside ``_fetch_info``).
 
     Returns a dict mapping symbol -> stock info (or None on failure).
     """
     results: dict[str, Optional[dict]] = {}
-    for i, symbol in enumerate(symbols):
+    for symbol in symbols:
         results[symbol] = get_stock_info(symbol)
-        # Wait 1 second between requests (skip after the last one)
-        if i < len(symbols) - 1:
-            time.sleep(1)
     return results
 
 
@@ -237,7 +258,7 @@ def get_stock_detail(symbol: str) -> Optional[dict]:
 
     # 3. Fetch additional data from yfinance
     try:
-        time.sleep(1)  # rate-limit consistent with existing pattern
+        throttle()
         ticker = yf.Ticker(symbol)
 
         # --- Price history (2 years for ~24 monthly returns) ---
@@ -484,9 +505,12 @@ def get_stock_detail(symbol: str) -> Optional[dict]:
             "fund_family": fund_family,
         })
 
-        # 5. Cache the result (file + memory)
-        _write_detail_cache(symbol, result)
+        # 5. Cache the result (memory + file)
         stock_detail_cache.set(symbol, result)
+        try:
+            _write_detail_cache(symbol, result)
+        except Exception:
+            pass  # cache write is best-effort
         return result
 
     except (TimeoutError, socket.timeout) as e:
@@ -1,14 +1,85 @@
 """Price history and news fetching (KIK-449, KIK-531)."""
 
 import socket
-import time
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import pandas as pd
 import yfinance as yf
 
+from src.data.yahoo_client._cache import (
+    _read_history_cache,
+    _read_news_cache,
+    _write_history_cache,
+    _write_news_cache,
+)
 from src.data.yahoo_client._memory_cache import price_history_cache
+from src.data.yahoo_client._rate_limit import retry_transient, throttle
+
+
+# ---------------------------------------------------------------------------
+# In-flight request coalescing
+# ---------------------------------------------------------------------------
+
+class _Flight:
+    __slots__ = ("event", "result")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+
+
+_inflight: dict[tuple, _Flight] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: tuple, fetch: Callable[[], Any]) -> Any:
+    """Run *fetch* once per *key* at a time; concurrent callers get its result.
+
+    Threaded screeners and a technical analysis running side by side often
+    ask for the same symbol at once; without this each would hit Yahoo.
+    """
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = _Flight()
+    if not leader:
+        flight.event.wait()
+        return flight.result
+    try:
+        flight.result = fetch()
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        flight.event.set()
+    return flight.result
+
+
+def _history_to_payload(hist: pd.DataFrame) -> dict:
+    """Serialize an OHLCV frame into a JSON-safe dict for the file cache."""
+    index = hist.index
+    tz = str(index.tz) if getattr(index, "tz", None) is not None else None
+    return {
+        "tz": tz,
+        "index": [ts.isoformat() for ts in index],
+        "columns": {col: hist[col].tolist() for col in hist.columns},
+    }
+
+
+def _payload_to_history(payload: dict) -> Optional[pd.DataFrame]:
+    """Rebuild the OHLCV frame written by ``_history_to_payload``."""
+    try:
+        tz = payload.get("tz")
+        index = pd.to_datetime(payload["index"], utc=tz is not None)
+        if tz is not None:
+            index = index.tz_convert(tz)
+        hist = pd.DataFrame(payload["columns"], index=index)
+        hist.index.name = "Date"
+        return hist
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 def get_price_history(symbol: str, period: str = "1y") -> Optional[pd.DataFrame]:
@@ -18,17 +89,40 @@ def get_price_history(symbol: str, period: str = "1y") -> Optional[pd.DataFrame]
     Returns None on error.
 
     Uses in-memory cache (default 5 min TTL) to avoid redundant API calls
-    within a screening session (KIK-531).
+    within a screening session (KIK-531), backed by a 1h on-disk cache so that
+    re-running a CLI (e.g. stock-report) in a new process skips the fetch.
     """
     cache_key = f"{symbol}:{period}"
     cached = price_history_cache.get(cache_key)
     if cached is not None:
         return cached.copy()
 
+    payload = _read_history_cache(symbol, period)
+    if payload is not None:
+        restored = _payload_to_history(payload)
+        if restored is not None and "Close" in restored.columns:
+            price_history_cache.set(cache_key, restored)
+            return restored.copy()
+
+    # Concurrent callers for the same symbol/period share one fetch
+    result = _single_flight(
+        ("history", symbol, period), lambda: _fetch_price_history(symbol, period),
+    )
+    return result.copy() if result is not None else None
+
+
+@retry_transient()
+def _download_history(symbol: str, period: str) -> Optional[pd.DataFrame]:
+    """One rate-limited Ticker.history() call, retried on 429/timeout."""
+    throttle()
+    return yf.Ticker(symbol).history(period=period)
+
+
+def _fetch_price_history(symbol: str, period: str) -> Optional[pd.DataFrame]:
+    """Fetch from Yahoo and populate the memory and disk caches."""
+    cache_key = f"{symbol}:{period}"
     try:
-        time.sleep(1)  # rate-limit
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period)
+        hist = _download_history(symbol, period)
         if hist is None or hist.empty:
             print(f"[yahoo_client] No price history for {symbol}")
             return None
@@ -40,6 +134,10 @@ def get_price_history(symbol: str, period: str = "1y") -> Optional[pd.DataFrame]
             return None
         result = hist[available_cols]
         price_history_cache.set(cache_key, result)
+        try:
+            _write_history_cache(symbol, period, _history_to_payload(result))
+        except Exception:
+            pass  # cache write is best-effort
         return result
     except (TimeoutError, socket.timeout) as e:
         print(
@@ -64,7 +162,7 @@ def get_stock_news(symbol: str, count: int = 10) -> list[dict]:
     """Fetch recent news for a stock symbol.
 
     Returns a list of news items with title, publisher, link, and publish time.
-    No caching is applied because news freshness is important.
+    Results are cached on disk for 10 minutes (short: news freshness matters).
 
     Parameters
     ----------
@@ -79,31 +177,52 @@ def get_stock_news(symbol: str, count: int = 10) -> list[dict]:
         Each dict contains: title, publisher, link, publish_time (ISO format str).
         Returns an empty list on error.
     """
+    cached = _read_news_cache(symbol, count)
+    if cached is not None:
+        return cached
+
+    return list(_single_flight(
+        ("news", symbol, count), lambda: _fetch_stock_news(symbol, count),
+    ))
+
+
+def _fetch_stock_news(symbol: str, count: int) -> list[dict]:
+    """Fetch news from Yahoo and populate the disk cache."""
     try:
         ticker = yf.Ticker(symbol)
         raw_news = ticker.news
         if not raw_news:
             return []
 
+        fromtimestamp = datetime.fromtimestamp
         results = []
         for item in raw_news[:count]:
             content = item.get("content", item)  # yfinance wraps in "content" sometimes
-            if isinstance(content, dict):
+            try:
                 publish_time = content.get("pubDate") or content.get("providerPublishTime")
-            else:
+                title = content.get("title", "")
+                publisher = content.get("provider", {}).get("displayName", "")
+                link = content.get("canonicalUrl", {}).get("url", "")
+            except AttributeError:  # non-dict "content": use the outer item
                 publish_time = item.get("providerPublishTime")
+                title = item.get("title", "")
+                publisher = item.get("publisher", "")
+                link = item.get("link", "")
 
             # Handle providerPublishTime as unix timestamp
             if isinstance(publish_time, (int, float)):
-                publish_time = datetime.fromtimestamp(publish_time).isoformat()
+                publish_time = fromtimestamp(publish_time).isoformat()
 
-            news_item = {
-                "title": content.get("title", "") if isinstance(content, dict) else item.get("title", ""),
-                "publisher": content.get("provider", {}).get("displayName", "") if isinstance(content, dict) else item.get("publisher", ""),
-                "link": content.get("canonicalUrl", {}).get("url", "") if isinstance(content, dict) else item.get("link", ""),
+            results.append({
+                "title": title,
+                "publisher": publisher,
+                "link": link,
                 "publish_time": str(publish_time) if publish_time else "",
-            }
-            results.append(news_item)
+            })
+        try:
+            _write_news_cache(symbol, count, results)
+        except Exception:
+            pass  # cache write is best-effort
         return results
     except Exception as e:
         print(f"[yahoo_client] Error fetching news for {symbol}: {e}")
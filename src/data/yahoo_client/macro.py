@@ -1,9 +1,14 @@
 """Macro economic indicators (KIK-396, KIK-449)."""
 
-import time
+from typing import Optional
 
+import numpy as np
+import pandas as pd
 import yfinance as yf
 
+from src.data.yahoo_client._cache import _read_macro_cache, _write_macro_cache
+from src.data.yahoo_client._rate_limit import retry_transient
+
 
 MACRO_TICKERS = {
     "S&P500": "^GSPC",
@@ -19,6 +24,59 @@ MACRO_TICKERS = {
 # Tickers where change is expressed as point difference, not percentage
 _POINT_DIFF_TICKERS = {"^VIX", "^TNX"}
 
+# (name, symbol, is_point_diff), resolved once at import for the fetch loop
+_MACRO_SPECS = tuple(
+    (name, symbol, symbol in _POINT_DIFF_TICKERS)
+    for name, symbol in MACRO_TICKERS.items()
+)
+
+
+def _indicator(
+    name: str, symbol: str, is_point: bool, closes: Optional[np.ndarray],
+) -> dict:
+    """Build one indicator dict from NaN-free closes (None/empty -> None values)."""
+    entry = {
+        "name": name,
+        "symbol": symbol,
+        "price": None,
+        "daily_change": None,
+        "weekly_change": None,
+        "is_point_diff": is_point,
+    }
+    if closes is None or len(closes) == 0:
+        return entry
+
+    latest = float(closes[-1])
+    entry["price"] = latest
+
+    # Daily change
+    if len(closes) >= 2:
+        prev = float(closes[-2])
+        if is_point:
+            entry["daily_change"] = latest - prev
+        elif prev != 0:
+            entry["daily_change"] = (latest - prev) / prev
+
+    # Weekly change (oldest available in 5d window)
+    oldest = float(closes[0])
+    if is_point:
+        entry["weekly_change"] = latest - oldest
+    elif oldest != 0:
+        entry["weekly_change"] = (latest - oldest) / oldest
+    return entry
+
+
+@retry_transient()
+def _download_closes() -> pd.DataFrame:
+    """Download 5 days of all MACRO_TICKERS in one call (retried on 429/timeout)."""
+    return yf.download(
+        list(MACRO_TICKERS.values()),
+        period="5d",
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+
 
 def get_macro_indicators() -> list[dict]:
     """Fetch macro economic indicators (8 tickers).
@@ -30,69 +88,45 @@ def get_macro_indicators() -> list[dict]:
     for normal tickers, or raw point differences for VIX / bond yields
     (``is_point_diff=True``).
 
-    No caching is applied because freshness is important.
-    A 1-second sleep is used per ticker for rate-limit compliance.
+    All tickers are fetched with one ``yf.download`` call.  Tickers trade
+    on different calendars, so NaNs are masked out of each Close column before
+    use.  Results are cached on disk for 1 hour so that repeated research
+    runs in one session do not re-fetch (and risk HTTP 429).
     """
-    results: list[dict] = []
+    cached = _read_macro_cache()
+    if cached is not None:
+        return cached
+
+    try:
+        data = _download_closes()
+    except Exception as e:
+        print(f"[yahoo_client] Error fetching macro indicators: {e}")
+        return []
+
+    # Downloaded tickers, resolved once rather than per indicator
+    if data is not None and not data.empty:
+        downloaded = set(data.columns.get_level_values(0))
+    else:
+        downloaded = set()
 
-    for name, symbol in MACRO_TICKERS.items():
+    results: list[dict] = []
+    for name, symbol, is_point in _MACRO_SPECS:
         try:
-            time.sleep(1)
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="5d")
-            if hist is None or hist.empty or "Close" not in hist.columns:
-                results.append({
-                    "name": name,
-                    "symbol": symbol,
-                    "price": None,
-                    "daily_change": None,
-                    "weekly_change": None,
-                    "is_point_diff": symbol in _POINT_DIFF_TICKERS,
-                })
-                continue
-
-            closes = hist["Close"].dropna()
-            if len(closes) == 0:
-                results.append({
-                    "name": name,
-                    "symbol": symbol,
-                    "price": None,
-                    "daily_change": None,
-                    "weekly_change": None,
-                    "is_point_diff": symbol in _POINT_DIFF_TICKERS,
-                })
-                continue
-
-            latest = float(closes.iloc[-1])
-            is_point = symbol in _POINT_DIFF_TICKERS
-
-            # Daily change
-            daily_change = None
-            if len(closes) >= 2:
-                prev = float(closes.iloc[-2])
-                if is_point:
-                    daily_change = latest - prev
-                elif prev != 0:
-                    daily_change = (latest - prev) / prev
-
-            # Weekly change (oldest available in 5d window)
-            weekly_change = None
-            oldest = float(closes.iloc[0])
-            if is_point:
-                weekly_change = latest - oldest
-            elif oldest != 0:
-                weekly_change = (latest - oldest) / oldest
-
-            results.append({
-                "name": name,
-                "symbol": symbol,
-                "price": latest,
-                "daily_change": daily_change,
-                "weekly_change": weekly_change,
-                "is_point_diff": is_point,
-            })
+            closes = None
+            if symbol in downloaded:
+                frame = data[symbol]
+                if "Close" in frame.columns:
+                    # Plain ndarray + NaN mask rather than Series.dropna()
+                    closes = frame["Close"].to_numpy(dtype=float)
+                    closes = closes[~np.isnan(closes)]
+            results.append(_indicator(name, symbol, is_point, closes))
         except Exception as e:
             print(f"[yahoo_client] Error fetching macro indicator {name}: {e}")
             continue
 
+    if any(r["price"] is not None for r in results):
+        try:
+            _write_macro_cache(results)
+        except Exception:
+            pass  # cache write is best-effort
     return results
@@ -1,10 +1,52 @@
 """EquityQuery-based screening via yf.screen() (KIK-449)."""
 
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import yfinance as yf
 from yfinance import EquityQuery
 
+from src.data.yahoo_client._rate_limit import retry_transient, throttle
+
+
+_PAGE_WORKERS = int(os.environ.get("SCREEN_PAGE_WORKERS", "4"))
+
+
+@retry_transient()
+def _fetch_page(
+    query: EquityQuery, size: int, offset: int, sort_field: str, sort_asc: bool,
+) -> Optional[dict]:
+    """Fetch one yf.screen() page (rate-limited, retried on 429/timeout)."""
+    throttle()
+    return yf.screen(
+        query, size=size, offset=offset,
+        sortField=sort_field, sortAsc=sort_asc,
+    )
+
+
+def _page_quotes(response: Optional[dict]) -> Optional[list[dict]]:
+    """Return the quotes list of a page response, or None if unusable."""
+    if response is None:
+        print("[yahoo_client] yf.screen() returned None")
+        return None
+    quotes = response.get("quotes", [])
+    if not isinstance(quotes, list):
+        print(f"[yahoo_client] Unexpected quotes type: {type(quotes)}")
+        return None
+    return quotes
+
+
+def _fetch_rest_page(
+    query: EquityQuery, size: int, offset: int, sort_field: str, sort_asc: bool,
+) -> Optional[list[dict]]:
+    """Fetch a page after the first; errors yield None (partial results)."""
+    try:
+        return _page_quotes(_fetch_page(query, size, offset, sort_field, sort_asc))
+    except Exception as e:
+        print(f"[yahoo_client] Error in screen_stocks (offset {offset}): {e}")
+        return None
+
 
 def screen_stocks(
     query: EquityQuery,
@@ -15,7 +57,9 @@ def screen_stocks(
 ) -> list[dict]:
     """Screen stocks using yfinance EquityQuery + yf.screen().
 
-    Paginates through all results using the ``offset`` parameter.
+    Paginates through all results using the ``offset`` parameter.  The first
+    page reports the total; the remaining pages are then fetched concurrently
+    (``SCREEN_PAGE_WORKERS`` threads, default 4).
 
     Parameters
     ----------
@@ -40,56 +84,50 @@ def screen_stocks(
         Returns an empty list on error.
     """
     all_quotes: list[dict] = []
-    offset = 0
-    total = None
-    page = 1
 
     try:
-        while True:
-            # Adjust page size if max_results would be exceeded
-            page_size = size
-            if max_results > 0:
-                remaining = max_results - len(all_quotes)
-                if remaining <= 0:
-                    break
-                page_size = min(size, remaining)
-
-            if total is not None:
-                print(f"[yahoo_client] Fetching page {page}... ({len(all_quotes)}/{total})")
-            else:
-                print(f"[yahoo_client] Fetching page {page}...")
-
-            response = yf.screen(
-                query, size=page_size, offset=offset,
-                sortField=sort_field, sortAsc=sort_asc,
-            )
-            if response is None:
-                print("[yahoo_client] yf.screen() returned None")
-                break
-
-            quotes = response.get("quotes", [])
-            if not isinstance(quotes, list):
-                print(f"[yahoo_client] Unexpected quotes type: {type(quotes)}")
-                break
-
-            if total is None:
-                total = response.get("total", 0)
-                print(f"[yahoo_client] Total matching stocks: {total}")
-
-            if not quotes:
-                break
-
+        print("[yahoo_client] Fetching page 1...")
+        first_size = min(size, max_results) if max_results > 0 else size
+        response = _fetch_page(query, first_size, 0, sort_field, sort_asc)
+        quotes = _page_quotes(response)
+        if quotes is not None:
+            total = response.get("total", 0) or 0
+            print(f"[yahoo_client] Total matching stocks: {total}")
             all_quotes.extend(quotes)
 
-            # Stop if we have reached the total or max_results
-            offset += len(quotes)
-            if offset >= (total or 0):
-                break
-            if max_results > 0 and len(all_quotes) >= max_results:
-                break
-
-            page += 1
-            time.sleep(1)  # rate-limit between pages
+        if quotes:
+            # Once total is known the remaining offsets are independent, so
+            # the other pages are fetched concurrently, kept in offset order,
+            # and cut at the first failed/empty page (partial results).
+            limit = min(total, max_results) if max_results > 0 else total
+            offset = len(quotes)
+            plan = [(off, min(size, limit - off)) for off in range(offset, limit, size)]
+            stopped = False
+            if plan:
+                print(f"[yahoo_client] Fetching pages 2-{len(plan) + 1}...")
+                with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, len(plan))) as executor:
+                    pages = list(executor.map(
+                        lambda p: _fetch_rest_page(query, p[1], p[0], sort_field, sort_asc),
+                        plan,
+                    ))
+                for (off, wanted), page_quotes in zip(plan, pages):
+                    if not page_quotes:
+                        stopped = True
+                        break
+                    all_quotes.extend(page_quotes)
+                    offset = off + len(page_quotes)
+                    if len(page_quotes) < wanted:
+                        break  # short page: the later planned offsets are off
+            # After a short page, continue one page at a time from the
+            # offset actually reached (as the sequential loop always did)
+            while not stopped and offset < limit:
+                page_quotes = _fetch_rest_page(
+                    query, min(size, limit - offset), offset, sort_field, sort_asc,
+                )
+                if not page_quotes:
+                    break
+                all_quotes.extend(page_quotes)
+                offset += len(page_quotes)
 
         print(f"[yahoo_client] Fetched {len(all_quotes)} stocks total")
         return all_quotes
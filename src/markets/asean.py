@@ -128,13 +128,7 @@ class ASEANMarket(Market):
 
     def get_default_symbols(self) -> list[str]:
         """All default ASEAN symbols across the five exchanges."""
-        return (
-            self._singapore_symbols()
-            + self._thailand_symbols()
-            + self._malaysia_symbols()
-            + self._indonesia_symbols()
-            + self._philippines_symbols()
-        )
+        return list(_DEFAULT_SYMBOLS)
 
     # -- Thresholds --------------------------------------------------------
 
@@ -147,3 +141,13 @@ class ASEANMarket(Market):
             "roe_min": 0.08,
             "rf": 0.03,  # Blended ASEAN govies
         }
+
+
+# Concatenated once at import; get_default_symbols() only copies it
+_DEFAULT_SYMBOLS = tuple(
+    ASEANMarket._singapore_symbols()
+    + ASEANMarket._thailand_symbols()
+    + ASEANMarket._malaysia_symbols()
+    + ASEANMarket._indonesia_symbols()
+    + ASEANMarket._philippines_symbols()
+)
@@ -2,6 +2,44 @@
 
 from .base import Market
 
+# Fallback universe; a module-level tuple so each call only copies it
+_DEFAULT_SYMBOLS = (
+    # Automotive
+    "7203.T",  # Toyota Motor
+    "7267.T",  # Honda Motor
+    "7974.T",  # Nintendo
+    # Electronics / Tech
+    "6758.T",  # Sony Group
+    "6861.T",  # Keyence
+    "6501.T",  # Hitachi
+    "6902.T",  # Denso
+    "6762.T",  # TDK
+    "6954.T",  # Fanuc
+    "4063.T",  # Shin-Etsu Chemical
+    # Finance
+    "8306.T",  # Mitsubishi UFJ Financial
+    "8316.T",  # Sumitomo Mitsui Financial
+    "8411.T",  # Mizuho Financial
+    "8766.T",  # Tokio Marine Holdings
+    # Trading
+    "8058.T",  # Mitsubishi Corporation
+    "8031.T",  # Mitsui & Co.
+    "8001.T",  # Itochu
+    # Telecom / Services
+    "9432.T",  # NTT
+    "9433.T",  # KDDI
+    "9984.T",  # SoftBank Group
+    # Pharma / Healthcare
+    "4502.T",  # Takeda Pharmaceutical
+    "4568.T",  # Daiichi Sankyo
+    # Retail / Consumer
+    "9983.T",  # Fast Retailing
+    "4452.T",  # Kao
+    # Industrial
+    "6301.T",  # Komatsu
+    "7751.T",  # Canon
+)
+
 
 class JapanMarket(Market):
     """Tokyo Stock Exchange (.T suffix).
@@ -31,42 +69,7 @@ class JapanMarket(Market):
 
     def get_default_symbols(self) -> list[str]:
         """Major Nikkei 225 constituents (approx. 25 symbols)."""
-        return [
-            # Automotive
-            "7203.T",  # Toyota Motor
-            "7267.T",  # Honda Motor
-            "7974.T",  # Nintendo
-            # Electronics / Tech
-            "6758.T",  # Sony Group
-            "6861.T",  # Keyence
-            "6501.T",  # Hitachi
-            "6902.T",  # Denso
-            "6762.T",  # TDK
-            "6954.T",  # Fanuc
-            "4063.T",  # Shin-Etsu Chemical
-            # Finance
-            "8306.T",  # Mitsubishi UFJ Financial
-            "8316.T",  # Sumitomo Mitsui Financial
-            "8411.T",  # Mizuho Financial
-            "8766.T",  # Tokio Marine Holdings
-            # Trading
-            "8058.T",  # Mitsubishi Corporation
-            "8031.T",  # Mitsui & Co.
-            "8001.T",  # Itochu
-            # Telecom / Services
-            "9432.T",  # NTT
-            "9433.T",  # KDDI
-            "9984.T",  # SoftBank Group
-            # Pharma / Healthcare
-            "4502.T",  # Takeda Pharmaceutical
-            "4568.T",  # Daiichi Sankyo
-            # Retail / Consumer
-            "9983.T",  # Fast Retailing
-            "4452.T",  # Kao
-            # Industrial
-            "6301.T",  # Komatsu
-            "7751.T",  # Canon
-        ]
+        return list(_DEFAULT_SYMBOLS)
 
     # -- Thresholds --------------------------------------------------------
 
@@ -2,6 +2,47 @@
 
 from .base import Market
 
+# Fallback universe; a module-level tuple so each call only copies it
+_DEFAULT_SYMBOLS = (
+    # Big Tech
+    "AAPL",   # Apple
+    "MSFT",   # Microsoft
+    "GOOGL",  # Alphabet
+    "AMZN",   # Amazon
+    "META",   # Meta Platforms
+    "NVDA",   # NVIDIA
+    "TSLA",   # Tesla
+    # Semiconductors
+    "AVGO",   # Broadcom
+    "AMD",    # AMD
+    "INTC",   # Intel
+    # Finance
+    "JPM",    # JPMorgan Chase
+    "BAC",    # Bank of America
+    "GS",     # Goldman Sachs
+    "BRK-B",  # Berkshire Hathaway
+    "V",      # Visa
+    "MA",     # Mastercard
+    # Healthcare
+    "JNJ",    # Johnson & Johnson
+    "UNH",    # UnitedHealth
+    "PFE",    # Pfizer
+    "LLY",    # Eli Lilly
+    # Consumer
+    "PG",     # Procter & Gamble
+    "KO",     # Coca-Cola
+    "PEP",    # PepsiCo
+    "WMT",    # Walmart
+    "COST",   # Costco
+    # Industrial / Energy
+    "XOM",    # ExxonMobil
+    "CVX",    # Chevron
+    "CAT",    # Caterpillar
+    # Communication / Media
+    "DIS",    # Walt Disney
+    "NFLX",   # Netflix
+)
+
 
 class USMarket(Market):
     """US equities (no suffix required).
@@ -31,45 +72,7 @@ class USMarket(Market):
 
     def get_default_symbols(self) -> list[str]:
         """Major S&P 500 constituents (approx. 30 symbols)."""
-        return [
-            # Big Tech
-            "AAPL",   # Apple
-            "MSFT",   # Microsoft
-            "GOOGL",  # Alphabet
-            "AMZN",   # Amazon
-            "META",   # Meta Platforms
-            "NVDA",   # NVIDIA
-            "TSLA",   # Tesla
-            # Semiconductors
-            "AVGO",   # Broadcom
-            "AMD",    # AMD
-            "INTC",   # Intel
-            # Finance
-            "JPM",    # JPMorgan Chase
-            "BAC",    # Bank of America
-            "GS",     # Goldman Sachs
-            "BRK-B",  # Berkshire Hathaway
-            "V",      # Visa
-            "MA",     # Mastercard
-            # Healthcare
-            "JNJ",    # Johnson & Johnson
-            "UNH",    # UnitedHealth
-            "PFE",    # Pfizer
-            "LLY",    # Eli Lilly
-            # Consumer
-            "PG",     # Procter & Gamble
-            "KO",     # Coca-Cola
-            "PEP",    # PepsiCo
-            "WMT",    # Walmart
-            "COST",   # Costco
-            # Industrial / Energy
-            "XOM",    # ExxonMobil
-            "CVX",    # Chevron
-            "CAT",    # Caterpillar
-            # Communication / Media
-            "DIS",    # Walt Disney
-            "NFLX",   # Netflix
-        ]
+        return list(_DEFAULT_SYMBOLS)
 
     # -- Thresholds --------------------------------------------------------
 
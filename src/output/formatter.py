@@ -1,12 +1,23 @@
 """Output formatters for screening results."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
 from src.output._format_helpers import fmt_pct as _fmt_pct
 from src.output._format_helpers import fmt_float as _fmt_float
 from src.output._format_helpers import build_label as _build_label
 
 
+# Row templates, bound once (str.format of a constant template).  The fmt
+# helpers are left as module globals in the row loops: LOAD_GLOBAL is
+# specialized on CPython 3.11+, and aliasing them to locals measured no faster.
+_VALUE_ROW = "| {} | {} | {} | {} | {} | {} | {} | {} |".format
+_QUERY_ROW = "| {} | {} | {} | {} | {} | {} | {} | {} | {} |".format
+_PULLBACK_ROW = "| {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} |".format
+_ALPHA_ROW = "| {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} | {} |".format
+
+_PULLBACK_MARK = {"full": "★", "partial": "△"}
+
+
 def _append_annotation_footer(lines: list[str], results: list[dict]) -> None:
     """Append marker legend and note details if any results have annotations (KIK-418/419)."""
     has_markers = any(r.get("_note_markers") for r in results)
@@ -25,6 +36,24 @@ def _append_annotation_footer(lines: list[str], results: list[dict]) -> None:
             lines.append(f"- **{sym}**: {summary}")
 
 
+def _fmt_bounce(score: Optional[float]) -> str:
+    """Bounce score as whole points (e.g. '72点'), or '-'."""
+    return f"{score:.0f}点" if score is not None else "-"
+
+
+def _change_indicator(score: Optional[float]) -> str:
+    """Change indicator mark: ◎(>=20) ○(>=15) △(>=10) ×(<10)."""
+    if score is None:
+        return "-"
+    if score >= 20:
+        return "◎"
+    if score >= 15:
+        return "○"
+    if score >= 10:
+        return "△"
+    return "×"
+
+
 def format_markdown(results: list[dict]) -> str:
     """Format screening results as a Markdown table.
 
@@ -47,19 +76,19 @@ def format_markdown(results: list[dict]) -> str:
         "|---:|:-----|-----:|----:|----:|---------:|----:|------:|",
     ]
 
-    for rank, row in enumerate(results, start=1):
-        label = _build_label(row)
-
-        price = _fmt_float(row.get("price"), decimals=0) if row.get("price") is not None else "-"
-        per = _fmt_float(row.get("per"))
-        pbr = _fmt_float(row.get("pbr"))
-        div_yield = _fmt_pct(row.get("dividend_yield"))
-        roe = _fmt_pct(row.get("roe"))
-        score = _fmt_float(row.get("value_score"))
-
-        lines.append(
-            f"| {rank} | {label} | {price} | {per} | {pbr} | {div_yield} | {roe} | {score} |"
+    lines.extend(
+        _VALUE_ROW(
+            rank,
+            _build_label(row),
+            _fmt_float(row.get("price"), decimals=0),
+            _fmt_float(row.get("per")),
+            _fmt_float(row.get("pbr")),
+            _fmt_pct(row.get("dividend_yield")),
+            _fmt_pct(row.get("roe")),
+            _fmt_float(row.get("value_score")),
         )
+        for rank, row in enumerate(results, start=1)
+    )
 
     _append_annotation_footer(lines, results)
     return "\n".join(lines)
@@ -89,20 +118,20 @@ def format_query_markdown(results: list[dict]) -> str:
         "|---:|:-----|:---------|-----:|----:|----:|---------:|----:|------:|",
     ]
 
-    for rank, row in enumerate(results, start=1):
-        label = _build_label(row)
-        sector = row.get("sector") or "-"
-
-        price = _fmt_float(row.get("price"), decimals=0) if row.get("price") is not None else "-"
-        per = _fmt_float(row.get("per"))
-        pbr = _fmt_float(row.get("pbr"))
-        div_yield = _fmt_pct(row.get("dividend_yield"))
-        roe = _fmt_pct(row.get("roe"))
-        score = _fmt_float(row.get("value_score"))
-
-        lines.append(
-            f"| {rank} | {label} | {sector} | {price} | {per} | {pbr} | {div_yield} | {roe} | {score} |"
+    lines.extend(
+        _QUERY_ROW(
+            rank,
+            _build_label(row),
+            row.get("sector") or "-",
+            _fmt_float(row.get("price"), decimals=0),
+            _fmt_float(row.get("per")),
+            _fmt_float(row.get("pbr")),
+            _fmt_pct(row.get("dividend_yield")),
+            _fmt_pct(row.get("roe")),
+            _fmt_float(row.get("value_score")),
         )
+        for rank, row in enumerate(results, start=1)
+    )
 
     _append_annotation_footer(lines, results)
     return "\n".join(lines)
@@ -118,30 +147,23 @@ def format_pullback_markdown(results: list[dict]) -> str:
         "|---:|:-----|-----:|----:|------:|----:|-------:|------:|-------:|------:|:------:|------:|",
     ]
 
-    for rank, row in enumerate(results, start=1):
-        label = _build_label(row)
-
-        price = _fmt_float(row.get("price"), decimals=0) if row.get("price") is not None else "-"
-        per = _fmt_float(row.get("per"))
-        pullback = _fmt_pct(row.get("pullback_pct"))
-        rsi = _fmt_float(row.get("rsi"), decimals=1)
-        vol_ratio = _fmt_float(row.get("volume_ratio"))
-        sma50 = _fmt_float(row.get("sma50"), decimals=0) if row.get("sma50") is not None else "-"
-        sma200 = _fmt_float(row.get("sma200"), decimals=0) if row.get("sma200") is not None else "-"
-
-        # Bounce score
-        bounce_score = row.get("bounce_score")
-        bounce_str = f"{bounce_score:.0f}点" if bounce_score is not None else "-"
-
-        # Match type
-        match_type = row.get("match_type", "full")
-        match_str = "★完全一致" if match_type == "full" else "△部分一致"
-
-        score = _fmt_float(row.get("final_score") or row.get("value_score"))
-
-        lines.append(
-            f"| {rank} | {label} | {price} | {per} | {pullback} | {rsi} | {vol_ratio} | {sma50} | {sma200} | {bounce_str} | {match_str} | {score} |"
+    lines.extend(
+        _PULLBACK_ROW(
+            rank,
+            _build_label(row),
+            _fmt_float(row.get("price"), decimals=0),
+            _fmt_float(row.get("per")),
+            _fmt_pct(row.get("pullback_pct")),
+            _fmt_float(row.get("rsi"), decimals=1),
+            _fmt_float(row.get("volume_ratio")),
+            _fmt_float(row.get("sma50"), decimals=0),
+            _fmt_float(row.get("sma200"), decimals=0),
+            _fmt_bounce(row.get("bounce_score")),
+            "★完全一致" if row.get("match_type", "full") == "full" else "△部分一致",
+            _fmt_float(row.get("final_score") or row.get("value_score")),
         )
+        for rank, row in enumerate(results, start=1)
+    )
 
     _append_annotation_footer(lines, results)
     return "\n".join(lines)
@@ -179,71 +201,54 @@ def format_growth_markdown(results: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def format_alpha_markdown(results: list[dict]) -> str:
-    """Format alpha signal screening results as a Markdown table.
+def iter_alpha_markdown(results: list[dict]) -> Iterator[str]:
+    """Yield the lines of ``format_alpha_markdown`` one at a time.
 
-    Shows 2-axis scoring: value_score (100pt) + change_score (100pt) = total_score (200pt+).
-    Also shows pullback status and key change indicators.
+    Lets callers stream a large table to a file or stdout without holding
+    the full list of lines and the joined string at once.
     """
     if not results:
-        return "アルファシグナル条件に合致する銘柄が見つかりませんでした。"
+        yield "アルファシグナル条件に合致する銘柄が見つかりませんでした。"
+        return
 
-    lines = [
-        "| 順位 | 銘柄 | 株価 | PER | PBR | 割安 | 変化 | 総合 | 押し目 | ア | 加速 | FCF | ROE趨勢 |",
-        "|---:|:-----|-----:|----:|----:|----:|----:|----:|:------:|:--:|:---:|:---:|:------:|",
-    ]
+    yield "| 順位 | 銘柄 | 株価 | PER | PBR | 割安 | 変化 | 総合 | 押し目 | ア | 加速 | FCF | ROE趨勢 |"
+    yield "|---:|:-----|-----:|----:|----:|----:|----:|----:|:------:|:--:|:---:|:---:|:------:|"
 
     for rank, row in enumerate(results, start=1):
-        label = _build_label(row)
-
-        price = _fmt_float(row.get("price"), decimals=0) if row.get("price") is not None else "-"
-        per = _fmt_float(row.get("per"))
-        pbr = _fmt_float(row.get("pbr"))
+        yield _ALPHA_ROW(
+            rank,
+            _build_label(row),
+            _fmt_float(row.get("price"), decimals=0),
+            _fmt_float(row.get("per")),
+            _fmt_float(row.get("pbr")),
+            _fmt_float(row.get("value_score")),
+            _fmt_float(row.get("change_score")),
+            _fmt_float(row.get("total_score")),
+            _PULLBACK_MARK.get(row.get("pullback_match", "none"), "-"),
+            _change_indicator(row.get("accruals_score")),
+            _change_indicator(row.get("rev_accel_score")),
+            _change_indicator(row.get("fcf_yield_score")),
+            _change_indicator(row.get("roe_trend_score")),
+        )
 
-        value_score = _fmt_float(row.get("value_score"))
-        change_score = _fmt_float(row.get("change_score"))
-        total_score = _fmt_float(row.get("total_score"))
+    # Legend
+    yield ""
+    yield "**凡例**: 割安=割安スコア(100点) / 変化=変化スコア(100点) / 総合=割安+変化(+押し目ボーナス)"
+    yield "**変化指標**: ア=アクルーアルズ(利益の質) / 加速=売上成長加速度 / FCF=FCF利回り / ROE趨勢=ROE改善トレンド"
+    yield "**判定**: ◎=優秀(20+) ○=良好(15+) △=普通(10+) ×=不足(<10)"
 
-        # Pullback status
-        pullback = row.get("pullback_match", "none")
-        if pullback == "full":
-            pb_str = "★"
-        elif pullback == "partial":
-            pb_str = "△"
-        else:
-            pb_str = "-"
-
-        # Change indicators: ◎(>=20) ○(>=15) △(>=10) ×(<10)
-        def _indicator(score):
-            if score is None:
-                return "-"
-            if score >= 20:
-                return "◎"
-            if score >= 15:
-                return "○"
-            if score >= 10:
-                return "△"
-            return "×"
-
-        accruals = _indicator(row.get("accruals_score"))
-        rev_accel = _indicator(row.get("rev_accel_score"))
-        fcf = _indicator(row.get("fcf_yield_score"))
-        roe_trend = _indicator(row.get("roe_trend_score"))
+    footer: list[str] = []
+    _append_annotation_footer(footer, results)
+    yield from footer
 
-        lines.append(
-            f"| {rank} | {label} | {price} | {per} | {pbr} "
-            f"| {value_score} | {change_score} | {total_score} | {pb_str} "
-            f"| {accruals} | {rev_accel} | {fcf} | {roe_trend} |"
-        )
 
-    # Legend
-    lines.append("")
-    lines.append("**凡例**: 割安=割安スコア(100点) / 変化=変化スコア(100点) / 総合=割安+変化(+押し目ボーナス)")
-    lines.append("**変化指標**: ア=アクルーアルズ(利益の質) / 加速=売上成長加速度 / FCF=FCF利回り / ROE趨勢=ROE改善トレンド")
-    lines.append("**判定**: ◎=優秀(20+) ○=良好(15+) △=普通(10+) ×=不足(<10)")
+def format_alpha_markdown(results: list[dict]) -> str:
+    """Format alpha signal screening results as a Markdown table.
 
-    _append_annotation_footer(lines, results)
-    return "\n".join(lines)
+    Shows 2-axis scoring: value_score (100pt) + change_score (100pt) = total_score (200pt+).
+    Also shows pullback status and key change indicators.
+    """
+    return "\n".join(iter_alpha_markdown(results))
 
 
 def format_shareholder_return_markdown(results: list[dict]) -> str:
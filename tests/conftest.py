@@ -97,6 +97,32 @@ def mock_yahoo_client(monkeypatch):
     return mock
 
 
+# ---------------------------------------------------------------------------
+# graph_query stub
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def gq_stub(monkeypatch):
+    """Replace src.data.graph_query functions with constant-returning stubs.
+
+    A plain attribute swap (undone by monkeypatch) instead of stacked
+    ``patch("src.data.graph_query.X", return_value=...)`` contexts.
+
+    Usage in tests:
+        def test_something(gq_stub):
+            gq_stub("get_last_health_check_date", "2026-01-01")
+            # ... call code that reads graph_query ...
+    """
+    import src.data.graph_query as gq
+
+    def set_fn(name: str, return_value) -> None:
+        if not hasattr(gq, name):
+            raise AttributeError(f"src.data.graph_query has no attribute {name!r}")
+        monkeypatch.setattr(gq, name, lambda *args, **kwargs: return_value)
+
+    return set_fn
+
+
 # ---------------------------------------------------------------------------
 # Auto-mock external services (KIK-529)
 # ---------------------------------------------------------------------------
@@ -125,6 +151,21 @@ def _block_external_io(request, monkeypatch):
     # Grok: ensure no API key → functions return EMPTY_* immediately
     monkeypatch.delenv("XAI_API_KEY", raising=False)
 
+    # yahoo_client disk cache: per-test directory, never the repo's data/cache
+    monkeypatch.setattr(
+        "src.data.yahoo_client._cache.CACHE_DIR", request.getfixturevalue("tmp_path") / "cache",
+    )
+
+    # Graph linker LLM response cache: per-test file as well
+    monkeypatch.setattr(
+        "src.data.graph_store.linker._LINK_CACHE_PATH",
+        request.getfixturevalue("tmp_path") / "cache" / "llm_link.sqlite",
+    )
+
+    # Request spacing: every test starts as if no request was made yet
+    from src.data.yahoo_client import _rate_limit
+    monkeypatch.setattr(_rate_limit, "_next_slot", 0.0)
+
     # In-memory cache: clear between tests to prevent cross-test leaks (KIK-531)
     from src.data.yahoo_client._memory_cache import clear_memory_cache
     clear_memory_cache()
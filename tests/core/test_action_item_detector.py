@@ -200,3 +200,9 @@ class TestExtractSymbol:
         """KIK-489: US symbol in reason field."""
         s = {"title": "懸念メモ再確認", "reason": "NVDA に懸念メモあり", "command_hint": ""}
         assert _extract_symbol_from_suggestion(s) == "NVDA"
+
+    def test_explicit_symbol_field_preferred(self):
+        """Suggestion.symbol from proactive_engine wins over text scraping."""
+        s = {"title": "BRK.Bの詳細分析", "reason": "スクリーニングで5回上位にランクイン",
+             "command_hint": "stock-report BRK.B", "symbol": "BRK-B"}
+        assert _extract_symbol_from_suggestion(s) == "BRK-B"
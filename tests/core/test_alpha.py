@@ -0,0 +1,118 @@
+"""Tests for src/core/screening/alpha.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.screening.alpha import (
+    _accruals_score,
+    _fcf_yield_score,
+    _rev_accel_score,
+    _roe_trend_score,
+    compute_roe_trend_score,
+)
+
+
+def _make_detail(net_incomes, equities):
+    """Create a stock detail dict with latest-first NI / equity history."""
+    return {
+        "net_income_history": list(net_incomes),
+        "equity_history": list(equities),
+    }
+
+
+# ---------------------------------------------------------------------------
+# compute_roe_trend_score
+# ---------------------------------------------------------------------------
+
+class TestComputeRoeTrendScore:
+    @pytest.mark.parametrize("net_incomes,equities", [
+        ([150, 120, 100], [1000, 1000, 1000]),
+        ([90, 100, 110], [1000, 1000, 1000]),
+        ([200, 130, 170], [1100, 1000, 950]),
+        ([85, 84, 83], [1000, 1000, 1000]),
+        ([300, 100, 100], [1000, 900, 800]),
+    ])
+    def test_slope_matches_polyfit(self, net_incomes, equities):
+        """Closed-form slope equals np.polyfit on the chronological ROEs."""
+        roes = [ni / eq for ni, eq in zip(net_incomes, equities)]
+        expected = float(np.polyfit([0, 1, 2], roes[::-1], deg=1)[0])
+
+        _, slope = compute_roe_trend_score(_make_detail(net_incomes, equities))
+        assert slope == pytest.approx(expected, abs=1e-12)
+
+    def test_improving_roe_full_score(self):
+        score, slope = compute_roe_trend_score(
+            _make_detail([200, 120, 100], [1000, 1000, 1000])
+        )
+        assert slope == pytest.approx(0.05)
+        assert score == 25.0
+
+    def test_insufficient_history(self):
+        assert compute_roe_trend_score(_make_detail([100, 90], [1000, 1000])) == (0.0, None)
+
+    def test_negative_roe_excluded(self):
+        score, slope = compute_roe_trend_score(
+            _make_detail([150, 50, -20], [1000, 1000, 1000])
+        )
+        assert (score, slope) == (0.0, None)
+
+    def test_low_latest_roe_excluded(self):
+        score, slope = compute_roe_trend_score(
+            _make_detail([70, 60, 50], [1000, 1000, 1000])
+        )
+        assert (score, slope) == (0.0, None)
+
+
+# ---------------------------------------------------------------------------
+# Float kernels
+# ---------------------------------------------------------------------------
+
+class TestScoreKernels:
+    def test_accruals(self):
+        assert _accruals_score(100.0, 160.0, 1000.0) == (25.0, pytest.approx(-0.06))
+        score, raw = _accruals_score(100.0, 50.0, 0.0)
+        assert score == 0.0 and np.isnan(raw)
+
+    def test_rev_accel_negative_growth_keeps_raw(self):
+        score, raw = _rev_accel_score(900.0, 1000.0, 1100.0)
+        assert score == 0.0
+        assert raw == pytest.approx(-0.1 + 1 / 11)
+
+    def test_fcf_yield_zero_market_cap(self):
+        score, raw = _fcf_yield_score(10.0, 0.0)
+        assert score == 0.0 and np.isnan(raw)
+
+    @pytest.mark.parametrize("value,expected", [
+        (-0.06, 25.0), (-0.05, 20.0), (0.0, 15.0), (0.05, 10.0), (0.10, 0.0),
+    ])
+    def test_accruals_band_edges(self, value, expected):
+        """Cut points belong to the lower-scoring band (strict <)."""
+        assert _accruals_score(value, 0.0, 1.0)[0] == expected
+
+    @pytest.mark.parametrize("value,expected", [
+        (0.02, 0.0), (0.021, 10.0), (0.05, 10.0), (0.08, 15.0),
+        (0.12, 20.0), (0.13, 25.0),
+    ])
+    def test_fcf_yield_band_edges(self, value, expected):
+        """Cut points belong to the lower-scoring band (strict >)."""
+        assert _fcf_yield_score(value, 1.0)[0] == expected
+
+    def test_roe_trend(self):
+        score, slope = _roe_trend_score(150.0, 1000.0, 120.0, 1000.0, 100.0, 1000.0)
+        assert score == 20.0
+        assert slope == pytest.approx(0.025)
+
+
+def test_alpha_import_does_not_load_numpy():
+    """Single-stock scoring stays NumPy-free for CLI cold start."""
+    code = "import sys, src.core.screening.alpha; print('numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,78 @@
+"""Tests for src/core/screening/alpha_batch.py."""
+
+import numpy as np
+import pytest
+
+from src.core.screening.alpha import compute_change_score
+from src.core.screening.alpha_batch import compute_change_score_batch
+
+
+# ---------------------------------------------------------------------------
+# compute_change_score_batch
+# ---------------------------------------------------------------------------
+
+def _make_full_detail(**overrides):
+    detail = {
+        "sector": "Technology",
+        "net_income_stmt": 100.0,
+        "operating_cashflow": 160.0,
+        "total_assets": 1000.0,
+        "revenue_history": [1300.0, 1100.0, 1000.0],
+        "fcf": 90.0,
+        "market_cap": 1000.0,
+        "net_income_history": [150.0, 120.0, 100.0],
+        "equity_history": [1000.0, 1000.0, 1000.0],
+        "earnings_growth": 0.05,
+    }
+    detail.update(overrides)
+    return detail
+
+
+_BATCH_CASES = [
+    _make_full_detail(),
+    _make_full_detail(sector="Utilities"),
+    _make_full_detail(net_income_stmt=None),
+    _make_full_detail(total_assets=0),
+    _make_full_detail(operating_cashflow=50.0),
+    _make_full_detail(revenue_history=[900.0, 1000.0, 1100.0]),
+    _make_full_detail(revenue_history=[1000.0, 0.0, 1000.0]),
+    _make_full_detail(revenue_history=[1000.0, None, 900.0]),
+    _make_full_detail(revenue_history=[1000.0]),
+    _make_full_detail(fcf=10.0),
+    _make_full_detail(market_cap=0),
+    _make_full_detail(net_income_history=[50.0, 120.0, 100.0]),
+    _make_full_detail(net_income_history=[150.0, -10.0, 100.0]),
+    _make_full_detail(equity_history=[1000.0, 0.0, 1000.0]),
+    _make_full_detail(equity_history=None),
+    _make_full_detail(earnings_growth=-0.05),
+    _make_full_detail(earnings_growth=-0.15),
+    _make_full_detail(earnings_growth=-0.50),
+    _make_full_detail(earnings_growth=None),
+    {},
+]
+
+_KEYS = ["accruals", "revenue_acceleration", "fcf_yield", "roe_trend"]
+
+
+class TestComputeChangeScoreBatch:
+    def test_matches_scalar(self):
+        """Every row of the batch result equals compute_change_score."""
+        batch = compute_change_score_batch(_BATCH_CASES)
+        for i, detail in enumerate(_BATCH_CASES):
+            expected = compute_change_score(detail)
+            for j, key in enumerate(_KEYS):
+                assert batch["scores"][i, j] == expected[key]["score"], (i, key)
+                exp_raw = expected[key]["raw"]
+                if exp_raw is None:
+                    assert np.isnan(batch["raw"][i, j]), (i, key)
+                else:
+                    assert batch["raw"][i, j] == pytest.approx(exp_raw), (i, key)
+            assert batch["earnings_penalty"][i] == expected["earnings_penalty"]
+            assert batch["change_score"][i] == pytest.approx(expected["change_score"])
+            assert batch["passed_count"][i] == expected["passed_count"]
+            assert bool(batch["quality_pass"][i]) == expected["quality_pass"]
+
+    def test_empty_input(self):
+        batch = compute_change_score_batch([])
+        assert batch["scores"].shape == (0, 4)
+        assert batch["change_score"].shape == (0,)
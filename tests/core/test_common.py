@@ -0,0 +1,57 @@
+"""Tests for src/core/common.py."""
+
+import math
+
+from src.core.common import finite_or_none, is_cash, is_etf, safe_float
+
+
+class TestIsCash:
+    def test_cash_symbols(self):
+        assert is_cash("JPY.CASH") is True
+        assert is_cash("USD.CASH") is True
+        assert is_cash("jpy.cash") is True
+        assert is_cash("Usd.Cash") is True
+        assert is_cash("USD.CaSh") is True
+
+    def test_non_cash_symbols(self):
+        assert is_cash("7203.T") is False
+        assert is_cash("CASH") is False
+        assert is_cash("") is False
+
+
+class TestIsEtf:
+    def test_quote_type_etf(self):
+        assert is_etf({"quoteType": "ETF"}) is True
+
+    def test_stock_with_fundamentals(self):
+        assert is_etf({"sector": "Technology", "net_income_stmt": 1e9}) is False
+
+    def test_no_fundamentals_is_etf(self):
+        assert is_etf({"symbol": "XYZ"}) is True
+
+    def test_does_not_mutate_and_tracks_updates(self):
+        """The shared detail dict is left untouched; later updates are seen."""
+        detail = {"sector": "Technology"}
+        assert is_etf(detail) is False
+        assert detail == {"sector": "Technology"}
+        detail["quoteType"] = "ETF"
+        assert is_etf(detail) is True
+
+
+class TestFiniteOrNone:
+    def test_values(self):
+        assert finite_or_none(1.5) == 1.5
+        assert finite_or_none("2") == 2.0
+        assert finite_or_none(None) is None
+        assert finite_or_none(float("nan")) is None
+        assert finite_or_none(math.inf) is None
+        assert finite_or_none("abc") is None
+
+
+class TestSafeFloat:
+    def test_values(self):
+        assert safe_float(1.5) == 1.5
+        assert safe_float(None) == 0.0
+        assert safe_float(float("nan"), default=-1.0) == -1.0
+        assert safe_float(-math.inf) == 0.0
+        assert safe_float("abc", default=3.0) == 3.0
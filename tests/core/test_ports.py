@@ -193,7 +193,7 @@ class TestProactiveEngineInjection:
 
         engine = ProactiveEngine(graph_reader=_StaleReader())
         result = engine._check_time_triggers()
-        titles = [s["title"] for s in result]
+        titles = [s.title for s in result]
         assert "ヘルスチェックの実施" in titles
 
     def test_engine_uses_injected_reader_for_thesis_notes(self):
@@ -206,7 +206,7 @@ class TestProactiveEngineInjection:
 
         engine = ProactiveEngine(graph_reader=_ThesisReader())
         result = engine._check_time_triggers()
-        titles = [s["title"] for s in result]
+        titles = [s.title for s in result]
         assert any("7203.T" in t for t in titles)
 
     def test_engine_uses_injected_reader_for_concern_notes(self):
@@ -219,7 +219,7 @@ class TestProactiveEngineInjection:
 
         engine = ProactiveEngine(graph_reader=_ConcernReader())
         result = engine._check_state_triggers()
-        titles = [s["title"] for s in result]
+        titles = [s.title for s in result]
         assert any("AAPL" in t for t in titles)
 
     def test_engine_uses_injected_reader_for_recurring_picks(self):
@@ -232,7 +232,7 @@ class TestProactiveEngineInjection:
 
         engine = ProactiveEngine(graph_reader=_RecurringReader())
         result = engine._check_state_triggers()
-        titles = [s["title"] for s in result]
+        titles = [s.title for s in result]
         assert any("9984.T" in t for t in titles)
 
     def test_get_suggestions_convenience_accepts_graph_reader(self):
@@ -3,7 +3,6 @@
 All graph/JSON dependencies are mocked — no real Neo4j or file I/O required.
 """
 from datetime import date, timedelta
-from unittest.mock import patch
 
 import pytest
 
@@ -27,47 +26,35 @@ def _date_str(days_ago: int) -> str:
 # ---------------------------------------------------------------------------
 
 class TestProactiveEngineTimeTriggersHealth:
-    def test_stale_health_check_triggers_suggestion(self, engine):
+    def test_stale_health_check_triggers_suggestion(self, engine, gq_stub):
         """Health check >14d old → suggests running it."""
-        with patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(20),
-        ):
-            result = engine._check_time_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_last_health_check_date", _date_str(20))
+        result = engine._check_time_triggers()
+        titles = [s.title for s in result]
         assert "ヘルスチェックの実施" in titles
 
-    def test_fresh_health_check_no_trigger(self, engine):
+    def test_fresh_health_check_no_trigger(self, engine, gq_stub):
         """Health check within 7d → no health suggestion."""
-        with patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(5),
-        ):
-            result = engine._check_time_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_last_health_check_date", _date_str(5))
+        result = engine._check_time_triggers()
+        titles = [s.title for s in result]
         assert "ヘルスチェックの実施" not in titles
 
-    def test_no_health_check_triggers_suggestion(self, engine):
+    def test_no_health_check_triggers_suggestion(self, engine, gq_stub):
         """No health check record (None) → suggests running it with medium urgency."""
-        with patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=None,
-        ):
-            result = engine._check_time_triggers()
-        hc = next((s for s in result if s["title"] == "ヘルスチェックの実施"), None)
+        gq_stub("get_last_health_check_date", None)
+        result = engine._check_time_triggers()
+        hc = next((s for s in result if s.title == "ヘルスチェックの実施"), None)
         assert hc is not None
-        assert hc["urgency"] == "medium"
+        assert hc.urgency == "medium"
 
-    def test_very_stale_health_check_is_high_urgency(self, engine):
+    def test_very_stale_health_check_is_high_urgency(self, engine, gq_stub):
         """>30d since last health check → urgency=high."""
-        with patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(35),
-        ):
-            result = engine._check_time_triggers()
-        hc = next((s for s in result if s["title"] == "ヘルスチェックの実施"), None)
+        gq_stub("get_last_health_check_date", _date_str(35))
+        result = engine._check_time_triggers()
+        hc = next((s for s in result if s.title == "ヘルスチェックの実施"), None)
         assert hc is not None
-        assert hc["urgency"] == "high"
+        assert hc.urgency == "high"
 
 
 # ---------------------------------------------------------------------------
@@ -75,31 +62,21 @@ class TestProactiveEngineTimeTriggersHealth:
 # ---------------------------------------------------------------------------
 
 class TestProactiveEngineTimeTriggersThesis:
-    def test_old_thesis_note_triggers_suggestion(self, engine):
+    def test_old_thesis_note_triggers_suggestion(self, engine, gq_stub):
         """Thesis note >90d old → suggest review."""
         mock_notes = [{"symbol": "AAPL", "days_old": 100}]
-        with patch(
-            "src.data.graph_query.get_old_thesis_notes",
-            return_value=mock_notes,
-        ), patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(3),
-        ):
-            result = engine._check_time_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_old_thesis_notes", mock_notes)
+        gq_stub("get_last_health_check_date", _date_str(3))
+        result = engine._check_time_triggers()
+        titles = [s.title for s in result]
         assert any("投資テーゼを見直す" in t for t in titles)
 
-    def test_fresh_thesis_note_no_trigger(self, engine):
+    def test_fresh_thesis_note_no_trigger(self, engine, gq_stub):
         """No old thesis notes → no thesis suggestion."""
-        with patch(
-            "src.data.graph_query.get_old_thesis_notes",
-            return_value=[],
-        ), patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(3),
-        ):
-            result = engine._check_time_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_old_thesis_notes", [])
+        gq_stub("get_last_health_check_date", _date_str(3))
+        result = engine._check_time_triggers()
+        titles = [s.title for s in result]
         assert not any("投資テーゼを見直す" in t for t in titles)
 
 
@@ -108,61 +85,40 @@ class TestProactiveEngineTimeTriggersThesis:
 # ---------------------------------------------------------------------------
 
 class TestProactiveEngineTimeTriggersEarnings:
-    def test_upcoming_earnings_triggers_suggestion(self, engine):
+    def test_upcoming_earnings_triggers_suggestion(self, engine, gq_stub):
         """Earnings event within 7d → high urgency suggestion."""
         ev_date = (date.today() + timedelta(days=3)).isoformat()
         mock_events = [{"date": ev_date, "text": "トヨタ7203.T 決算発表"}]
-        with patch(
-            "src.data.graph_query.get_upcoming_events",
-            return_value=mock_events,
-        ), patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(3),
-        ), patch(
-            "src.data.graph_query.get_old_thesis_notes",
-            return_value=[],
-        ):
-            result = engine._check_time_triggers()
+        gq_stub("get_upcoming_events", mock_events)
+        gq_stub("get_last_health_check_date", _date_str(3))
+        gq_stub("get_old_thesis_notes", [])
+        result = engine._check_time_triggers()
         earnings = next(
-            (s for s in result if "決算イベント" in s["title"]), None
+            (s for s in result if "決算イベント" in s.title), None
         )
         assert earnings is not None
-        assert earnings["urgency"] == "high"
+        assert earnings.urgency == "high"
 
-    def test_no_upcoming_events_no_trigger(self, engine):
+    def test_no_upcoming_events_no_trigger(self, engine, gq_stub):
         """No upcoming events → no earnings suggestion."""
-        with patch(
-            "src.data.graph_query.get_upcoming_events",
-            return_value=[],
-        ), patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(3),
-        ), patch(
-            "src.data.graph_query.get_old_thesis_notes",
-            return_value=[],
-        ):
-            result = engine._check_time_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_upcoming_events", [])
+        gq_stub("get_last_health_check_date", _date_str(3))
+        gq_stub("get_old_thesis_notes", [])
+        result = engine._check_time_triggers()
+        titles = [s.title for s in result]
         assert not any("決算イベント" in t for t in titles)
 
-    def test_earnings_title_contains_date(self, engine):
+    def test_earnings_title_contains_date(self, engine, gq_stub):
         """Earnings suggestion should include the event date in reason."""
         ev_date = (date.today() + timedelta(days=2)).isoformat()
         mock_events = [{"date": ev_date, "text": "NVDA 決算"}]
-        with patch(
-            "src.data.graph_query.get_upcoming_events",
-            return_value=mock_events,
-        ), patch(
-            "src.data.graph_query.get_last_health_check_date",
-            return_value=_date_str(3),
-        ), patch(
-            "src.data.graph_query.get_old_thesis_notes",
-            return_value=[],
-        ):
-            result = engine._check_time_triggers()
-        earnings = next((s for s in result if "決算イベント" in s["title"]), None)
+        gq_stub("get_upcoming_events", mock_events)
+        gq_stub("get_last_health_check_date", _date_str(3))
+        gq_stub("get_old_thesis_notes", [])
+        result = engine._check_time_triggers()
+        earnings = next((s for s in result if "決算イベント" in s.title), None)
         assert earnings is not None
-        assert ev_date in earnings["reason"]
+        assert ev_date in earnings.reason
 
 
 # ---------------------------------------------------------------------------
@@ -170,61 +126,42 @@ class TestProactiveEngineTimeTriggersEarnings:
 # ---------------------------------------------------------------------------
 
 class TestProactiveEngineStateTriggers:
-    def test_recurring_pick_triggers_suggestion(self, engine):
+    def test_recurring_pick_triggers_suggestion(self, engine, gq_stub):
         """Stock appearing 3+ times in screening → suggest deeper analysis."""
         mock_picks = [{"symbol": "NVDA", "count": 5}]
-        with patch(
-            "src.data.graph_query.get_recurring_picks",
-            return_value=mock_picks,
-        ), patch(
-            "src.data.graph_query.get_concern_notes",
-            return_value=[],
-        ):
-            result = engine._check_state_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_recurring_picks", mock_picks)
+        gq_stub("get_concern_notes", [])
+        result = engine._check_state_triggers()
+        titles = [s.title for s in result]
         assert any("NVDA" in t and "詳細分析" in t for t in titles)
+        assert [s.symbol for s in result] == ["NVDA"]
 
-    def test_single_pick_no_trigger(self, engine):
+    def test_single_pick_no_trigger(self, engine, gq_stub):
         """Stock with count < 3 → not returned by mock (empty list)."""
-        with patch(
-            "src.data.graph_query.get_recurring_picks",
-            return_value=[],
-        ), patch(
-            "src.data.graph_query.get_concern_notes",
-            return_value=[],
-        ):
-            result = engine._check_state_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_recurring_picks", [])
+        gq_stub("get_concern_notes", [])
+        result = engine._check_state_triggers()
+        titles = [s.title for s in result]
         assert not any("詳細分析" in t for t in titles)
 
-    def test_concern_note_triggers_suggestion(self, engine):
+    def test_concern_note_triggers_suggestion(self, engine, gq_stub):
         """Concern note exists → suggest re-review."""
         mock_concerns = [{"symbol": "7203.T", "days_old": 15}]
-        with patch(
-            "src.data.graph_query.get_recurring_picks",
-            return_value=[],
-        ), patch(
-            "src.data.graph_query.get_concern_notes",
-            return_value=mock_concerns,
-        ):
-            result = engine._check_state_triggers()
+        gq_stub("get_recurring_picks", [])
+        gq_stub("get_concern_notes", mock_concerns)
+        result = engine._check_state_triggers()
         concern = next(
-            (s for s in result if "懸念メモ" in s["title"]), None
+            (s for s in result if "懸念メモ" in s.title), None
         )
         assert concern is not None
-        assert "7203.T" in concern["title"]
+        assert "7203.T" in concern.title
 
-    def test_no_concern_note_no_trigger(self, engine):
+    def test_no_concern_note_no_trigger(self, engine, gq_stub):
         """No concern notes → no concern suggestion."""
-        with patch(
-            "src.data.graph_query.get_recurring_picks",
-            return_value=[],
-        ), patch(
-            "src.data.graph_query.get_concern_notes",
-            return_value=[],
-        ):
-            result = engine._check_state_triggers()
-        titles = [s["title"] for s in result]
+        gq_stub("get_recurring_picks", [])
+        gq_stub("get_concern_notes", [])
+        result = engine._check_state_triggers()
+        titles = [s.title for s in result]
         assert not any("懸念メモ" in t for t in titles)
 
 
@@ -233,42 +170,112 @@ class TestProactiveEngineStateTriggers:
 # ---------------------------------------------------------------------------
 
 class TestProactiveEngineContextualTriggers:
-    def test_sector_match_triggers_suggestion(self, engine):
+    def test_sector_match_triggers_suggestion(self, engine, gq_stub):
         """Research sector matches held stock → low urgency suggestion."""
         mock_research = [{"id": "r1", "type": "Research", "target": "Technology", "summary": "..."}]
         mock_holdings = [{"symbol": "AAPL", "sector": "Technology"}]
-        with patch(
-            "src.data.graph_query.get_industry_research_for_linking",
-            return_value=mock_research,
-        ), patch(
-            "src.data.graph_query.get_current_holdings",
-            return_value=mock_holdings,
-        ):
-            result = engine._check_contextual_triggers(sector="Technology")
+        gq_stub("get_industry_research_for_linking", mock_research)
+        gq_stub("get_current_holdings", mock_holdings)
+        result = engine._check_contextual_triggers(sector="Technology")
         assert len(result) == 1
-        assert result[0]["urgency"] == "low"
-        assert "Technology" in result[0]["title"]
+        assert result[0].urgency == "low"
+        assert "Technology" in result[0].title
 
     def test_no_sector_no_trigger(self, engine):
         """Empty sector → skip contextual check entirely."""
         result = engine._check_contextual_triggers(sector="")
         assert result == []
 
-    def test_sector_not_in_holdings_no_trigger(self, engine):
+    def test_no_sector_issues_no_graph_query(self):
+        """Empty sector returns before touching the graph reader."""
+        from unittest.mock import MagicMock
+        from src.core.proactive_engine import ProactiveEngine
+        reader = MagicMock()
+        assert ProactiveEngine(graph_reader=reader)._check_contextual_triggers(sector="") == []
+        assert reader.method_calls == []
+
+    def test_sector_not_in_holdings_no_trigger(self, engine, gq_stub):
         """Research sector present but not held → no suggestion."""
         mock_research = [{"id": "r1", "type": "Research", "target": "Healthcare", "summary": "..."}]
         mock_holdings = [{"symbol": "AAPL", "sector": "Technology"}]
-        with patch(
-            "src.data.graph_query.get_industry_research_for_linking",
-            return_value=mock_research,
-        ), patch(
-            "src.data.graph_query.get_current_holdings",
-            return_value=mock_holdings,
-        ):
-            result = engine._check_contextual_triggers(sector="Healthcare")
+        gq_stub("get_industry_research_for_linking", mock_research)
+        gq_stub("get_current_holdings", mock_holdings)
+        result = engine._check_contextual_triggers(sector="Healthcare")
         assert result == []
 
 
+# ---------------------------------------------------------------------------
+# TestGetSuggestionsQueries
+# ---------------------------------------------------------------------------
+
+class TestGetSuggestionsQueries:
+    def test_each_graph_query_runs_once_per_call(self):
+        """One get_suggestions() issues every reader query at most once."""
+        from unittest.mock import MagicMock
+        from src.core.proactive_engine import get_suggestions
+
+        reader = MagicMock()
+        reader.get_last_health_check_date.return_value = _date_str(20)
+        reader.get_old_thesis_notes.return_value = [{"symbol": "AAPL", "days_old": 100}]
+        reader.get_upcoming_events.return_value = []
+        reader.get_recurring_picks.return_value = []
+        reader.get_concern_notes.return_value = []
+        reader.get_industry_research_for_linking.return_value = [{"id": "r1"}]
+        reader.get_current_holdings.return_value = [{"symbol": "AAPL", "sector": "Technology"}]
+
+        get_suggestions(context="スクリーニング完了", symbol="AAPL", sector="Technology", graph_reader=reader)
+
+        called = [name for name, _, _ in reader.method_calls]
+        assert called
+        assert len(called) == len(set(called))
+
+    def test_snapshot_replaces_individual_queries(self):
+        """A reader offering get_proactive_snapshot skips the four per-trigger queries."""
+        from unittest.mock import MagicMock
+        from src.core.proactive_engine import get_suggestions
+
+        reader = MagicMock()
+        reader.get_proactive_snapshot.return_value = {
+            "last_health_check_date": _date_str(20),
+            "old_thesis_notes": [{"symbol": "AAPL", "days_old": 100}],
+            "upcoming_events": [],
+            "recurring_picks": [{"symbol": "TSM", "count": 5}],
+        }
+        reader.get_concern_notes.return_value = []
+
+        result = get_suggestions(symbol="TSM", graph_reader=reader)
+
+        titles = " ".join(s["title"] for s in result)
+        assert "AAPL" in titles and "TSM" in titles
+        reader.get_proactive_snapshot.assert_called_once()
+        for name in ("get_last_health_check_date", "get_old_thesis_notes",
+                     "get_upcoming_events", "get_recurring_picks"):
+            getattr(reader, name).assert_not_called()
+
+
+    def test_check_triggers_read_snapshot_slices(self):
+        """With a snapshot, the time/state checks make no per-trigger queries."""
+        from unittest.mock import MagicMock
+        from src.core.proactive_engine import ProactiveEngine
+
+        reader = MagicMock()
+        reader.get_concern_notes.return_value = []
+        engine = ProactiveEngine(graph_reader=reader)
+        snapshot = {
+            "last_health_check_date": None,
+            "old_thesis_notes": [],
+            "upcoming_events": [],
+            "recurring_picks": [{"symbol": "NVDA", "count": 4}],
+        }
+
+        time_titles = [s.title for s in engine._check_time_triggers(snapshot=snapshot)]
+        state = engine._check_state_triggers(snapshot=snapshot)
+
+        assert time_titles == ["ヘルスチェックの実施"]
+        assert [s.symbol for s in state] == ["NVDA"]
+        assert [name for name, _, _ in reader.method_calls] == ["get_concern_notes"]
+
+
 # ---------------------------------------------------------------------------
 # TestFormatSuggestions
 # ---------------------------------------------------------------------------
@@ -294,7 +301,30 @@ class TestFormatSuggestions:
         assert "portfolio health" in output
         assert "次のアクション提案" in output
 
-    def test_get_suggestions_returns_max_3(self):
+    def test_format_suggestions_exact_layout(self):
+        from src.core.proactive_engine import format_suggestions
+        output = format_suggestions([
+            {"title": "A", "reason": "r"},
+            {"emoji": "📋", "title": "B", "reason": "x", "command_hint": "c"},
+        ])
+        assert output == (
+            "\n---\n💡 **次のアクション提案** (2件)\n\n"
+            "1. 💡 **A**\n   r\n\n"
+            "2. 📋 **B**\n   x\n   → `c` を実行してください\n"
+        )
+
+    def test_format_suggestions_accepts_dataclass(self):
+        from src.core.proactive_engine import Suggestion, format_suggestions
+        s = Suggestion(
+            emoji="📋",
+            title="ヘルスチェックの実施",
+            reason="テスト",
+            command_hint="portfolio health",
+            urgency="high",
+        )
+        assert format_suggestions([s]) == format_suggestions([s.to_dict()])
+
+    def test_get_suggestions_returns_max_3(self, gq_stub):
         """get_suggestions() never returns more than 3 items."""
         from src.core.proactive_engine import get_suggestions
 
@@ -306,11 +336,35 @@ class TestFormatSuggestions:
         mock_picks = [{"symbol": "TSM", "count": 5}]
         mock_concerns = [{"symbol": "MSFT", "days_old": 10}]
 
-        with patch("src.data.graph_query.get_last_health_check_date", return_value=mock_hc), \
-             patch("src.data.graph_query.get_old_thesis_notes", return_value=mock_thesis), \
-             patch("src.data.graph_query.get_upcoming_events", return_value=mock_events), \
-             patch("src.data.graph_query.get_recurring_picks", return_value=mock_picks), \
-             patch("src.data.graph_query.get_concern_notes", return_value=mock_concerns):
-            result = get_suggestions()
+        gq_stub("get_last_health_check_date", mock_hc)
+        gq_stub("get_old_thesis_notes", mock_thesis)
+        gq_stub("get_upcoming_events", mock_events)
+        gq_stub("get_recurring_picks", mock_picks)
+        gq_stub("get_concern_notes", mock_concerns)
+        result = get_suggestions()
 
         assert len(result) <= 3
+        assert all(isinstance(s, dict) for s in result)
+        assert result[0]["urgency"] == "high"
+
+    def test_get_suggestions_ranks_and_dedups_like_stable_sort(self, monkeypatch):
+        """Top 3 equal the first 3 distinct titles of a stable urgency sort."""
+        import random
+        from src.core.proactive_engine import _URGENCY_ORDER, ProactiveEngine, Suggestion
+
+        rng = random.Random(0)
+        engine = ProactiveEngine()
+        for _ in range(50):
+            items = [
+                Suggestion("-", f"t{rng.randrange(5)}", str(i), "-", rng.choice(["high", "medium", "low"]))
+                for i in range(rng.randrange(9))
+            ]
+            monkeypatch.setattr(engine, "_check_time_triggers", lambda snapshot: list(items))
+            monkeypatch.setattr(engine, "_check_state_triggers", lambda symbol, snapshot: [])
+            monkeypatch.setattr(engine, "_check_contextual_triggers", lambda sector: [])
+            monkeypatch.setattr(engine, "_check_context_triggers", lambda context: [])
+
+            expected: dict[str, Suggestion] = {}
+            for s in sorted(items, key=lambda s: _URGENCY_ORDER[s.urgency]):
+                expected.setdefault(s.title, s)
+            assert engine.get_suggestions() == [s.to_dict() for s in list(expected.values())[:3]]
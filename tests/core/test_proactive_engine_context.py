@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.core.proactive_engine import ProactiveEngine, _CONTEXT_PATTERNS
+from src.core.proactive_engine import ProactiveEngine, Suggestion, _CONTEXT_PATTERNS
 
 
 @pytest.fixture
@@ -26,49 +26,49 @@ class TestCheckContextTriggers:
         for kw in ["エネルギー", "原油", "石油", "天然ガス", "energy", "oil"]:
             results = engine._check_context_triggers(f"セクター: {kw}関連")
             assert len(results) >= 1
-            titles = [r["title"] for r in results]
+            titles = [r.title for r in results]
             assert "エネルギーセクターの確認" in titles
 
     def test_tech_weak_keywords_trigger(self, engine):
         for kw in ["テック軟調", "ハイテク下落", "テクノロジー下落", "tech decline"]:
             results = engine._check_context_triggers(kw)
             assert len(results) >= 1
-            titles = [r["title"] for r in results]
+            titles = [r.title for r in results]
             assert "テック銘柄のリスク確認" in titles
 
     def test_gold_keywords_trigger(self, engine):
         for kw in ["金急騰", "金価格", "ゴールド", "gold"]:
             results = engine._check_context_triggers(kw)
             assert len(results) >= 1
-            titles = [r["title"] for r in results]
+            titles = [r.title for r in results]
             assert "コモディティ関連の影響確認" in titles
 
     def test_rate_keywords_trigger(self, engine):
         for kw in ["利上げ", "金利上昇", "rate hike", "利下げ", "金利低下"]:
             results = engine._check_context_triggers(kw)
             assert len(results) >= 1
-            titles = [r["title"] for r in results]
+            titles = [r.title for r in results]
             assert "金利変動のPF影響確認" in titles
 
     def test_earnings_keywords_trigger(self, engine):
         for kw in ["決算", "好決算", "悪決算", "earnings", "上方修正", "下方修正"]:
             results = engine._check_context_triggers(kw)
             assert len(results) >= 1
-            titles = [r["title"] for r in results]
+            titles = [r.title for r in results]
             assert "決算関連銘柄のフォローアップ" in titles
 
     def test_health_warning_trigger(self, engine):
         for kw in ["警戒", "EXIT", "損切り", "バリュートラップ", "デッドクロス"]:
             results = engine._check_context_triggers(kw)
             assert len(results) >= 1
-            titles = [r["title"] for r in results]
+            titles = [r.title for r in results]
             assert "警戒銘柄の対応検討" in titles
 
     def test_screening_result_trigger(self, engine):
         for kw in ["スクリーニング完了", "銘柄発見", "上位ランクイン"]:
             results = engine._check_context_triggers(kw)
             assert len(results) >= 1
-            titles = [r["title"] for r in results]
+            titles = [r.title for r in results]
             assert "上位銘柄の詳細分析" in titles
 
     def test_max_two_context_triggers(self, engine):
@@ -88,27 +88,25 @@ class TestCheckContextTriggers:
         results = engine._check_context_triggers("決算発表あり")
         assert len(results) >= 1
         r = results[0]
-        assert "emoji" in r
-        assert "title" in r
-        assert "reason" in r
-        assert "command_hint" in r
-        assert "urgency" in r
-        assert r["urgency"] == "low"
+        assert isinstance(r, Suggestion)
+        assert set(r.to_dict()) == {"emoji", "title", "reason", "command_hint", "urgency", "symbol"}
+        assert r.symbol == ""
+        assert r.urgency == "low"
 
     def test_reason_includes_context_prefix(self, engine):
         results = engine._check_context_triggers("決算発表あり")
-        assert results[0]["reason"].startswith("実行結果に関連:")
+        assert results[0].reason.startswith("実行結果に関連:")
 
     def test_reason_truncates_long_context(self, engine):
         long_context = "決算" + "x" * 200
         results = engine._check_context_triggers(long_context)
-        assert len(results[0]["reason"]) < 200  # truncated at 60 chars of context
+        assert len(results[0].reason) < 200  # truncated at 60 chars of context
 
     def test_context_integrated_in_get_suggestions(self, engine, monkeypatch):
         """Context triggers appear in get_suggestions output."""
         # Stub out other trigger methods to isolate context triggers
-        monkeypatch.setattr(engine, "_check_time_triggers", lambda: [])
-        monkeypatch.setattr(engine, "_check_state_triggers", lambda s="": [])
+        monkeypatch.setattr(engine, "_check_time_triggers", lambda snapshot=None: [])
+        monkeypatch.setattr(engine, "_check_state_triggers", lambda s="", snapshot=None: [])
         monkeypatch.setattr(engine, "_check_contextual_triggers", lambda s="": [])
 
         results = engine.get_suggestions(context="決算発表あり")
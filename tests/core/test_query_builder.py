@@ -10,6 +10,7 @@ from src.core.screening.query_builder import (
     _build_exchange_condition,
     _build_sector_condition,
     _build_theme_condition,
+    load_preset,
     load_themes,
     REGION_MAP,
     EXCHANGE_MAP,
@@ -353,6 +354,36 @@ class TestLoadThemes:
         assert result == {}
 
 
+# ===================================================================
+# load_preset (cached YAML parse)
+# ===================================================================
+
+
+class TestLoadPreset:
+    def test_returns_independent_copy(self):
+        """Callers mutating the criteria must not poison the cache."""
+        first = load_preset("value")
+        first["max_per"] = -1
+        assert load_preset("value").get("max_per") != -1
+
+    def test_unknown_preset_raises(self):
+        with pytest.raises(ValueError, match="Unknown preset"):
+            load_preset("no-such-preset")
+
+    def test_reloads_when_file_changes(self, monkeypatch, tmp_path):
+        import os
+        import src.core.screening.query_builder as qb
+        path = tmp_path / "presets.yaml"
+        path.write_text("presets:\n  p:\n    criteria:\n      max_per: 10\n")
+        monkeypatch.setattr(qb, "_CONFIG_PATH", path)
+        assert load_preset("p") == {"max_per": 10}
+
+        path.write_text("presets:\n  p:\n    criteria:\n      max_per: 20\n")
+        st = path.stat()
+        os.utime(path, (st.st_atime, st.st_mtime + 5))
+        assert load_preset("p") == {"max_per": 20}
+
+
 # ===================================================================
 # KIK-439: _build_theme_condition
 # ===================================================================
@@ -127,6 +127,16 @@ class TestValueScreenerScreen:
                      "roe", "value_score"]:
             assert key in r
 
+    def test_sparse_stock_info_fields_default_to_none(self):
+        """Missing keys in stock info -> None fields, symbol falls back to the query."""
+        market = _MockMarket(symbols=["1001.T"])
+        vs = ValueScreener(_MockYahooClient(stock_info={"per": 8.0}), market)
+        results = vs.screen()
+        assert len(results) == 1
+        assert results[0]["symbol"] == "1001.T"
+        assert results[0]["name"] is None
+        assert results[0]["dividend_yield_trailing"] is None
+
     def test_sorted_by_value_score_descending(self):
         """Results sorted by value_score descending."""
         def info_fn(symbol):
@@ -212,3 +222,81 @@ class TestValueScreenerScreen:
         results = vs.screen()
         assert len(results) == 1
         assert "value_score" in results[0]
+
+    def test_prefetched_skips_client_lookup(self):
+        """Symbols present in prefetched are not fetched from the client."""
+        calls = []
+
+        def _lookup(symbol):
+            calls.append(symbol)
+            return _make_stock_info(symbol=symbol)
+
+        market = _MockMarket(symbols=["1001.T", "1002.T"])
+        vs = ValueScreener(_MockYahooClient(stock_info=_lookup), market)
+        prefetched = {"1001.T": _make_stock_info(symbol="1001.T"), "1002.T": None}
+        results = vs.screen(prefetched=prefetched)
+        assert calls == []
+        assert [r["symbol"] for r in results] == ["1001.T"]
+
+    def test_duplicate_symbols_screened_once(self):
+        calls = []
+
+        def info(symbol):
+            calls.append(symbol)
+            return _make_stock_info(symbol=symbol)
+
+        vs = ValueScreener(_MockYahooClient(stock_info=info), _MockMarket(), max_workers=1)
+        results = vs.screen(symbols=["1001.T", "1002.T", "1001.T", "1002.T"])
+        assert [r["symbol"] for r in results] == ["1001.T", "1002.T"]
+        assert calls == ["1001.T", "1002.T"]
+
+    def test_market_config_fetched_once_across_screens(self):
+        """Preset sweeps reuse the market's default symbols and thresholds."""
+        from unittest.mock import MagicMock
+        market = MagicMock()
+        market.get_default_symbols.return_value = ["1001.T"]
+        market.get_thresholds.return_value = {}
+        vs = ValueScreener(_MockYahooClient(stock_info=_make_stock_info()), market)
+        for _ in range(3):
+            assert len(vs.screen()) == 1
+        market.get_default_symbols.assert_called_once()
+        market.get_thresholds.assert_called_once()
+
+    def test_parallel_fetch_matches_serial(self):
+        """Concurrent fetching fetches each symbol once and keeps the result set."""
+        import threading
+
+        symbols = [f"{1000 + i}.T" for i in range(12)]
+        calls = []
+        lock = threading.Lock()
+
+        def _lookup(symbol):
+            with lock:
+                calls.append(symbol)
+            return _make_stock_info(symbol=symbol, per=5.0 + int(symbol[:4]) % 7)
+
+        market = _MockMarket(symbols=symbols)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            parallel = ValueScreener(_MockYahooClient(stock_info=_lookup), market, max_workers=4)
+            serial = ValueScreener(_MockYahooClient(stock_info=_lookup), market, max_workers=1)
+        par_results = parallel.screen(top_n=50)
+        assert sorted(calls) == sorted(symbols)
+        assert par_results == serial.screen(top_n=50)
+
+    def test_top_n_matches_full_sort(self):
+        """Top-N selection keeps the stable descending order of a full sort."""
+        symbols = [f"{2000 + i}.T" for i in range(30)]
+
+        def _lookup(symbol):
+            # Repeating PERs -> tied value scores exercise ordering stability
+            return _make_stock_info(symbol=symbol, per=6.0 + int(symbol[:4]) % 5)
+
+        market = _MockMarket(symbols=symbols)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            vs = ValueScreener(_MockYahooClient(stock_info=_lookup), market, max_workers=1)
+        everything = vs.screen(top_n=100)
+        assert len(everything) == 30
+        assert vs.screen(top_n=7) == everything[:7]
+        assert vs.screen(top_n=0) == []
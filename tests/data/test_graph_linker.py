@@ -84,6 +84,87 @@ class TestAIGraphLinkerLinkOnSave:
         assert result[0]["confidence"] == pytest.approx(0.85)
 
 
+    def test_replay_served_from_cache(
+        self, monkeypatch, linker, sample_new_node, sample_candidates
+    ):
+        """Same node/candidates again -> no second LLM call."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        llm_response = '[{"rel_type":"SUPPORTS","to_id":"candidate_1","confidence":0.9,"reason":"r"}]'
+        with patch.object(linker, "_call_llm", return_value=llm_response) as mock_llm:
+            first = linker.link_on_save(sample_new_node, sample_candidates)
+            second = linker.link_on_save(sample_new_node, sample_candidates)
+        assert first == second
+        assert first[0]["to_id"] == "report_2026-01-01_NVDA"
+        assert mock_llm.call_count == 1
+
+    def test_cache_kept_outside_yahoo_cache(
+        self, monkeypatch, linker, sample_new_node, sample_candidates
+    ):
+        """LLM responses go to their own SQLite file, not the yahoo_client cache."""
+        from src.data.graph_store import linker as linker_mod
+        from src.data.yahoo_client import _cache
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        with patch.object(linker, "_call_llm", return_value="[]"):
+            linker.link_on_save(sample_new_node, sample_candidates)
+        assert linker_mod._LINK_CACHE_PATH.exists()
+        assert not _cache._db_path().exists()
+
+    def test_failed_call_not_cached(
+        self, monkeypatch, linker, sample_new_node, sample_candidates
+    ):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        with patch.object(linker, "_call_llm", side_effect=["", "[]"]) as mock_llm:
+            assert linker.link_on_save(sample_new_node, sample_candidates) == []
+            assert linker.link_on_save(sample_new_node, sample_candidates) == []
+        assert mock_llm.call_count == 2
+
+
+# ===================================================================
+# TestAIGraphLinkerLinkMany
+# ===================================================================
+
+class TestAIGraphLinkerLinkMany:
+    def test_results_in_input_order(self, monkeypatch, linker, sample_candidates):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+
+        def fake_link(node, cands):
+            return [{"from": node["id"]}]
+
+        items = [({"id": f"n{i}"}, sample_candidates) for i in range(6)]
+        with patch.object(linker, "link_on_save", side_effect=fake_link) as mock_link:
+            result = linker.link_many(items, max_workers=3)
+        assert [r[0]["from"] for r in result] == [f"n{i}" for i in range(6)]
+        assert mock_link.call_count == 6
+
+    def test_unavailable_returns_empty_lists(self, linker, sample_candidates):
+        items = [({"id": "n0"}, sample_candidates), ({"id": "n1"}, sample_candidates)]
+        assert linker.link_many(items) == [[], []]
+
+    def test_empty_items(self, linker):
+        assert linker.link_many([]) == []
+
+
+# ===================================================================
+# TestBuildPrompt
+# ===================================================================
+
+class TestBuildPrompt:
+    def test_contains_node_and_candidates(self, linker, sample_new_node, sample_candidates):
+        prompt = linker._build_prompt(sample_new_node, sample_candidates)
+        assert "種別: Research\n対象: AI\n" in prompt
+        assert "[candidate_2] Note (note_2026-01-15_AAPL): AAPLの懸念事項" in prompt
+        assert "confidence が 0.6 未満" in prompt
+        assert prompt.endswith('"reason":"理由"}]')
+
+    def test_braces_in_content_kept_literally(self, linker):
+        node = {"type": "Note", "summary": "{node_desc} {0}"}
+        cands = [{"id": "n1", "type": "Note", "summary": "{}"}]
+        prompt = linker._build_prompt(node, cands)
+        assert "内容要約: {node_desc} {0}" in prompt
+        assert "[candidate_0] Note (n1): {}" in prompt
+
+
 # ===================================================================
 # TestParseRelationships
 # ===================================================================
@@ -140,6 +221,40 @@ class TestParseRelationships:
         assert len(result) == 1
         assert result[0]["rel_type"] == "SUPPORTS"
 
+    def test_json_in_markdown_fence_extracted(self, linker, sample_candidates):
+        raw = '```json\n[\n  {"rel_type":"INFORMS","to_id":"candidate_1","confidence":0.8,"reason":"[参考]"}\n]\n```'
+        result = linker._parse_relationships(raw, sample_candidates)
+        assert len(result) == 1
+        assert result[0]["to_id"] == "report_2026-01-01_NVDA"
+
+    def test_unbalanced_brackets_returns_empty(self, linker, sample_candidates):
+        assert linker._parse_relationships("] no array [", sample_candidates) == []
+
+
+# ===================================================================
+# TestCallLlm
+# ===================================================================
+
+class TestCallLlm:
+    def test_reuses_one_session(self, monkeypatch, linker):
+        from src.data.graph_store import linker as mod
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        monkeypatch.setattr(mod, "_SESSION", None)
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"content": [{"type": "text", "text": "[]"}]}
+        with patch("requests.Session.post", return_value=resp) as mock_post:
+            assert linker._call_llm("p1") == "[]"
+            session = mod._SESSION
+            assert linker._call_llm("p2") == "[]"
+        assert mod._SESSION is session
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.kwargs["headers"]["x-api-key"] == "sk-test-key"
+
+    def test_non_200_returns_empty(self, monkeypatch, linker):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        with patch("requests.Session.post", return_value=MagicMock(status_code=529)):
+            assert linker._call_llm("p") == ""
+
 
 # ===================================================================
 # TestLinkHelpers
@@ -205,6 +205,32 @@ class TestGetTradeContext:
         assert result == {"trades": [], "notes": []}
 
 
+# ===================================================================
+# get_old_thesis_notes (JSON fallback)
+# ===================================================================
+
+class TestGetOldThesisNotesJsonFallback:
+    def test_first_three_old_notes_in_order(self):
+        from datetime import date, timedelta
+        import src.data.graph_query as gq
+        today = date.today()
+        notes = [
+            {"symbol": "A", "date": (today - timedelta(days=100)).isoformat()},
+            {"symbol": "NEW", "date": (today - timedelta(days=5)).isoformat()},
+            {"symbol": "B", "date": ""},
+            {"symbol": "C", "date": (today - timedelta(days=95)).isoformat()},
+            {"symbol": "D", "date": "not-a-date"},
+        ]
+        with patch("src.data.graph_store._get_driver", return_value=None), \
+             patch("src.data.note_manager.load_notes", return_value=notes):
+            result = gq.get_old_thesis_notes(older_than_days=90)
+        assert result == [
+            {"symbol": "A", "days_old": 100},
+            {"symbol": "B", "days_old": 90},
+            {"symbol": "C", "days_old": 95},
+        ]
+
+
 # ===================================================================
 # get_recurring_picks
 # ===================================================================
@@ -2,7 +2,7 @@
 
 Neo4j driver is mocked -- no real database connection needed.
 Tests cover: get_stock_news_history, get_sentiment_trend, get_catalysts,
-get_report_trend, get_upcoming_events.
+get_report_trend, get_upcoming_events, get_proactive_snapshot.
 """
 
 import pytest
@@ -167,6 +167,48 @@ class TestGetUpcomingEvents:
         assert get_upcoming_events() == []
 
 
+# ===================================================================
+# get_proactive_snapshot
+# ===================================================================
+
+class TestGetProactiveSnapshot:
+    def test_success(self, mock_session):
+        from src.data.graph_query import get_proactive_snapshot
+        mock_session.run.return_value.single.return_value = {
+            "last_hc": "2025-01-10",
+            "thesis": [{"symbol": "AAPL", "note_date": "2020-01-01"}],
+            "events": [{"date": "2025-01-20", "text": "FOMC meeting"}],
+            "picks": [{"symbol": "TSM", "count": 4, "last_date": "2025-01-15"}],
+        }
+        result = get_proactive_snapshot()
+        assert mock_session.run.call_count == 1
+        assert result["last_health_check_date"] == "2025-01-10"
+        assert result["old_thesis_notes"][0]["symbol"] == "AAPL"
+        assert result["old_thesis_notes"][0]["days_old"] > 90
+        assert result["upcoming_events"] == [{"date": "2025-01-20", "text": "FOMC meeting"}]
+        assert result["recurring_picks"][0]["count"] == 4
+
+    def test_empty_thesis_falls_back_to_json(self, mock_session):
+        from src.data.graph_query import get_proactive_snapshot
+        mock_session.run.return_value.single.return_value = {
+            "last_hc": None, "thesis": [], "events": [], "picks": [],
+        }
+        with patch("src.data.graph_query.proactive._json_old_thesis_notes",
+                   return_value=[{"symbol": "7203.T", "days_old": 120}]):
+            result = get_proactive_snapshot()
+        assert result["old_thesis_notes"] == [{"symbol": "7203.T", "days_old": 120}]
+
+    def test_no_driver(self):
+        from src.data.graph_query import get_proactive_snapshot
+        with patch("src.data.graph_query._common._get_driver", return_value=None):
+            assert get_proactive_snapshot() is None
+
+    def test_error(self, mock_session):
+        from src.data.graph_query import get_proactive_snapshot
+        mock_session.run.side_effect = Exception("DB error")
+        assert get_proactive_snapshot() is None
+
+
 # ===================================================================
 # NL query integration (graph_nl_query templates for KIK-413)
 # ===================================================================
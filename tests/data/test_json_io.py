@@ -0,0 +1,58 @@
+"""Tests for src.data._json_io (orjson with stdlib fallback)."""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from src.data import _json_io
+
+
+SAMPLE = [{"id": "note_1", "content": "トヨタ 決算", "score": 1.5, "tags": ["a", "b"]}]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param and not _json_io.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_json_io, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestJsonIO:
+    def test_indented_output_matches_stdlib(self, backend):
+        """Note files look the same as json.dump(..., ensure_ascii=False, indent=2)."""
+        expected = json.dumps(SAMPLE, ensure_ascii=False, indent=2).encode("utf-8")
+        assert _json_io.dumps(SAMPLE, indent=True) == expected
+
+    def test_default_output_is_compact(self, backend):
+        expected = json.dumps(SAMPLE, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        assert _json_io.dumps(SAMPLE) == expected
+
+    def test_round_trip_file(self, backend, tmp_path):
+        path = tmp_path / "notes.json"
+        _json_io.dump_file(SAMPLE, path)
+        assert _json_io.load_file(path) == SAMPLE
+
+    def test_numpy_scalars_serialize(self, backend):
+        """np.float64 (common in yfinance-derived dicts) works on both backends."""
+        data = {"per": np.float64(12.5)}
+        assert _json_io.loads(_json_io.dumps(data)) == {"per": 12.5}
+
+    def test_decode_error_is_json_decode_error(self, backend):
+        with pytest.raises(_json_io.JSONDecodeError):
+            _json_io.loads(b"not valid json {{{")
+
+    def test_nan_serialization_differs_by_backend(self, backend):
+        """orjson writes NaN as null; the stdlib keeps json.dump's NaN token."""
+        out = _json_io.dumps({"per": float("nan")})
+        assert out == (b'{"per":null}' if backend else b'{"per":NaN}')
+
+    def test_nan_from_legacy_file_loads(self, backend, tmp_path):
+        """Note files written by json.dump may contain NaN; both backends read them."""
+        path = tmp_path / "notes.json"
+        path.write_text('[{"id": "note_1", "per": NaN}]', encoding="utf-8")
+        loaded = _json_io.load_file(path)
+        assert loaded[0]["id"] == "note_1"
+        assert math.isnan(loaded[0]["per"])
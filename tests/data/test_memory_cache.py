@@ -161,9 +161,12 @@ class TestClearMemoryCache:
         from src.data.yahoo_client._memory_cache import (
             price_history_cache,
             stock_detail_cache,
+            stock_info_cache,
         )
         price_history_cache.set("test", "ph")
         stock_detail_cache.set("test", "sd")
+        stock_info_cache.set("test", "si")
         clear_memory_cache()
         assert price_history_cache.get("test") is None
         assert stock_detail_cache.get("test") is None
+        assert stock_info_cache.get("test") is None
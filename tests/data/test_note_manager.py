@@ -4,6 +4,7 @@ Uses tmp_path for JSON file operations, Neo4j is mocked.
 """
 
 import json
+from datetime import date
 from pathlib import Path
 from unittest.mock import patch
 
@@ -67,6 +68,13 @@ class TestSaveNote:
     def test_save_note_valid_types(self):
         assert _VALID_TYPES == {"thesis", "observation", "concern", "review", "target", "lesson", "journal"}
 
+    def test_save_note_id_format_and_uniqueness(self, tmp_path):
+        import re
+        ids = [save_note("7203.T", "thesis", f"n{i}", base_dir=str(tmp_path))["id"] for i in range(50)]
+        today = date.today().isoformat()
+        assert all(re.fullmatch(rf"note_{today}_7203\.T_[0-9a-f]{{8}}", i) for i in ids)
+        assert len(set(ids)) == 50
+
     def test_save_note_lesson_type(self, tmp_path):
         """lesson タイプのノートが保存できること (KIK-408)."""
         note = save_note("7203.T", "lesson", "Never chase momentum blindly", base_dir=str(tmp_path))
@@ -86,6 +94,24 @@ class TestSaveNote:
         files = list(tmp_path.glob("*.json"))
         assert len(files) == 1
 
+    def test_save_note_skips_graph_write_when_mode_off(self, tmp_path):
+        """NEO4J_MODE=off (or cached unreachable): no embedding request, no merge."""
+        with patch("src.data.history_store._build_embedding") as mock_emb, \
+             patch("src.data.graph_store.merge_note") as mock_merge:
+            save_note("7203.T", "thesis", "content", base_dir=str(tmp_path))
+        mock_emb.assert_not_called()
+        mock_merge.assert_not_called()
+
+    def test_save_note_merges_when_mode_on(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        with patch("src.data.history_store._build_embedding", return_value=("sum", None)), \
+             patch("src.data.graph_store.merge_note") as mock_merge:
+            note = save_note("7203.T", "thesis", "content", base_dir=str(tmp_path))
+        kwargs = mock_merge.call_args.kwargs
+        assert kwargs["note_id"] == note["id"]
+        assert kwargs["symbol"] == "7203.T"
+        assert kwargs["semantic_summary"] == "sum"
+
     def test_save_note_creates_directory(self, tmp_path):
         nested = tmp_path / "sub" / "notes"
         save_note("AAPL", "thesis", "test", base_dir=str(nested))
@@ -335,6 +361,50 @@ class TestLoadNotes:
         assert len(notes) == 1
         assert notes[0]["content"] == "Good note"
 
+    def test_load_notes_ignores_non_json_files(self, tmp_path):
+        """Only *.json files are read (same set as glob("*.json"))."""
+        save_note("7203.T", "thesis", "Good note", base_dir=str(tmp_path))
+        (tmp_path / "README.txt").write_text("not a note")
+        notes = load_notes(base_dir=str(tmp_path))
+        assert [n["content"] for n in notes] == ["Good note"]
+
+    def test_load_notes_filtered_opens_only_matching_files(self, tmp_path):
+        """Second filtered load reads just the files the index says match."""
+        import src.data.note_manager as nm
+        save_note("7203.T", "thesis", "Toyota", base_dir=str(tmp_path))
+        save_note("AAPL", "concern", "Apple", base_dir=str(tmp_path))
+        save_note(category="market", note_type="observation", content="Macro", base_dir=str(tmp_path))
+        load_notes(base_dir=str(tmp_path))  # builds the index
+
+        opened = []
+        real = nm.load_file
+        with patch.object(nm, "load_file", side_effect=lambda p: opened.append(Path(p).name) or real(p)):
+            notes = load_notes(symbol="AAPL", base_dir=str(tmp_path))
+
+        assert [n["content"] for n in notes] == ["Apple"]
+        assert [name for name in opened if name.endswith(".json")] == [
+            f"{date.today().isoformat()}_AAPL_concern.json"
+        ]
+
+    def test_load_notes_picks_up_external_edits(self, tmp_path):
+        """Files changed outside save_note are re-indexed (mtime/size check)."""
+        save_note("7203.T", "thesis", "Original", base_dir=str(tmp_path))
+        assert len(load_notes(base_dir=str(tmp_path))) == 1
+
+        (tmp_path / "manual.json").write_text(json.dumps(
+            [{"id": "m1", "date": "2025-01-01", "symbol": "MSFT", "type": "thesis",
+              "category": "stock", "content": "hand-written"}]
+        ))
+        notes = load_notes(symbol="MSFT", base_dir=str(tmp_path))
+        assert [n["content"] for n in notes] == ["hand-written"]
+
+    def test_index_file_invisible_to_json_glob(self, tmp_path):
+        """delete_note / init_graph iterate glob("*.json"); the index must not appear."""
+        save_note("7203.T", "thesis", "Good note", base_dir=str(tmp_path))
+        load_notes(base_dir=str(tmp_path))
+        assert (tmp_path / ".notes_index").exists()
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
     # KIK-429: category filter
     def test_load_notes_filter_by_category(self, tmp_path):
         """category フィルタで絞り込みできること."""
@@ -371,6 +441,31 @@ class TestLoadNotes:
         assert notes[0]["content"] == "PF review"
 
 
+# ===================================================================
+# Background AI linking (KIK-434)
+# ===================================================================
+
+class TestBackgroundLinking:
+    def test_save_note_submits_link_without_waiting(self, tmp_path):
+        import src.data.note_manager as nm
+        with patch.object(nm, "_LINK_EXECUTOR") as executor:
+            note = save_note("7203.T", "thesis", "Toyota", base_dir=str(tmp_path))
+        executor.submit.assert_called_once_with(
+            nm._link_note_background, note["id"], ["7203.T"], "thesis", "Toyota",
+        )
+
+    def test_link_note_background_links_each_symbol(self):
+        import src.data.note_manager as nm
+        with patch("src.data.graph_linker.link_note") as mock_link:
+            nm._link_note_background("n1", ["7203.T", "AAPL"], "journal", "text")
+        assert [c.args[1] for c in mock_link.call_args_list] == ["7203.T", "AAPL"]
+
+    def test_link_note_background_swallows_errors(self):
+        import src.data.note_manager as nm
+        with patch("src.data.graph_linker.link_note", side_effect=RuntimeError("boom")):
+            nm._link_note_background("n1", ["7203.T"], "thesis", "text")
+
+
 # ===================================================================
 # delete_note tests
 # ===================================================================
@@ -390,6 +485,29 @@ class TestDeleteNote:
         assert len(notes) == 1
         assert notes[0]["content"] == "Keep me"
 
+    def test_delete_note_opens_only_owning_file(self, tmp_path):
+        import src.data.note_manager as nm
+        save_note("7203.T", "thesis", "Toyota", base_dir=str(tmp_path))
+        target = save_note("AAPL", "concern", "Apple", base_dir=str(tmp_path))
+        load_notes(base_dir=str(tmp_path))  # builds the index
+
+        opened = []
+        real = nm.load_file
+        with patch.object(nm, "load_file", side_effect=lambda p: opened.append(Path(p).name) or real(p)):
+            assert delete_note(target["id"], base_dir=str(tmp_path)) is True
+
+        assert [name for name in opened if name.endswith(".json")] == [
+            f"{date.today().isoformat()}_AAPL_concern.json"
+        ]
+        assert [n["content"] for n in load_notes(base_dir=str(tmp_path))] == ["Toyota"]
+
+    def test_delete_note_in_externally_written_file(self, tmp_path):
+        (tmp_path / "manual.json").write_text(json.dumps(
+            [{"id": "m1", "date": "2025-01-01", "symbol": "MSFT", "type": "thesis"}]
+        ))
+        assert delete_note("m1", base_dir=str(tmp_path)) is True
+        assert not (tmp_path / "manual.json").exists()
+
     def test_delete_note_not_found(self, tmp_path):
         save_note("7203.T", "thesis", "Note", base_dir=str(tmp_path))
         assert delete_note("nonexistent_id", base_dir=str(tmp_path)) is False
@@ -27,7 +27,7 @@ def _make_quotes(n: int, start: int = 0) -> list[dict]:
 class TestSinglePage:
     """When total <= page size, only one page is fetched."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_single_page(self, mock_screen, mock_sleep):
         quotes = _make_quotes(5)
@@ -50,7 +50,7 @@ class TestSinglePage:
 class TestMultiPage:
     """When total > page size, multiple pages are fetched."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_multi_page(self, mock_screen, mock_sleep):
         page1 = _make_quotes(250, start=0)
@@ -73,8 +73,7 @@ class TestMultiPage:
 
         assert len(result) == 600
         assert mock_screen.call_count == 3
-        # sleep(1) between pages (2 sleeps for 3 pages)
-        assert mock_sleep.call_count == 2
+        assert [q["symbol"] for q in result] == [f"STOCK{i}" for i in range(600)]
 
 
 # ---------------------------------------------------------------------------
@@ -85,7 +84,7 @@ class TestMultiPage:
 class TestMaxResultsLimit:
     """max_results should cap the number of results fetched."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_max_results_limit(self, mock_screen, mock_sleep):
         quotes = _make_quotes(100)
@@ -107,7 +106,7 @@ class TestMaxResultsLimit:
 class TestMaxResultsZero:
     """max_results=0 should fetch all available pages."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_max_results_zero_means_no_limit(self, mock_screen, mock_sleep):
         page1 = _make_quotes(250, start=0)
@@ -136,7 +135,7 @@ class TestMaxResultsZero:
 class TestEmptyResponses:
     """Handle None and empty responses gracefully."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_empty_response_none(self, mock_screen, mock_sleep):
         """yf.screen returns None -> empty list."""
@@ -147,7 +146,7 @@ class TestEmptyResponses:
 
         assert result == []
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_empty_quotes(self, mock_screen, mock_sleep):
         """yf.screen returns total=0 and empty quotes -> empty list."""
@@ -167,7 +166,7 @@ class TestEmptyResponses:
 class TestErrorHandling:
     """Errors during pagination should return partial results."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_error_returns_partial(self, mock_screen, mock_sleep):
         page1 = _make_quotes(250)
@@ -190,17 +189,69 @@ class TestErrorHandling:
         assert len(result) == 250
 
 
+class TestConcurrentPages:
+    """Pages after the first are fetched concurrently but kept in offset order."""
+
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
+    @patch("src.data.yahoo_client.screen.yf.screen")
+    def test_order_kept_when_later_page_finishes_first(self, mock_screen, mock_sleep):
+        import threading
+        page3_done = threading.Event()
+
+        def side_effect(query, size=250, offset=0, sortField="intradaymarketcap", sortAsc=False):
+            if offset == 0:
+                return {"total": 600, "quotes": _make_quotes(250, start=0)}
+            if offset == 250:
+                page3_done.wait(5)  # page 2 completes after page 3
+                return {"total": 600, "quotes": _make_quotes(250, start=250)}
+            page3_done.set()
+            return {"total": 600, "quotes": _make_quotes(100, start=500)}
+
+        mock_screen.side_effect = side_effect
+        result = screen_stocks(MagicMock())
+        assert [q["symbol"] for q in result] == [f"STOCK{i}" for i in range(600)]
+
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
+    @patch("src.data.yahoo_client.screen.yf.screen")
+    def test_failed_middle_page_truncates_after_it(self, mock_screen, mock_sleep):
+        def side_effect(query, size=250, offset=0, sortField="intradaymarketcap", sortAsc=False):
+            if offset == 500:
+                raise ConnectionError("page 3 failed")
+            return {"total": 1000, "quotes": _make_quotes(250, start=offset)}
+
+        mock_screen.side_effect = side_effect
+        result = screen_stocks(MagicMock())
+        assert len(result) == 500
+        assert result[-1]["symbol"] == "STOCK499"
+
+
 # ---------------------------------------------------------------------------
 # Rate limit delay
 # ---------------------------------------------------------------------------
 
 
+class TestShortPages:
+    """Offsets follow the quotes actually returned, not the requested size."""
+
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
+    @patch("src.data.yahoo_client.screen.yf.screen")
+    def test_short_middle_page_neither_skips_nor_duplicates(self, mock_screen, mock_sleep):
+        def side_effect(query, size=250, offset=0, sortField="intradaymarketcap", sortAsc=False):
+            n = 200 if offset == 250 else size  # Yahoo returns a short page at 250
+            return {"total": 600, "quotes": _make_quotes(min(n, 600 - offset), start=offset)}
+
+        mock_screen.side_effect = side_effect
+        result = screen_stocks(MagicMock(), size=250)
+
+        assert [q["symbol"] for q in result] == [f"STOCK{i}" for i in range(600)]
+
+
 class TestRateLimitDelay:
-    """Verify time.sleep(1) is called between pages."""
+    """Every page request goes through the shared throttle."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client.screen.throttle")
     @patch("src.data.yahoo_client.screen.yf.screen")
-    def test_rate_limit_delay(self, mock_screen, mock_sleep):
+    def test_rate_limit_delay(self, mock_screen, mock_throttle):
         page1 = _make_quotes(250, start=0)
         page2 = _make_quotes(50, start=250)
 
@@ -216,8 +267,7 @@ class TestRateLimitDelay:
         query = MagicMock()
         screen_stocks(query)
 
-        # sleep(1) called once between page 1 and page 2
-        mock_sleep.assert_called_once_with(1)
+        assert mock_throttle.call_count == 2
 
 
 # ---------------------------------------------------------------------------
@@ -228,7 +278,7 @@ class TestRateLimitDelay:
 class TestPageSizeAdjustment:
     """When max_results limits the second page, size should be adjusted."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_page_size_adjustment(self, mock_screen, mock_sleep):
         page1 = _make_quotes(250, start=0)
@@ -264,7 +314,7 @@ class TestPageSizeAdjustment:
 class TestOffsetParameter:
     """Verify the offset parameter is correctly passed on each call."""
 
-    @patch("src.data.yahoo_client.screen.time.sleep")
+    @patch("src.data.yahoo_client._rate_limit.time.sleep")
     @patch("src.data.yahoo_client.screen.yf.screen")
     def test_offset_parameter_passed(self, mock_screen, mock_sleep):
         page1 = _make_quotes(250, start=0)
@@ -288,6 +338,7 @@ class TestOffsetParameter:
         calls = mock_screen.call_args_list
         assert len(calls) == 3
 
-        # Verify offset values: 0, 250, 500
+        # Verify offset values: 0, 250, 500 (pages 2+ run concurrently)
         offsets = [c.kwargs.get("offset", c[1].get("offset", 0)) for c in calls]
-        assert offsets == [0, 250, 500]
+        assert offsets[0] == 0
+        assert sorted(offsets) == [0, 250, 500]
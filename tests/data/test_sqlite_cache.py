@@ -0,0 +1,38 @@
+"""Tests for src.data._sqlite_cache (shared SQLite TTL cache)."""
+
+import time
+
+from src.data import _sqlite_cache
+
+
+class TestSqliteCache:
+    def test_round_trip(self, tmp_path):
+        conn = _sqlite_cache.connect(tmp_path / "c.sqlite", ("t",))
+        _sqlite_cache.put(conn, "t", "k", {"a": 1, "名前": "トヨタ"})
+        assert _sqlite_cache.get(conn, "t", "k", 60) == {"a": 1, "名前": "トヨタ"}
+
+    def test_missing_key_and_expired_entry(self, tmp_path, monkeypatch):
+        conn = _sqlite_cache.connect(tmp_path / "c.sqlite", ("t",))
+        assert _sqlite_cache.get(conn, "t", "nope", 60) is None
+        _sqlite_cache.put(conn, "t", "k", {"a": 1})
+        later = time.time() + 61
+        monkeypatch.setattr(_sqlite_cache.time, "time", lambda: later)
+        assert _sqlite_cache.get(conn, "t", "k", 60) is None
+
+    def test_create_false_does_not_create_file(self, tmp_path):
+        path = tmp_path / "sub" / "c.sqlite"
+        assert _sqlite_cache.connect(path, ("t",), create=False) is None
+        assert not path.exists()
+
+    def test_on_create_runs_only_for_new_file(self, tmp_path):
+        path = tmp_path / "c.sqlite"
+        calls = []
+        _sqlite_cache.connect(path, ("t",), on_create=calls.append)
+        assert len(calls) == 1
+        # Same thread reuses its connection; a new path would be a new DB
+        assert _sqlite_cache.connect(path, ("t",), on_create=calls.append) is not None
+        assert len(calls) == 1
+
+    def test_connection_reused_per_thread(self, tmp_path):
+        path = tmp_path / "c.sqlite"
+        assert _sqlite_cache.connect(path, ("t",)) is _sqlite_cache.connect(path, ("t",))
@@ -3,8 +3,8 @@
 import json
 import sys
 import time
-from datetime import datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -21,12 +21,13 @@ from src.data.yahoo_client import (
     CACHE_TTL_HOURS,
     MACRO_TICKERS,
     _build_dividend_history_from_actions,
-    _cache_path,
+    _db_path,
     _normalize_ratio,
     _read_cache,
     _safe_get,
     _sanitize_anomalies,
     _write_cache,
+    batch_quote,
     get_macro_indicators,
 )
 
@@ -126,43 +127,37 @@ class TestSafeGet:
 
 
 # ---------------------------------------------------------------------------
-# _cache_path
+# _db_path
 # ---------------------------------------------------------------------------
 
-class TestCachePath:
-    """Tests for _cache_path()."""
+class TestCacheDbPath:
+    """Tests for _db_path()."""
 
     def test_returns_path_object(self):
-        """_cache_path returns a Path object."""
-        result = _cache_path("7203.T")
-        assert isinstance(result, Path)
+        """_db_path returns a Path object."""
+        assert isinstance(_db_path(), Path)
 
-    def test_dots_replaced_with_underscores(self):
-        """Dots in symbol names are replaced with underscores."""
-        result = _cache_path("7203.T")
-        assert result.name == "7203_T.json"
+    def test_single_sqlite_file_under_cache_dir(self):
+        """All symbols share one SQLite file under data/cache/."""
+        result = _db_path()
+        assert result.parent.name == "cache"
+        assert result.name == "cache.sqlite"
 
-    def test_slashes_replaced_with_underscores(self):
-        """Slashes in symbol names are replaced with underscores."""
-        result = _cache_path("D05.SI")
-        assert result.name == "D05_SI.json"
-
-    def test_plain_symbol(self):
-        """Plain symbol (no special chars) maps to <symbol>.json."""
-        result = _cache_path("AAPL")
-        assert result.name == "AAPL.json"
-
-    def test_path_is_under_cache_dir(self):
-        """Cache path is under the data/cache/ directory."""
-        result = _cache_path("AAPL")
-        assert "cache" in str(result)
-        assert result.suffix == ".json"
+    def test_follows_patched_cache_dir(self, tmp_path):
+        """CACHE_DIR is resolved at call time (tests patch it)."""
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            assert _db_path() == tmp_path / "cache.sqlite"
 
 
 # ---------------------------------------------------------------------------
 # Cache read/write tests (using tmp_path)
 # ---------------------------------------------------------------------------
 
+def _set_cached_at(table: str, symbol: str, epoch: float) -> None:
+    from src.data.yahoo_client._cache import _db
+    _db().execute(f"UPDATE {table} SET cached_at = ? WHERE symbol = ?", (epoch, symbol))
+
+
 class TestCacheReadWrite:
     """Tests for _read_cache() and _write_cache() using tmp_path."""
 
@@ -173,9 +168,8 @@ class TestCacheReadWrite:
             data = {"symbol": "7203.T", "price": 2850.0}
             _write_cache("7203.T", data)
 
-            # Verify file was created
-            cache_file = tmp_path / "7203_T.json"
-            assert cache_file.exists()
+            # Verify the database was created
+            assert (tmp_path / "cache.sqlite").exists()
 
             # Read back
             result = _read_cache("7203.T")
@@ -183,23 +177,31 @@ class TestCacheReadWrite:
             assert result["symbol"] == "7203.T"
             assert result["price"] == 2850.0
 
-    def test_read_cache_adds_timestamp(self, tmp_path):
-        """_write_cache adds a _cached_at timestamp."""
+    def test_write_cache_stores_epoch_timestamp(self, tmp_path):
+        """_write_cache stamps the row with the current epoch time."""
+        from src.data.yahoo_client._cache import _db
         with patch(_CACHE_DIR_PATCH, tmp_path):
-            data = {"symbol": "TEST"}
-            _write_cache("TEST", data)
-
-            cache_file = tmp_path / "TEST.json"
-            with open(cache_file, "r", encoding="utf-8") as f:
-                stored = json.load(f)
-            assert "_cached_at" in stored
+            before = time.time()
+            _write_cache("TEST", {"symbol": "TEST"})
+            (cached_at,) = _db().execute(
+                "SELECT cached_at FROM cache WHERE symbol = ?", ("TEST",)
+            ).fetchone()
+            assert before <= cached_at <= time.time()
 
     def test_read_cache_returns_none_for_missing(self, tmp_path):
-        """_read_cache returns None when cache file does not exist."""
+        """_read_cache returns None when the symbol is not cached."""
         with patch(_CACHE_DIR_PATCH, tmp_path):
+            _write_cache("OTHER", {"symbol": "OTHER"})
             result = _read_cache("NONEXISTENT")
             assert result is None
 
+    def test_read_without_db_does_not_create_it(self, tmp_path):
+        """Reading before any write returns None and leaves no file behind."""
+        cache_dir = tmp_path / "fresh"
+        with patch(_CACHE_DIR_PATCH, cache_dir):
+            assert _read_cache("7203.T") is None
+        assert not cache_dir.exists()
+
     def test_cache_valid_within_ttl(self, tmp_path):
         """Cache data is returned when within TTL."""
         with patch(_CACHE_DIR_PATCH, tmp_path):
@@ -214,13 +216,9 @@ class TestCacheReadWrite:
     def test_cache_expired_beyond_ttl(self, tmp_path):
         """Cache data returns None when beyond TTL."""
         with patch(_CACHE_DIR_PATCH, tmp_path):
-            # Write with a timestamp that is 25 hours ago (beyond 24h TTL)
-            expired_time = (datetime.now() - timedelta(hours=CACHE_TTL_HOURS + 1)).isoformat()
-            data = {"symbol": "7203.T", "price": 2850.0, "_cached_at": expired_time}
-
-            cache_file = tmp_path / "7203_T.json"
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f)
+            _write_cache("7203.T", {"symbol": "7203.T", "price": 2850.0})
+            # Backdate to 25 hours ago (beyond 24h TTL)
+            _set_cached_at("cache", "7203.T", time.time() - (CACHE_TTL_HOURS + 1) * 3600)
 
             result = _read_cache("7203.T")
             assert result is None
@@ -228,35 +226,55 @@ class TestCacheReadWrite:
     def test_cache_valid_just_before_ttl(self, tmp_path):
         """Cache data is still valid just before TTL expiry."""
         with patch(_CACHE_DIR_PATCH, tmp_path):
-            # Write with a timestamp that is 23 hours ago (just within 24h TTL)
-            recent_time = (datetime.now() - timedelta(hours=CACHE_TTL_HOURS - 1)).isoformat()
-            data = {"symbol": "7203.T", "price": 2850.0, "_cached_at": recent_time}
-
-            cache_file = tmp_path / "7203_T.json"
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f)
+            _write_cache("7203.T", {"symbol": "7203.T", "price": 2850.0})
+            # Backdate to 23 hours ago (just within 24h TTL)
+            _set_cached_at("cache", "7203.T", time.time() - (CACHE_TTL_HOURS - 1) * 3600)
 
             result = _read_cache("7203.T")
             assert result is not None
 
-    def test_read_cache_handles_corrupt_json(self, tmp_path):
-        """_read_cache returns None for corrupt JSON files."""
+    def test_read_cache_handles_corrupt_payload(self, tmp_path):
+        """_read_cache returns None for a payload that is not valid JSON."""
+        from src.data.yahoo_client._cache import _db
         with patch(_CACHE_DIR_PATCH, tmp_path):
-            cache_file = tmp_path / "CORRUPT.json"
-            cache_file.write_text("not valid json {{{")
+            _write_cache("CORRUPT", {"symbol": "CORRUPT"})
+            _db().execute(
+                "UPDATE cache SET payload = ? WHERE symbol = ?",
+                (b"not valid json {{{", "CORRUPT"),
+            )
 
             result = _read_cache("CORRUPT")
             assert result is None
 
-    def test_read_cache_handles_missing_timestamp(self, tmp_path):
-        """_read_cache returns None if _cached_at is missing from data."""
+    def test_info_and_detail_tables_are_separate(self, tmp_path):
+        """Detail entries do not shadow basic info for the same symbol."""
+        from src.data.yahoo_client import _read_detail_cache, _write_detail_cache
         with patch(_CACHE_DIR_PATCH, tmp_path):
-            cache_file = tmp_path / "NOTIME.json"
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump({"symbol": "NOTIME"}, f)
+            _write_cache("7203.T", {"kind": "info"})
+            _write_detail_cache("7203.T", {"kind": "detail"})
+            assert _read_cache("7203.T") == {"kind": "info"}
+            assert _read_detail_cache("7203.T") == {"kind": "detail"}
+
+    def test_legacy_json_files_imported_once(self, tmp_path):
+        """Pre-SQLite per-symbol files seed a new DB; ISO stamps become epochs."""
+        from datetime import datetime, timedelta
+        from src.data.yahoo_client import _read_detail_cache
+
+        fresh = (datetime.now() - timedelta(hours=1)).isoformat()
+        stale = (datetime.now() - timedelta(hours=CACHE_TTL_HOURS + 1)).isoformat()
+        (tmp_path / "7203_T.json").write_text(json.dumps(
+            {"symbol": "7203.T", "price": 2850.0, "_cached_at": fresh}))
+        (tmp_path / "7203_T_detail.json").write_text(json.dumps(
+            {"symbol": "7203.T", "roe": 0.1, "_cached_at": fresh}))
+        (tmp_path / "AAPL.json").write_text(json.dumps(
+            {"symbol": "AAPL", "_cached_at": stale}))
+        (tmp_path / "BROKEN.json").write_text("not valid json {{{")
 
-            result = _read_cache("NOTIME")
-            assert result is None
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            _write_cache("MSFT", {"symbol": "MSFT"})  # creates the DB
+            assert _read_cache("7203.T") == {"symbol": "7203.T", "price": 2850.0}
+            assert _read_detail_cache("7203.T") == {"symbol": "7203.T", "roe": 0.1}
+            assert _read_cache("AAPL") is None
 
     def test_write_cache_creates_directory(self, tmp_path):
         """_write_cache creates the cache directory if it doesn't exist."""
@@ -264,7 +282,66 @@ class TestCacheReadWrite:
         with patch(_CACHE_DIR_PATCH, nested_dir):
             _write_cache("TEST", {"symbol": "TEST"})
             assert nested_dir.exists()
-            assert (nested_dir / "TEST.json").exists()
+            assert (nested_dir / "cache.sqlite").exists()
+
+
+# ---------------------------------------------------------------------------
+# Price-history cache
+# ---------------------------------------------------------------------------
+
+class TestHistoryFileCache:
+    """get_price_history() falls back to a 1h on-disk cache across processes."""
+
+    @staticmethod
+    def _frame():
+        idx = pd.date_range("2025-01-06", periods=3, freq="D", tz="Asia/Tokyo")
+        return pd.DataFrame(
+            {"Open": [1.0, 2.0, 3.0], "Close": [1.5, float("nan"), 3.5],
+             "Volume": [10, 20, 30]},
+            index=idx,
+        )
+
+    def test_payload_round_trip(self):
+        from src.data.yahoo_client.history import (
+            _history_to_payload, _payload_to_history,
+        )
+        src = self._frame()
+        restored = _payload_to_history(json.loads(json.dumps(_history_to_payload(src))))
+        pd.testing.assert_frame_equal(
+            restored, src.rename_axis("Date"), check_freq=False,
+        )
+
+    def test_file_cache_hit_skips_fetch(self, tmp_path):
+        from src.data.yahoo_client import history
+        from src.data.yahoo_client._cache import _read_history_cache
+        from src.data.yahoo_client._memory_cache import price_history_cache
+
+        ticker = MagicMock()
+        ticker.history.return_value = self._frame()
+        with patch(_CACHE_DIR_PATCH, tmp_path), \
+             patch.object(history.yf, "Ticker", return_value=ticker), \
+             patch("src.data.yahoo_client._rate_limit.time.sleep"):
+            price_history_cache.clear()
+            first = history.get_price_history("7203.T", period="5d")
+            price_history_cache.clear()  # simulate a fresh process
+            second = history.get_price_history("7203.T", period="5d")
+            assert _read_history_cache("7203.T", "5d") is not None
+        price_history_cache.clear()
+
+        assert ticker.history.call_count == 1
+        assert list(second["Close"].dropna()) == list(first["Close"].dropna())
+
+    def test_expired_history_cache_ignored(self, tmp_path):
+        from src.data.yahoo_client._cache import (
+            HISTORY_CACHE_TTL_HOURS, _read_history_cache, _write_history_cache,
+        )
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            _write_history_cache("AAPL", "1y", {"index": [], "columns": {}})
+            _set_cached_at(
+                "history", "AAPL:1y",
+                time.time() - (HISTORY_CACHE_TTL_HOURS + 1) * 3600,
+            )
+            assert _read_history_cache("AAPL", "1y") is None
 
 
 # ---------------------------------------------------------------------------
@@ -453,38 +530,50 @@ class TestBuildDividendHistoryFromActions:
 # get_macro_indicators (KIK-396)
 # ---------------------------------------------------------------------------
 
-def _make_mock_history(closes):
-    """Build a minimal DataFrame with Close column from a list of floats."""
-    return pd.DataFrame({"Close": closes})
+def _make_mock_download(closes, symbols=None):
+    """Build a yf.download(group_by="ticker") frame with the same Close series per symbol."""
+    symbols = list(MACRO_TICKERS.values()) if symbols is None else symbols
+    return pd.concat({s: pd.DataFrame({"Close": closes}) for s in symbols}, axis=1)
 
 
 class TestGetMacroIndicators:
     """Tests for get_macro_indicators()."""
 
-    def test_returns_list(self, monkeypatch):
-        """All 8 tickers return data → 8 entries."""
-        monkeypatch.setattr(time, "sleep", lambda _: None)
+    def _patch_download(self, monkeypatch, frame):
+        import yfinance as yf
+        calls = []
 
-        mock_ticker = MagicMock()
-        mock_ticker.history.return_value = _make_mock_history([100.0, 101.0, 102.0, 103.0, 104.0])
+        def fake_download(tickers, **kwargs):
+            calls.append((tickers, kwargs))
+            if isinstance(frame, Exception):
+                raise frame
+            return frame
 
-        import yfinance as yf
-        monkeypatch.setattr(yf, "Ticker", lambda symbol: mock_ticker)
+        monkeypatch.setattr(yf, "download", fake_download)
+        return calls
 
+    def test_returns_list(self, monkeypatch):
+        """All 8 tickers return data → 8 entries."""
+        self._patch_download(monkeypatch, _make_mock_download([100.0, 101.0, 102.0, 103.0, 104.0]))
         result = get_macro_indicators()
         assert isinstance(result, list)
         assert len(result) == len(MACRO_TICKERS)
 
+    def test_single_download_call(self, monkeypatch):
+        """One batched request for every ticker, no per-ticker sleep."""
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", lambda s: sleeps.append(s))
+        calls = self._patch_download(monkeypatch, _make_mock_download([100.0, 101.0]))
+        get_macro_indicators()
+        assert len(calls) == 1
+        assert calls[0][0] == list(MACRO_TICKERS.values())
+        assert calls[0][1]["period"] == "5d"
+        assert calls[0][1]["group_by"] == "ticker"
+        assert sleeps == []
+
     def test_indicator_fields(self, monkeypatch):
         """Each dict has required fields: name, symbol, price, daily_change, weekly_change, is_point_diff."""
-        monkeypatch.setattr(time, "sleep", lambda _: None)
-
-        mock_ticker = MagicMock()
-        mock_ticker.history.return_value = _make_mock_history([100.0, 102.0, 101.0, 103.0, 105.0])
-
-        import yfinance as yf
-        monkeypatch.setattr(yf, "Ticker", lambda symbol: mock_ticker)
-
+        self._patch_download(monkeypatch, _make_mock_download([100.0, 102.0, 101.0, 103.0, 105.0]))
         result = get_macro_indicators()
         for ind in result:
             assert "name" in ind
@@ -497,15 +586,8 @@ class TestGetMacroIndicators:
 
     def test_daily_and_weekly_change(self, monkeypatch):
         """Daily and weekly changes are calculated correctly (percentage)."""
-        monkeypatch.setattr(time, "sleep", lambda _: None)
-
         # 5 days: 100, 102, 104, 103, 106
-        mock_ticker = MagicMock()
-        mock_ticker.history.return_value = _make_mock_history([100.0, 102.0, 104.0, 103.0, 106.0])
-
-        import yfinance as yf
-        monkeypatch.setattr(yf, "Ticker", lambda symbol: mock_ticker)
-
+        self._patch_download(monkeypatch, _make_mock_download([100.0, 102.0, 104.0, 103.0, 106.0]))
         result = get_macro_indicators()
         # Find S&P500 (not point_diff)
         sp = next(i for i in result if i["name"] == "S&P500")
@@ -517,14 +599,7 @@ class TestGetMacroIndicators:
 
     def test_point_diff_tickers(self, monkeypatch):
         """VIX and bond yield use point difference, not percentage."""
-        monkeypatch.setattr(time, "sleep", lambda _: None)
-
-        mock_ticker = MagicMock()
-        mock_ticker.history.return_value = _make_mock_history([20.0, 22.0, 21.0, 23.0, 25.0])
-
-        import yfinance as yf
-        monkeypatch.setattr(yf, "Ticker", lambda symbol: mock_ticker)
-
+        self._patch_download(monkeypatch, _make_mock_download([20.0, 22.0, 21.0, 23.0, 25.0]))
         result = get_macro_indicators()
         vix = next(i for i in result if i["name"] == "VIX")
         assert vix["is_point_diff"] is True
@@ -533,42 +608,437 @@ class TestGetMacroIndicators:
         # weekly: 25 - 20 = 5.0 (point diff)
         assert vix["weekly_change"] == pytest.approx(5.0)
 
-    def test_exception_skips_ticker(self, monkeypatch):
-        """One ticker raising → that ticker is skipped, rest returned."""
-        monkeypatch.setattr(time, "sleep", lambda _: None)
+    def test_calendar_gaps_dropped_per_ticker(self, monkeypatch):
+        """NaN rows from other tickers' trading days are ignored."""
+        frame = _make_mock_download([100.0, 101.0, 102.0])
+        frame.loc[1, ("^N225", "Close")] = float("nan")
+        self._patch_download(monkeypatch, frame)
+        nikkei = next(i for i in get_macro_indicators() if i["symbol"] == "^N225")
+        assert nikkei["price"] == 102.0
+        assert nikkei["daily_change"] == pytest.approx((102.0 - 100.0) / 100.0)
+
+    def test_missing_ticker_has_none_values(self, monkeypatch):
+        """A ticker absent from the download → None values, others intact."""
+        symbols = [s for s in MACRO_TICKERS.values() if s != "^GSPC"]
+        self._patch_download(monkeypatch, _make_mock_download([100.0, 101.0], symbols))
+        result = get_macro_indicators()
+        assert len(result) == len(MACRO_TICKERS)
+        sp = next(i for i in result if i["name"] == "S&P500")
+        assert sp["price"] is None
+        assert all(i["price"] == 101.0 for i in result if i["name"] != "S&P500")
+
+    def test_download_exception_returns_empty(self, monkeypatch):
+        self._patch_download(monkeypatch, RuntimeError("Network error"))
+        assert get_macro_indicators() == []
+
+    def test_second_call_served_from_disk_cache(self, monkeypatch):
+        calls = self._patch_download(monkeypatch, _make_mock_download([100.0, 101.0]))
+        first = get_macro_indicators()
+        second = get_macro_indicators()
+        assert second == first
+        assert len(calls) == 1
+
+    def test_cache_expires_after_ttl(self, monkeypatch):
+        from src.data.yahoo_client import _cache
+        calls = self._patch_download(monkeypatch, _make_mock_download([100.0, 101.0]))
+        get_macro_indicators()
+        _cache._db().execute("UPDATE macro SET cached_at = cached_at - ?", (_cache._MACRO_TTL_SECONDS + 1,))
+        get_macro_indicators()
+        assert len(calls) == 2
+
+    def test_failed_fetch_not_cached(self, monkeypatch):
+        calls = self._patch_download(monkeypatch, pd.DataFrame())
+        get_macro_indicators()
+        get_macro_indicators()
+        assert len(calls) == 2
+
+    def test_empty_history(self, monkeypatch):
+        """Empty DataFrame → None values in result."""
+        self._patch_download(monkeypatch, pd.DataFrame())
+        result = get_macro_indicators()
+        assert len(result) == len(MACRO_TICKERS)
+        for ind in result:
+            assert ind["price"] is None
+            assert ind["daily_change"] is None
+            assert ind["weekly_change"] is None
+
+
+# ---------------------------------------------------------------------------
+# get_stock_news disk cache
+# ---------------------------------------------------------------------------
 
-        call_count = [0]
+class TestGetStockNewsCache:
+    def _patch_ticker(self, monkeypatch, news):
+        import yfinance as yf
+        created = []
 
-        def mock_ticker_factory(symbol):
-            call_count[0] += 1
+        def factory(symbol):
+            created.append(symbol)
             t = MagicMock()
-            if symbol == "^GSPC":
-                t.history.side_effect = RuntimeError("Network error")
-            else:
-                t.history.return_value = _make_mock_history([100.0, 101.0])
+            t.news = news
             return t
 
+        monkeypatch.setattr(yf, "Ticker", factory)
+        return created
+
+    def test_second_call_served_from_cache(self, monkeypatch):
+        from src.data.yahoo_client import get_stock_news
+        news = [{"title": "Toyota beats", "publisher": "Nikkei", "link": "https://x", "providerPublishTime": 0}]
+        created = self._patch_ticker(monkeypatch, news)
+        first = get_stock_news("7203.T", count=5)
+        second = get_stock_news("7203.T", count=5)
+        assert second == first
+        assert first[0]["title"] == "Toyota beats"
+        assert created == ["7203.T"]
+
+    def test_keyed_by_symbol_and_count(self, monkeypatch):
+        from src.data.yahoo_client import get_stock_news
+        created = self._patch_ticker(monkeypatch, [{"title": "t"}])
+        get_stock_news("7203.T", count=5)
+        get_stock_news("7203.T", count=3)
+        get_stock_news("AAPL", count=5)
+        assert created == ["7203.T", "7203.T", "AAPL"]
+
+    def test_error_not_cached(self, monkeypatch):
         import yfinance as yf
-        monkeypatch.setattr(yf, "Ticker", mock_ticker_factory)
+        from src.data.yahoo_client import get_stock_news
+        monkeypatch.setattr(yf, "Ticker", MagicMock(side_effect=RuntimeError("down")))
+        assert get_stock_news("7203.T") == []
+        self._patch_ticker(monkeypatch, [{"title": "t"}])
+        assert get_stock_news("7203.T")[0]["title"] == "t"
+
+    def test_content_wrapped_item_fields(self, monkeypatch):
+        from src.data.yahoo_client import get_stock_news
+        news = [{"content": {
+            "title": "Toyota beats",
+            "provider": {"displayName": "Nikkei"},
+            "canonicalUrl": {"url": "https://x"},
+            "pubDate": "2026-01-01T00:00:00Z",
+        }}]
+        self._patch_ticker(monkeypatch, news)
+        assert get_stock_news("7203.T") == [{
+            "title": "Toyota beats",
+            "publisher": "Nikkei",
+            "link": "https://x",
+            "publish_time": "2026-01-01T00:00:00Z",
+        }]
+
+    def test_non_dict_content_falls_back_to_item(self, monkeypatch):
+        from src.data.yahoo_client import get_stock_news
+        news = [{"content": "raw", "title": "t", "publisher": "p", "link": "l", "providerPublishTime": 0}]
+        self._patch_ticker(monkeypatch, news)
+        item = get_stock_news("7203.T")[0]
+        assert (item["title"], item["publisher"], item["link"]) == ("t", "p", "l")
+        assert item["publish_time"]
 
-        result = get_macro_indicators()
-        assert len(result) == len(MACRO_TICKERS) - 1
-        names = [i["name"] for i in result]
-        assert "S&P500" not in names
 
-    def test_empty_history(self, monkeypatch):
-        """Empty DataFrame → None values in result."""
-        monkeypatch.setattr(time, "sleep", lambda _: None)
+# ---------------------------------------------------------------------------
+# batch_quote
+# ---------------------------------------------------------------------------
+
+class TestBatchQuote:
+    def test_returns_all_symbols_in_order(self, monkeypatch):
+        """Every unique symbol is fetched once and returned in input order."""
+        calls = []
+
+        def fake_info(symbol):
+            calls.append(symbol)
+            return None if symbol == "BAD" else {"symbol": symbol}
+
+        monkeypatch.setattr("src.data.yahoo_client.batch.get_stock_info", fake_info)
+        symbols = [f"S{i}" for i in range(45)] + ["BAD", "S0"]
+        result = batch_quote(symbols, batch_size=20)
+
+        assert list(result) == [f"S{i}" for i in range(45)] + ["BAD"]
+        assert result["S3"] == {"symbol": "S3"}
+        assert result["BAD"] is None
+        assert sorted(calls) == sorted(set(symbols))
+
+    def test_empty_symbols(self):
+        assert batch_quote([]) == {}
+
+    def test_rate_limited_symbol_is_retried_not_dropped(self, monkeypatch):
+        """A 429 on Ticker.info is retried through the shared throttle."""
+        from src.data.yahoo_client import _rate_limit, detail
+
+        monkeypatch.setattr(_rate_limit.time, "sleep", lambda s: None)
+        attempts = []
+
+        class FlakyTicker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            @property
+            def info(self):
+                attempts.append(self.symbol)
+                if attempts.count(self.symbol) == 1 and self.symbol == "7203.T":
+                    raise RuntimeError("429 Client Error: Too Many Requests")
+                return {"regularMarketPrice": 100.0}
 
+        monkeypatch.setattr(detail.yf, "Ticker", FlakyTicker)
+        result = batch_quote(["7203.T", "AAPL"])
+
+        assert result["7203.T"]["price"] == 100.0
+        assert result["AAPL"]["price"] == 100.0
+        assert attempts.count("7203.T") == 2
+
+
+# ---------------------------------------------------------------------------
+# In-flight coalescing (history._single_flight)
+# ---------------------------------------------------------------------------
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_fetch(self):
+        import threading
+        from src.data.yahoo_client import history
+
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(history._single_flight(("k",), fetch)))
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(history._single_flight(("k",), fetch)))
+            for _ in range(3)
+        ]
+        for t in followers:
+            t.start()
+        time.sleep(0.05)  # let followers reach the wait
+        release.set()
+        for t in [leader, *followers]:
+            t.join(5)
+
+        assert results == ["result"] * 4
+        assert calls == [1]
+        assert history._inflight == {}
+
+    def test_sequential_calls_fetch_again(self):
+        from src.data.yahoo_client import history
+        calls = []
+        history._single_flight(("k",), lambda: calls.append(1))
+        history._single_flight(("k",), lambda: calls.append(1))
+        assert calls == [1, 1]
+
+    def test_exception_releases_key(self):
+        from src.data.yahoo_client import history
+
+        def boom():
+            raise RuntimeError("x")
+
+        with pytest.raises(RuntimeError):
+            history._single_flight(("k",), boom)
+        assert history._inflight == {}
+        assert history._single_flight(("k",), lambda: 1) == 1
+
+
+# ---------------------------------------------------------------------------
+# _rate_limit.throttle
+# ---------------------------------------------------------------------------
+
+class TestThrottle:
+    def _clock(self, monkeypatch, start=100.0):
+        from src.data.yahoo_client import _rate_limit
+        monkeypatch.setattr(_rate_limit, "_next_slot", 0.0)
+        now = [start]
+        sleeps = []
+        monkeypatch.setattr(_rate_limit.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(_rate_limit.time, "sleep", sleeps.append)
+        return _rate_limit.throttle, now, sleeps
+
+    def test_first_call_does_not_sleep(self, monkeypatch):
+        throttle, _, sleeps = self._clock(monkeypatch)
+        throttle()
+        assert sleeps == []
+
+    def test_back_to_back_sleeps_remainder(self, monkeypatch):
+        throttle, now, sleeps = self._clock(monkeypatch)
+        throttle()
+        now[0] += 0.3
+        throttle()
+        assert sleeps == [pytest.approx(0.7)]
+
+    def test_no_sleep_after_interval_elapsed(self, monkeypatch):
+        throttle, now, sleeps = self._clock(monkeypatch)
+        throttle()
+        now[0] += 1.5
+        throttle()
+        assert sleeps == []
+
+    def test_spacing_is_shared_across_threads(self, monkeypatch):
+        """Another thread's request counts: the limit is process-wide."""
+        import threading
+        throttle, _, sleeps = self._clock(monkeypatch)
+        throttle()
+        t = threading.Thread(target=throttle)
+        t.start()
+        t.join()
+        assert sleeps == [pytest.approx(1.0)]
+
+    def test_concurrent_callers_get_successive_slots(self, monkeypatch):
+        """Callers arriving together are released 1s apart, not all at once."""
+        throttle, _, sleeps = self._clock(monkeypatch)
+        for _ in range(4):
+            throttle()
+        assert sleeps == [pytest.approx(1.0), pytest.approx(2.0), pytest.approx(3.0)]
+
+
+# ---------------------------------------------------------------------------
+# _rate_limit.retry_transient
+# ---------------------------------------------------------------------------
+
+class TestRetryTransient:
+    def _flaky(self, monkeypatch, errors):
+        from src.data.yahoo_client import _rate_limit
+        sleeps = []
+        monkeypatch.setattr(_rate_limit.time, "sleep", sleeps.append)
+        monkeypatch.setattr(_rate_limit.random, "uniform", lambda a, b: 0.0)
+        calls = []
+
+        @_rate_limit.retry_transient()
+        def fetch():
+            calls.append(1)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return "ok"
+
+        return fetch, calls, sleeps
+
+    def test_retries_timeout_with_backoff(self, monkeypatch):
+        fetch, calls, sleeps = self._flaky(monkeypatch, [TimeoutError("t"), TimeoutError("t")])
+        assert fetch() == "ok"
+        assert len(calls) == 3
+        assert sleeps == [2.0, 4.0]
+
+    def test_retries_http_429(self, monkeypatch):
+        fetch, calls, _ = self._flaky(monkeypatch, [RuntimeError("429 Client Error: Too Many Requests")])
+        assert fetch() == "ok"
+        assert len(calls) == 2
+
+    def test_retries_response_status_429(self, monkeypatch):
+        err = RuntimeError("rate limited")
+        err.response = SimpleNamespace(status_code=429)
+        fetch, calls, _ = self._flaky(monkeypatch, [err])
+        assert fetch() == "ok"
+        assert len(calls) == 2
+
+    def test_404_with_429_in_url_not_retried(self, monkeypatch):
+        """A symbol like 4293.T in the URL does not make a 404 look rate-limited."""
+        msg = "404 Client Error: Not Found for url: https://query2.finance.yahoo.com/v10/finance/quoteSummary/4293.T?crumb=x429"
+        err = RuntimeError(msg)
+        err.response = SimpleNamespace(status_code=404)
+        fetch, calls, sleeps = self._flaky(monkeypatch, [err])
+        with pytest.raises(RuntimeError):
+            fetch()
+        assert len(calls) == 1
+        assert sleeps == []
+
+    def test_404_message_without_response_not_retried(self, monkeypatch):
+        fetch, calls, _ = self._flaky(monkeypatch, [RuntimeError("404 Client Error: Not Found for url: .../4293.T")])
+        with pytest.raises(RuntimeError):
+            fetch()
+        assert len(calls) == 1
+
+    def test_retries_yf_rate_limit_error(self, monkeypatch):
+        from yfinance.exceptions import YFRateLimitError
+        fetch, calls, _ = self._flaky(monkeypatch, [YFRateLimitError()])
+        assert fetch() == "ok"
+        assert len(calls) == 2
+
+    def test_other_errors_not_retried(self, monkeypatch):
+        fetch, calls, sleeps = self._flaky(monkeypatch, [ValueError("bad symbol")])
+        with pytest.raises(ValueError):
+            fetch()
+        assert len(calls) == 1
+        assert sleeps == []
+
+    def test_gives_up_after_tries(self, monkeypatch):
+        fetch, calls, sleeps = self._flaky(monkeypatch, [TimeoutError("t")] * 4)
+        with pytest.raises(TimeoutError):
+            fetch()
+        assert len(calls) == 4
+        assert sleeps == [2.0, 4.0, 8.0]
+
+
+# ---------------------------------------------------------------------------
+# get_multiple_stocks
+# ---------------------------------------------------------------------------
+
+class TestGetMultipleStocks:
+    def test_sleeps_only_between_api_fetches(self, tmp_path, monkeypatch):
+        """Cached symbols skip the 1s delay; API fetches are still spaced."""
+        from src.data.yahoo_client import _rate_limit, detail
+
+        now, sleeps = [100.0], []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        monkeypatch.setattr(_rate_limit.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(_rate_limit.time, "sleep", fake_sleep)
         mock_ticker = MagicMock()
-        mock_ticker.history.return_value = pd.DataFrame()
+        mock_ticker.return_value.info = {"regularMarketPrice": 10.0, "shortName": "Fresh"}
+        monkeypatch.setattr(detail.yf, "Ticker", mock_ticker)
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            _write_cache("C1", {"symbol": "C1"})
+            _write_cache("C2", {"symbol": "C2"})
+            result = detail.get_multiple_stocks(["C1", "A1", "C2", "A2", "A3"])
 
-        import yfinance as yf
-        monkeypatch.setattr(yf, "Ticker", lambda symbol: mock_ticker)
+        assert list(result) == ["C1", "A1", "C2", "A2", "A3"]
+        assert result["C1"]["symbol"] == "C1" and "name" not in result["C1"]
+        assert result["A2"]["name"] == "Fresh"
+        assert mock_ticker.call_count == 3
+        assert sleeps == [pytest.approx(1, abs=0.05)] * 2
 
-        result = get_macro_indicators()
-        assert len(result) == len(MACRO_TICKERS)
-        for ind in result:
-            assert ind["price"] is None
-            assert ind["daily_change"] is None
-            assert ind["weekly_change"] is None
+
+class TestCacheWriteFailure:
+    """A locked SQLite cache must not turn a successful fetch into None."""
+
+    @staticmethod
+    def _locked(*args, **kwargs):
+        import sqlite3
+        raise sqlite3.OperationalError("database is locked")
+
+    def test_get_stock_info_survives_locked_cache(self, monkeypatch):
+        from src.data.yahoo_client import detail
+
+        monkeypatch.setattr(detail, "_write_cache", self._locked)
+        monkeypatch.setattr(detail, "_fetch_info", lambda s: {"regularMarketPrice": 10.0})
+        result = detail.get_stock_info("7203.T")
+        assert result is not None and result["price"] == 10.0
+
+    def test_get_stock_detail_survives_locked_cache(self, monkeypatch):
+        from src.data.yahoo_client import detail
+
+        monkeypatch.setattr(detail, "_write_detail_cache", self._locked)
+        monkeypatch.setattr(detail, "get_stock_info", lambda s: {"symbol": s, "price": 10.0})
+        monkeypatch.setattr(detail.yf, "Ticker", MagicMock())
+        result = detail.get_stock_detail("7203.T")
+        assert result is not None and result["price"] == 10.0
+
+
+class TestStockInfoMemoryCache:
+    def test_repeat_lookup_skips_disk(self, tmp_path, monkeypatch):
+        """A disk hit is promoted to memory; the next call does not re-read it."""
+        from src.data.yahoo_client import detail
+
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            _write_cache("7203.T", {"symbol": "7203.T", "price": 2850.0})
+            reads = []
+            real_read = detail._read_cache
+            monkeypatch.setattr(
+                detail, "_read_cache", lambda s: reads.append(s) or real_read(s),
+            )
+            first = detail.get_stock_info("7203.T")
+            second = detail.get_stock_info("7203.T")
+
+        assert first == second == {"symbol": "7203.T", "price": 2850.0}
+        assert reads == ["7203.T"]
@@ -105,3 +105,25 @@ class TestHhiBar:
 
     def test_custom_width(self):
         assert hhi_bar(0.5, width=4) == "[##..]"
+
+
+class TestSingleDefinition:
+    """Formatter modules alias the shared helpers instead of redefining them."""
+
+    def test_formatter_modules_use_shared_helpers(self):
+        import importlib
+        from src.output import _format_helpers
+
+        for mod_name in (
+            "formatter", "analyze_formatter", "research_formatter", "health_formatter",
+            "rebalance_formatter", "simulate_formatter", "portfolio_formatter",
+            "forecast_formatter",
+        ):
+            mod = importlib.import_module(f"src.output.{mod_name}")
+            for alias, shared in (
+                ("_fmt_pct", _format_helpers.fmt_pct),
+                ("_fmt_float", _format_helpers.fmt_float),
+                ("_fmt_pct_sign", _format_helpers.fmt_pct_sign),
+            ):
+                if hasattr(mod, alias):
+                    assert getattr(mod, alias) is shared, f"{mod_name}.{alias}"
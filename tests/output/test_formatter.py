@@ -17,6 +17,7 @@ from src.output.formatter import (
     format_shareholder_return_markdown,
     format_growth_markdown,
     format_alpha_markdown,
+    iter_alpha_markdown,
 )
 
 
@@ -228,6 +229,50 @@ class TestFormatPullbackMarkdown:
         assert "押し目条件に合致する銘柄が見つかりませんでした" in output
 
 
+# ---------------------------------------------------------------------------
+# format_alpha_markdown
+# ---------------------------------------------------------------------------
+
+class TestFormatAlphaMarkdown:
+    def test_empty_list_returns_not_found_message(self):
+        """Empty results list produces alpha-specific 'not found' message."""
+        assert format_alpha_markdown([]) == "アルファシグナル条件に合致する銘柄が見つかりませんでした。"
+
+    def test_row_cells(self):
+        row = {
+            "symbol": "7203.T", "name": "Toyota", "price": 2850.4, "per": 10.0, "pbr": None,
+            "value_score": 60.0, "change_score": 55.5, "total_score": 125.5,
+            "pullback_match": "partial",
+            "accruals_score": 20, "rev_accel_score": 15, "fcf_yield_score": 10, "roe_trend_score": 9.9,
+        }
+        lines = format_alpha_markdown([row]).splitlines()
+        assert lines[2] == (
+            "| 1 | 7203.T Toyota | 2850 | 10.00 | - | 60.00 | 55.50 | 125.50 | △ | ◎ | ○ | △ | × |"
+        )
+
+    def test_missing_scores_render_dash(self):
+        lines = format_alpha_markdown([{"symbol": "AAPL", "pullback_match": "none"}]).splitlines()
+        assert lines[2] == "| 1 | AAPL | - | - | - | - | - | - | - | - | - | - | - |"
+
+    @pytest.mark.parametrize("score,mark", [
+        (None, "-"), (0, "×"), (9.99, "×"), (10, "△"), (14.9, "△"),
+        (15, "○"), (19.9, "○"), (20, "◎"), (25, "◎"),
+    ])
+    def test_change_indicator_thresholds(self, score, mark):
+        from src.output.formatter import _change_indicator
+        assert _change_indicator(score) == mark
+
+    def test_iter_matches_joined_output(self):
+        rows = [
+            {"symbol": "7203.T", "total_score": 120.0, "_note_markers": "⚠️", "_note_summary": "決算注意"},
+            {"symbol": "AAPL"},
+        ]
+        lines = iter_alpha_markdown(rows)
+        assert next(lines).startswith("| 順位 |")
+        assert "\n".join(iter_alpha_markdown(rows)) == format_alpha_markdown(rows)
+        assert list(iter_alpha_markdown([])) == [format_alpha_markdown([])]
+
+
 # ---------------------------------------------------------------------------
 # format_shareholder_return_markdown — KIK-389 reason display
 # ---------------------------------------------------------------------------
@@ -62,6 +62,18 @@ class TestTryImport:
         assert len(imports) == 3
         assert all(v is not None for v in imports.values())
 
+    def test_submodule_names_are_imported(self):
+        """Names may be submodules not yet imported (e.g. init_graph's src.data)."""
+        ok, imports = try_import("xml", "dom")
+        assert ok is True
+        assert imports["dom"] is sys.modules["xml.dom"]
+
+    def test_partial_failure_keeps_resolved_names(self):
+        import os.path
+        ok, imports = try_import("os.path", "join", "nonexistent_function_xyz")
+        assert ok is False
+        assert imports == {"join": os.path.join, "nonexistent_function_xyz": None}
+
 
 class TestFormatUserError:
     """Tests for format_user_error() (KIK-443)."""
@@ -108,6 +120,14 @@ class TestFormatUserError:
         msg = format_user_error("yahoo_timeout", context="7203.T")
         assert "7203.T" in msg
 
+    def test_context_line_follows_title(self):
+        msg = format_user_error("yahoo_timeout", context="7203.T")
+        lines = msg.split("\n")
+        assert lines[0] == "⚠️  Yahoo Financeへの接続がタイムアウトしました"
+        assert lines[1] == "    対象: 7203.T"
+        assert lines[2].startswith("    原因: ")
+        assert "{CONTEXT}" not in format_user_error("yahoo_timeout")
+
     def test_unknown_error_type(self):
         msg = format_user_error("totally_unknown_error")
         assert "⚠️" in msg